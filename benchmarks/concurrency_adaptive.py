@@ -0,0 +1,84 @@
+"""
+Measure throughput of ``process_concurrently`` calling a simulated downstream
+service with fixed concurrency limits compared to ``AdaptiveConcurrency``.
+
+The fake service handles up to ``CAPACITY`` requests at the base latency, gets
+quadratically slower when overloaded and rejects requests above four times its
+capacity. Too low fixed limits leave its capacity unused while too high ones
+overload it, the adaptive limit settles around the capacity.
+
+Run with ``python benchmarks/concurrency_adaptive.py`` inside the project environment.
+"""
+
+import asyncio
+from logging import CRITICAL, getLogger
+from time import perf_counter
+
+from haiway import AdaptiveConcurrency, ctx, process_concurrently
+
+ELEMENTS: int = 5_000
+CAPACITY: int = 32
+LATENCY: float = 0.005
+OVERLOAD: float = 4.0
+
+
+class ServiceOverloaded(Exception):
+    pass
+
+
+class FakeService:
+    def __init__(self) -> None:
+        self.in_flight: int = 0
+        self.succeeded: int = 0
+        self.failed: int = 0
+
+    async def call(
+        self,
+        element: int,
+    ) -> None:
+        self.in_flight += 1
+        try:
+            load: float = self.in_flight / CAPACITY
+            if load > OVERLOAD:
+                self.failed += 1
+                raise ServiceOverloaded()
+
+            await asyncio.sleep(LATENCY * max(1.0, load) ** 2)
+            self.succeeded += 1
+
+        finally:
+            self.in_flight -= 1
+
+
+async def measure(
+    label: str,
+    concurrent_tasks: int | AdaptiveConcurrency,
+) -> float:
+    service: FakeService = FakeService()
+    start: float = perf_counter()
+    await process_concurrently(
+        range(ELEMENTS),
+        service.call,
+        concurrent_tasks=concurrent_tasks,
+        ignore_exceptions=True,
+    )
+    elapsed: float = perf_counter() - start
+
+    rate: float = service.succeeded / elapsed
+    print(f"{label:<12} {rate:10,.0f} succeeded/s {service.failed:>6} failed")
+    return rate
+
+
+async def main() -> None:
+    async with ctx.scope("benchmark"):
+        await measure("fixed 4", 4)
+        await measure("fixed 32", 32)
+        await measure("fixed 512", 512)
+        limit: AdaptiveConcurrency = AdaptiveConcurrency(maximum=512)
+        await measure("adaptive", limit)
+        print(f"adaptive limit settled at {limit.limit}")
+
+
+if __name__ == "__main__":
+    getLogger("benchmark").setLevel(CRITICAL)  # measure throughput, not error logging
+    asyncio.run(main())
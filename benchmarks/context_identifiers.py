@@ -0,0 +1,77 @@
+"""
+Measure the number of identifiers generated per second using ``uuid4`` compared
+to ``unique_id``, and the number of scopes entered per second when their
+identifiers and trace ids are actually requested.
+
+Run with ``python benchmarks/context_identifiers.py`` inside the project environment.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from logging import ERROR, getLogger
+from time import perf_counter
+from uuid import uuid4
+
+from haiway import ContextIdentifier, ctx, unique_id
+
+ITERATIONS: int = 100_000
+
+
+def measure_generator(
+    label: str,
+    generate: Callable[[], object],
+    *,
+    iterations: int = ITERATIONS,
+) -> float:
+    start: float = perf_counter()
+    for _ in range(iterations):
+        generate()
+
+    elapsed: float = perf_counter() - start
+    rate: float = iterations / elapsed
+    print(f"{label:<20} {rate:12,.0f} ids/s")
+    return rate
+
+
+async def root() -> None:
+    # each root scope starts a new trace
+    async with ctx.scope("benchmark"):
+        pass
+
+
+async def nested_named() -> None:
+    async with ctx.scope("nested"):
+        _ = ContextIdentifier.current().unique_name
+
+
+async def measure_scope(
+    label: str,
+    scope: Callable[[], Awaitable[None]],
+    *,
+    iterations: int = ITERATIONS,
+) -> float:
+    start: float = perf_counter()
+    for _ in range(iterations):
+        await scope()
+
+    elapsed: float = perf_counter() - start
+    rate: float = iterations / elapsed
+    print(f"{label:<20} {rate:12,.0f} scopes/s")
+    return rate
+
+
+async def nested_scopes() -> None:
+    async with ctx.scope("benchmark"):
+        await measure_scope("nested named", nested_named)
+
+
+async def main() -> None:
+    measure_generator("uuid4", uuid4)
+    measure_generator("unique_id", unique_id)
+    await measure_scope("root", root)
+    await nested_scopes()
+
+
+if __name__ == "__main__":
+    getLogger("benchmark").setLevel(ERROR)  # measure scopes, not debug logging
+    asyncio.run(main())
@@ -0,0 +1,100 @@
+"""
+Measure the number of context scopes entered per second for nested scopes using
+the lightweight path and for scopes requiring the full setup, both when prepared
+with ``ctx.scope`` and with a reusable ``ctx.scope_template`` providing the same
+common state.
+
+Run with ``python benchmarks/context_scope.py`` inside the project environment.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from logging import ERROR, getLogger
+from time import perf_counter
+
+from haiway import ContextScopeTemplate, State, ctx
+
+ITERATIONS: int = 100_000
+
+
+class Request(State):
+    path: str = "/"
+
+
+class Settings(State):
+    debug: bool = False
+
+
+class Tenant(State):
+    identifier: str = "tenant"
+
+
+class Features(State):
+    enabled: tuple[str, ...] = ()
+
+
+class Limits(State):
+    requests: int = 100
+
+
+COMMON: tuple[State, ...] = (Settings(), Tenant(), Features(), Limits())
+
+
+async def nested() -> None:
+    async with ctx.scope("nested"):
+        pass
+
+
+async def nested_state(state: Request = Request(path="/nested")) -> None:  # noqa: B008
+    async with ctx.scope("nested", *COMMON, state):
+        pass
+
+
+async def isolated() -> None:
+    async with ctx.scope("isolated", *COMMON, isolated=True):
+        pass
+
+
+NESTED_TEMPLATE: ContextScopeTemplate = ctx.scope_template("nested", *COMMON)
+ISOLATED_TEMPLATE: ContextScopeTemplate = ctx.scope_template("isolated", *COMMON, isolated=True)
+
+
+async def nested_template(state: Request = Request(path="/nested")) -> None:  # noqa: B008
+    async with NESTED_TEMPLATE(state):
+        pass
+
+
+async def isolated_template() -> None:
+    async with ISOLATED_TEMPLATE():
+        pass
+
+
+async def measure(
+    label: str,
+    scope: Callable[[], Awaitable[None]],
+    *,
+    iterations: int = ITERATIONS,
+) -> float:
+    async with ctx.scope("benchmark", Request()):
+        start: float = perf_counter()
+        for _ in range(iterations):
+            await scope()
+
+        elapsed: float = perf_counter() - start
+
+    rate: float = iterations / elapsed
+    print(f"{label:<20} {rate:12,.0f} scopes/s")
+    return rate
+
+
+async def main() -> None:
+    await measure("nested", nested)
+    await measure("nested with state", nested_state)
+    await measure("nested template", nested_template)
+    await measure("isolated", isolated)
+    await measure("isolated template", isolated_template)
+
+
+if __name__ == "__main__":
+    getLogger("benchmark").setLevel(ERROR)  # measure scopes, not debug logging
+    asyncio.run(main())
@@ -0,0 +1,87 @@
+"""
+Measure the number of context state updates per second depending on the amount
+of state already available in the current context and the number of repeated
+state lookups, including the subclass and statemethod access.
+
+Run with ``python benchmarks/context_state.py`` inside the project environment.
+"""
+
+from collections.abc import Callable
+from time import perf_counter
+
+from haiway import State, ctx, statemethod
+from haiway.context.state import ContextState
+
+ITERATIONS: int = 100_000
+
+
+class Request(State):
+    path: str = "/"
+
+    @statemethod
+    def describe(self) -> str:
+        return self.path
+
+
+class NestedRequest(Request):
+    path: str = "/nested"
+
+
+def filler(index: int) -> State:
+    # each call defines a distinct state type
+    class Filler(State):
+        value: int = index
+
+    return Filler()
+
+
+def measure(
+    depth: int,
+    *,
+    iterations: int = ITERATIONS,
+) -> float:
+    states: list[State] = [filler(index) for index in range(depth)]
+    request: Request = Request(path="/nested")
+    with ContextState.updating(states):
+        start: float = perf_counter()
+        for _ in range(iterations):
+            with ctx.updating(request):
+                pass
+
+        elapsed: float = perf_counter() - start
+
+    rate: float = iterations / elapsed
+    print(f"{depth:>5} states {rate:12,.0f} updates/s")
+    return rate
+
+
+def measure_lookup(
+    label: str,
+    lookup: Callable[[], object],
+    *,
+    iterations: int = ITERATIONS,
+) -> float:
+    states: list[State] = [filler(index) for index in range(100)]
+    with ContextState.updating((*states, NestedRequest())):
+        start: float = perf_counter()
+        for _ in range(iterations):
+            lookup()
+
+        elapsed: float = perf_counter() - start
+
+    rate: float = iterations / elapsed
+    print(f"{label:<18} {rate:12,.0f} lookups/s")
+    return rate
+
+
+def main() -> None:
+    for depth in (1, 10, 100, 1_000):
+        measure(depth)
+
+    measure_lookup("exact", lambda: ctx.state(NestedRequest))
+    measure_lookup("subclass", lambda: ctx.state(Request))
+    measure_lookup("statemethod", Request.describe)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+Stress the event bus with a bursty sender and slow subscribers using bounded
+subscriptions, reporting achieved send rate, consumer lag and dropped events.
+
+Run with ``python benchmarks/events_stress.py`` inside the project environment.
+"""
+
+import asyncio
+from time import perf_counter
+
+from haiway import EventsPolicy, EventsSubscription, State, ctx
+
+EVENTS: int = 200_000
+BURST: int = 1_000
+CAPACITY: int = 1_024
+
+
+class Tick(State):
+    value: int
+
+
+async def consume(
+    subscription: EventsSubscription[Tick],
+    *,
+    delay: float,
+) -> int:
+    received: int = 0
+    async for _ in subscription:
+        received += 1
+        if received % 100 == 0:
+            await asyncio.sleep(delay)  # slow subscriber
+
+    return received
+
+
+async def measure(policy: EventsPolicy) -> None:
+    async with ctx.scope("benchmark"):
+        subscriptions: list[EventsSubscription[Tick]] = [
+            ctx.subscribe(Tick, capacity=CAPACITY, policy=policy) for _ in range(4)
+        ]
+        consumers = [
+            ctx.spawn(consume, subscription, delay=0.001 * (index + 1))
+            for index, subscription in enumerate(subscriptions)
+        ]
+
+        start: float = perf_counter()
+        for index in range(EVENTS):
+            if policy == "block":
+                await ctx.deliver(Tick(value=index))
+
+            else:
+                ctx.send(Tick(value=index))
+
+            if index % BURST == 0:
+                await asyncio.sleep(0)  # let subscribers run between bursts
+
+        elapsed: float = perf_counter() - start
+        lag: int = max(subscription.lag for subscription in subscriptions)
+        dropped: int = sum(subscription.dropped for subscription in subscriptions)
+
+    received: int = sum([await consumer for consumer in consumers])
+    print(
+        f"{policy:<12} {EVENTS / elapsed:12,.0f} events/s"
+        f" max lag {lag:>6} dropped {dropped:>8} received {received:>8}"
+    )
+
+
+async def main() -> None:
+    for policy in ("drop_oldest", "drop_newest", "coalesce", "block"):
+        await measure(policy)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,54 @@
+"""
+Measure the rate of events sent from worker threads and delivered to a subscriber
+within the event loop owning the event bus.
+
+Run with ``python benchmarks/events_threads.py`` inside the project environment.
+"""
+
+import asyncio
+from time import perf_counter
+
+from haiway import State, ctx
+
+EVENTS: int = 100_000
+
+
+class Progress(State):
+    done: int
+
+
+def produce(
+    events: int,
+) -> None:
+    for index in range(events):
+        ctx.send(Progress(done=index))
+
+
+async def measure(threads: int) -> None:
+    async with ctx.scope("benchmark"):
+        subscription = ctx.subscribe(Progress)
+        events: int = EVENTS // threads
+
+        start: float = perf_counter()
+        producers = [
+            asyncio.create_task(asyncio.to_thread(produce, events)) for _ in range(threads)
+        ]
+        received: int = 0
+        async for _ in subscription:
+            received += 1
+            if received == events * threads:
+                break
+
+        elapsed: float = perf_counter() - start
+        await asyncio.gather(*producers)
+
+    print(f"{threads:>2} threads {received / elapsed:12,.0f} events/s")
+
+
+async def main() -> None:
+    for threads in (1, 2, 4):
+        await measure(threads)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,75 @@
+"""
+Measure throughput of merging many shard streams with ``merge_streams``
+compared to a balanced tree of nested two-way ``stream_concurrently`` calls.
+
+Each shard yields elements without waiting, so the measurement is dominated by
+the merging overhead.
+
+Run with ``python benchmarks/merge_streams.py`` inside the project environment.
+"""
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Sequence
+from time import perf_counter
+
+from haiway import ctx, merge_streams, stream_concurrently
+
+SHARDS: int = 32
+SHARD_ELEMENTS: int = 10_000
+
+
+async def shard(
+    count: int,
+) -> AsyncIterator[int]:
+    for element in range(count):
+        yield element
+
+
+def nested(
+    sources: Sequence[AsyncIterable[int]],
+) -> AsyncIterable[int]:
+    if len(sources) == 1:
+        return sources[0]
+
+    middle: int = len(sources) // 2
+    return stream_concurrently(
+        nested(sources[:middle]),
+        nested(sources[middle:]),
+        exhaustive=True,
+    )
+
+
+async def measure(
+    label: str,
+    stream: AsyncIterable[int],
+) -> None:
+    start: float = perf_counter()
+    count: int = 0
+    async for _ in stream:
+        count += 1
+
+    elapsed: float = perf_counter() - start
+    assert count == SHARDS * SHARD_ELEMENTS  # nosec: B101
+    print(f"{label:<30} {count / elapsed:12,.0f} elements/s")
+
+
+def shards() -> Sequence[AsyncIterable[int]]:
+    return tuple(shard(SHARD_ELEMENTS) for _ in range(SHARDS))
+
+
+async def main() -> None:
+    async with ctx.scope("benchmark"):
+        await measure("nested stream_concurrently", nested(shards()))
+        await measure("merge_streams first_ready", merge_streams(*shards(), exhaustive=True))
+        await measure(
+            "merge_streams round_robin",
+            merge_streams(*shards(), exhaustive=True, fairness="round_robin"),
+        )
+        await measure(
+            "merge_streams buffered",
+            merge_streams(*shards(), exhaustive=True, source_buffer=64),
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
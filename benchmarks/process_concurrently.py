@@ -0,0 +1,81 @@
+"""
+Measure scheduling overhead of ``process_concurrently`` with a handler doing no
+work, using both synchronous and asynchronous sources.
+
+``process_concurrently`` runs a fixed pool of workers pulling elements from the
+source, ``execute_concurrently`` is measured as a reference for spawning a
+separate task for each element. The reference processes fewer elements as its
+overhead grows with the number of concurrent tasks.
+
+Run with ``python benchmarks/process_concurrently.py`` inside the project environment.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable
+from time import perf_counter
+
+from haiway import ctx, execute_concurrently, process_concurrently
+
+ELEMENTS: int = 1_000_000
+REFERENCE_ELEMENTS: int = 100_000
+CONCURRENCY: tuple[int, ...] = (64, 1024)
+
+
+async def noop(
+    element: int,
+) -> None:
+    pass
+
+
+async def async_range(
+    count: int,
+) -> AsyncIterator[int]:
+    for element in range(count):
+        yield element
+
+
+async def measure(
+    label: str,
+    count: int,
+    run: Awaitable[object],
+) -> None:
+    start: float = perf_counter()
+    await run
+    elapsed: float = perf_counter() - start
+    print(f"{label:<34} {count / elapsed:12,.0f} elements/s")
+
+
+async def main() -> None:
+    async with ctx.scope("benchmark"):
+        for concurrent_tasks in CONCURRENCY:
+            await measure(
+                f"process sync source ({concurrent_tasks})",
+                ELEMENTS,
+                process_concurrently(
+                    range(ELEMENTS),
+                    noop,
+                    concurrent_tasks=concurrent_tasks,
+                ),
+            )
+            await measure(
+                f"process async source ({concurrent_tasks})",
+                ELEMENTS,
+                process_concurrently(
+                    async_range(ELEMENTS),
+                    noop,
+                    concurrent_tasks=concurrent_tasks,
+                ),
+            )
+            await measure(
+                f"task per element ({concurrent_tasks})",
+                REFERENCE_ELEMENTS,
+                execute_concurrently(
+                    noop,
+                    range(REFERENCE_ELEMENTS),
+                    concurrent_tasks=concurrent_tasks,
+                ),
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
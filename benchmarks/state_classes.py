@@ -0,0 +1,80 @@
+"""
+Measure creation of many State classes, as happens when importing large domain packages,
+with and without the annotation resolution cache and with deferred resolution.
+
+Run with ``python benchmarks/state_classes.py`` inside the project environment.
+"""
+
+from collections.abc import Mapping, Sequence
+from datetime import datetime
+from time import perf_counter
+from typing import Any, Literal
+from uuid import UUID
+
+from haiway import State
+from haiway.attributes import annotations
+
+CLASSES: int = 1_500
+
+ANNOTATIONS: Mapping[str, Any] = {
+    "identifier": UUID,
+    "name": str,
+    "count": int,
+    "ratio": float | None,
+    "created": datetime,
+    "kind": Literal["first", "second"],
+    "tags": Sequence[str],
+    "attributes": Mapping[str, str | int],
+}
+
+
+def create_class(
+    idx: int,
+    *,
+    deferred: bool,
+    cached: bool,
+) -> type[State]:
+    if not cached:  # resolve every annotation again as without the cache
+        annotations._resolution_cache.clear()  # pyright: ignore[reportPrivateUsage]
+
+    return type(State)(
+        f"Generated{idx}",
+        (State,),
+        {
+            "__module__": __name__,
+            "__annotations__": dict(ANNOTATIONS),
+        },
+        deferred=deferred,
+    )
+
+
+def measure(
+    label: str,
+    *,
+    deferred: bool = False,
+    cached: bool = True,
+    resolve: bool = False,
+) -> float:
+    start: float = perf_counter()
+    for idx in range(CLASSES):
+        cls: type[State] = create_class(
+            idx,
+            deferred=deferred,
+            cached=cached,
+        )
+        if resolve:
+            _ = cls.__FIELDS__  # resolve as the first instantiation would
+
+    elapsed: float = perf_counter() - start
+    print(f"{label:<32} {elapsed * 1_000:8.1f} ms for {CLASSES} classes")
+    return elapsed
+
+
+if __name__ == "__main__":
+    cold_time: float = measure("eager, cold cache", cached=False)
+    warm_time: float = measure("eager, warm cache")
+    print(f"cache speedup: {cold_time / warm_time:.2f}x")
+
+    deferred_time: float = measure("deferred, definition only", deferred=True)
+    print(f"deferred definition speedup: {warm_time / deferred_time:.2f}x")
+    measure("deferred, resolved on first use", deferred=True, resolve=True)
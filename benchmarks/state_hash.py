@@ -0,0 +1,112 @@
+"""
+Compare hashing and equality of nested State instances with and without cached hashes.
+
+Run with ``python benchmarks/state_hash.py`` inside the project environment.
+"""
+
+from collections.abc import Sequence
+from functools import cache
+from timeit import repeat
+from typing import Any
+
+from haiway import State
+
+
+class Leaf(State):
+    key: str
+    values: Sequence[int]
+
+
+class Branch(State):
+    name: str
+    leaves: Sequence[Leaf]
+
+
+class Tree(State):
+    label: str
+    branches: Sequence[Branch]
+
+
+def make_tree() -> Tree:
+    return Tree(
+        label="tree",
+        branches=[
+            Branch(
+                name=f"branch-{branch}",
+                leaves=[Leaf(key=f"leaf-{leaf}", values=range(16)) for leaf in range(8)],
+            )
+            for branch in range(8)
+        ],
+    )
+
+
+TREE: Tree = make_tree()
+EQUAL_TREE: Tree = make_tree()
+SHARED_TREE: Tree = TREE.updating(label="updated")
+INDEX: dict[Tree, int] = {TREE: 0}
+
+
+def uncached_hash() -> None:
+    # bypass the cache and hash all fields of every nested instance
+    for branch in TREE.branches:
+        for leaf in branch.leaves:
+            object.__delattr__(leaf, "__hash_cache__")
+
+        object.__delattr__(branch, "__hash_cache__")
+
+    object.__delattr__(TREE, "__hash_cache__")
+    hash(TREE)
+
+
+def cached_hash() -> None:
+    hash(TREE)
+
+
+def lookup() -> None:
+    INDEX.get(TREE)
+
+
+@cache
+def cached_call(tree: Tree) -> str:
+    return tree.label
+
+
+def cache_decorated() -> None:
+    cached_call(TREE)
+
+
+def equal_identity() -> None:
+    assert TREE == TREE  # noqa: PLR0124
+
+
+def equal_structure() -> None:
+    assert TREE == EQUAL_TREE
+
+
+def equal_shared() -> None:
+    assert TREE != SHARED_TREE
+
+
+def measure(
+    label: str,
+    function: Any,
+    *,
+    number: int = 10_000,
+) -> float:
+    best: float = min(repeat(function, number=number, repeat=5))
+    print(f"{label:<20} {best / number * 1_000_000:8.3f} us/op")
+    return best
+
+
+if __name__ == "__main__":
+    hash(TREE)
+    hash(EQUAL_TREE)
+    uncached_time: float = measure("uncached hash", uncached_hash)
+    cached_time: float = measure("cached hash", cached_hash)
+    print(f"hash speedup: {uncached_time / cached_time:.2f}x")
+
+    measure("dict lookup", lookup)
+    measure("@cache call", cache_decorated)
+    measure("eq identity", equal_identity)
+    measure("eq structural", equal_structure)
+    measure("eq shared nested", equal_shared)
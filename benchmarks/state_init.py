@@ -0,0 +1,98 @@
+"""
+Compare State construction using compiled initializers with the generic field loop
+and with trusted construction skipping validation.
+
+Run with ``python benchmarks/state_init.py`` inside the project environment.
+"""
+
+from collections.abc import Mapping, Sequence
+from timeit import repeat
+from typing import Any
+from uuid import UUID, uuid4
+
+from haiway import State
+
+
+class Nested(State):
+    key: str
+    value: int
+
+
+class Payload(State):
+    identifier: UUID
+    name: str
+    count: int
+    ratio: float
+    active: bool
+    note: str | None = None
+    tags: Sequence[str] = ()
+    nested: Nested | None = None
+
+
+PAYLOAD: dict[str, Any] = {
+    "identifier": uuid4(),
+    "name": "payload",
+    "count": 42,
+    "ratio": 0.5,
+    "active": True,
+    "note": None,
+    "tags": ("a", "b"),
+    "nested": Nested(key="key", value=1),
+}
+
+
+def compiled() -> None:
+    Payload(**PAYLOAD)
+
+
+def generic() -> None:
+    # bypass the compiled initializer and run the generic per-field loop
+    State.__init__(object.__new__(Payload), **PAYLOAD)
+
+
+def trusted() -> None:
+    Payload.trusted(**PAYLOAD)
+
+
+def trusted_mapping(mapping: Mapping[str, Any] = Payload(**PAYLOAD).to_mapping()) -> None:
+    Payload.trusted(**mapping)
+
+
+def validated_mapping(mapping: Mapping[str, Any] = Payload(**PAYLOAD).to_mapping()) -> None:
+    Payload(**mapping)
+
+
+def compiled_replace(instance: Payload = Payload(**PAYLOAD)) -> None:  # noqa: B008
+    instance.updating(count=7, name="updated")
+
+
+def generic_replace(instance: Payload = Payload(**PAYLOAD)) -> None:  # noqa: B008
+    State.__replace__(instance, count=7, name="updated")
+
+
+def measure(
+    label: str,
+    function: Any,
+    *,
+    number: int = 100_000,
+) -> float:
+    best: float = min(repeat(function, number=number, repeat=5))
+    print(f"{label:<20} {best / number * 1_000_000:8.3f} us/op")
+    return best
+
+
+if __name__ == "__main__":
+    generic_time: float = measure("generic __init__", generic)
+    compiled_time: float = measure("compiled __init__", compiled)
+    print(f"__init__ speedup: {generic_time / compiled_time:.2f}x")
+
+    trusted_time: float = measure("trusted", trusted)
+    print(f"trusted speedup: {compiled_time / trusted_time:.2f}x")
+
+    compiled_time = measure("validated mapping", validated_mapping)
+    trusted_time = measure("trusted mapping", trusted_mapping)
+    print(f"trusted mapping speedup: {compiled_time / trusted_time:.2f}x")
+
+    generic_time = measure("generic __replace__", generic_replace)
+    compiled_time = measure("compiled __replace__", compiled_replace)
+    print(f"__replace__ speedup: {generic_time / compiled_time:.2f}x")
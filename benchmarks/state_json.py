@@ -0,0 +1,95 @@
+"""
+Compare State JSON encoding without an intermediate mapping and decoding using the detected
+backend with the mapping based standard library path.
+
+Run with ``python benchmarks/state_json.py`` inside the project environment, install
+``msgspec`` to measure the fast decoder.
+"""
+
+import json
+from collections.abc import Sequence
+from datetime import UTC, datetime
+from timeit import repeat
+from typing import Any
+from uuid import UUID, uuid4
+
+from haiway import State
+from haiway.attributes import AttributesJSONEncoder
+from haiway.types.coding import JSON_BACKEND
+
+
+class StandardEncoder(AttributesJSONEncoder):
+    pass  # different encoder class forces the mapping based stdlib path
+
+
+class StandardDecoder(json.JSONDecoder):
+    pass  # different decoder class forces the stdlib path
+
+
+class Item(State):
+    identifier: UUID
+    created: datetime
+    name: str
+    quantity: int
+    price: float
+
+
+class Order(State):
+    identifier: UUID
+    customer: str
+    items: Sequence[Item]
+
+
+ORDER: Order = Order(
+    identifier=uuid4(),
+    customer="customer",
+    items=[
+        Item(
+            identifier=uuid4(),
+            created=datetime.now(UTC),
+            name=f"item-{idx}",
+            quantity=idx,
+            price=idx * 1.5,
+        )
+        for idx in range(32)
+    ],
+)
+ENCODED: str = ORDER.to_json()
+
+
+def encode_direct() -> None:
+    ORDER.to_json()
+
+
+def encode_standard() -> None:
+    ORDER.to_json(encoder_class=StandardEncoder)
+
+
+def decode_detected() -> None:
+    Order.from_json(ENCODED)
+
+
+def decode_standard() -> None:
+    Order.from_json(ENCODED, decoder=StandardDecoder)
+
+
+def measure(
+    label: str,
+    function: Any,
+    *,
+    number: int = 2_000,
+) -> float:
+    best: float = min(repeat(function, number=number, repeat=5))
+    print(f"{label:<20} {best / number * 1_000_000:8.3f} us/op")
+    return best
+
+
+if __name__ == "__main__":
+    print(f"backend: {JSON_BACKEND}")
+    standard_time: float = measure("encode mapping", encode_standard)
+    direct_time: float = measure("encode direct", encode_direct)
+    print(f"encode speedup: {standard_time / direct_time:.2f}x")
+
+    standard_time = measure("decode stdlib", decode_standard)
+    detected_time: float = measure(f"decode {JSON_BACKEND}", decode_detected)
+    print(f"decode speedup: {standard_time / detected_time:.2f}x")
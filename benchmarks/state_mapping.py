@@ -0,0 +1,75 @@
+"""
+Compare State conversion to mappings using compiled serializers with runtime type probing.
+
+Run with ``python benchmarks/state_mapping.py`` inside the project environment.
+"""
+
+from collections.abc import Mapping, Sequence
+from datetime import UTC, datetime
+from timeit import repeat
+from typing import Any
+from uuid import UUID, uuid4
+
+from haiway import State
+from haiway.attributes.state import _recursive_mapping  # pyright: ignore[reportPrivateUsage]
+
+
+class Item(State):
+    identifier: UUID
+    created: datetime
+    name: str
+    quantity: int
+    tags: Sequence[str]
+
+
+class Order(State):
+    identifier: UUID
+    customer: str
+    items: Sequence[Item]
+    attributes: Mapping[str, str]
+
+
+ORDER: Order = Order(
+    identifier=uuid4(),
+    customer="customer",
+    items=[
+        Item(
+            identifier=uuid4(),
+            created=datetime.now(UTC),
+            name=f"item-{idx}",
+            quantity=idx,
+            tags=("a", "b"),
+        )
+        for idx in range(32)
+    ],
+    attributes={"source": "benchmark"},
+)
+
+
+def probing() -> None:
+    # runtime type probing of top level values, nested States use their own serializers
+    {
+        field.alias or field.name: _recursive_mapping(getattr(ORDER, field.name))
+        for field in Order.__FIELDS__
+    }
+
+
+def compiled() -> None:
+    ORDER.to_mapping()
+
+
+def measure(
+    label: str,
+    function: Any,
+    *,
+    number: int = 5_000,
+) -> float:
+    best: float = min(repeat(function, number=number, repeat=5))
+    print(f"{label:<20} {best / number * 1_000_000:8.3f} us/op")
+    return best
+
+
+if __name__ == "__main__":
+    probing_time: float = measure("runtime probing", probing)
+    compiled_time: float = measure("compiled", compiled)
+    print(f"to_mapping speedup: {probing_time / compiled_time:.2f}x")
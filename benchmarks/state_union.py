@@ -0,0 +1,76 @@
+"""
+Compare union validation using type and discriminator dispatch with trying
+every alternative in order.
+
+Run with ``python benchmarks/state_union.py`` inside the project environment.
+"""
+
+from timeit import repeat
+from typing import Any, Literal
+
+from haiway import State
+
+
+class Created(State):
+    kind: Literal["created"]
+    identifier: str
+
+
+class Updated(State):
+    kind: Literal["updated"]
+    identifier: str
+    revision: int
+
+
+class Deleted(State):
+    kind: Literal["deleted"]
+    identifier: str
+    reason: str | None = None
+
+
+class Archived(State):
+    kind: Literal["archived"]
+    identifier: str
+    location: str
+
+
+class Envelope(State):
+    event: Created | Updated | Deleted | Archived
+
+
+EVENT: dict[str, Any] = {"kind": "archived", "identifier": "id", "location": "cold"}
+INSTANCE: Archived = Archived(**EVENT)
+UNION: Any = next(field for field in Envelope.__FIELDS__ if field.name == "event").annotation
+
+
+def sequential(value: Any) -> Any:
+    # the behavior without dispatch - each alternative is tried until one succeeds
+    for alternative in UNION.alternatives:
+        try:
+            return alternative.validate(value)
+
+        except Exception:
+            continue
+
+    raise ValueError("No matching alternative")
+
+
+def measure(
+    label: str,
+    function: Any,
+    *,
+    number: int = 100_000,
+) -> float:
+    best: float = min(repeat(function, number=number, repeat=5))
+    print(f"{label:<24} {best / number * 1_000_000:8.3f} us/op")
+    return best
+
+
+if __name__ == "__main__":
+    sequential_time: float = measure("sequential mapping", lambda: sequential(EVENT))
+    dispatch_time: float = measure("dispatched mapping", lambda: UNION.validate(EVENT))
+    print(f"mapping speedup: {sequential_time / dispatch_time:.2f}x")
+
+    sequential_time = measure("sequential instance", lambda: sequential(INSTANCE))
+    dispatch_time = measure("dispatched instance", lambda: UNION.validate(INSTANCE))
+    print(f"instance speedup: {sequential_time / dispatch_time:.2f}x")
@@ -18,18 +18,23 @@ from haiway.context import (
     ContextMissing,
     ContextObservability,
     ContextPresets,
+    ContextScopeTemplate,
     ContextState,
     ContextStateMissing,
     Disposable,
+    DisposableRequiring,
     Disposables,
     DisposableState,
+    EventsPolicy,
     EventsSubscription,
     Observability,
     ObservabilityAttribute,
     ObservabilityLevel,
     ctx,
+    unique_id,
 )
 from haiway.helpers import (
+    AdaptiveConcurrency,
     Configuration,
     ConfigurationInvalid,
     ConfigurationMissing,
@@ -53,7 +58,11 @@ from haiway.helpers import (
     cache,
     cache_externally,
     concurrently,
+    execute_batches_concurrently,
     execute_concurrently,
+    execute_concurrently_streaming,
+    merge_streams,
+    process_batches_concurrently,
     process_concurrently,
     retry,
     statemethod,
@@ -107,6 +116,7 @@ from haiway.utils import (
 
 __all__ = (
     "MISSING",
+    "AdaptiveConcurrency",
     "Alias",
     "AsyncQueue",
     "AsyncStream",
@@ -125,6 +135,7 @@ __all__ = (
     "ContextMissing",
     "ContextObservability",
     "ContextPresets",
+    "ContextScopeTemplate",
     "ContextState",
     "ContextStateMissing",
     "Default",
@@ -132,8 +143,10 @@ __all__ = (
     "Description",
     "Directory",
     "Disposable",
+    "DisposableRequiring",
     "DisposableState",
     "Disposables",
+    "EventsPolicy",
     "EventsSubscription",
     "File",
     "FileException",
@@ -183,7 +196,9 @@ __all__ = (
     "cache_externally",
     "concurrently",
     "ctx",
+    "execute_batches_concurrently",
     "execute_concurrently",
+    "execute_concurrently_streaming",
     "getenv",
     "getenv_base64",
     "getenv_bool",
@@ -192,7 +207,9 @@ __all__ = (
     "getenv_str",
     "is_missing",
     "load_env",
+    "merge_streams",
     "not_missing",
+    "process_batches_concurrently",
     "process_concurrently",
     "retry",
     "setup_logging",
@@ -200,6 +217,7 @@ __all__ = (
     "stream_concurrently",
     "throttle",
     "timeout",
+    "unique_id",
     "unwrap_missing",
     "without_missing",
 )
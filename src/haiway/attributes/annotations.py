@@ -10,12 +10,13 @@ import typing
 import uuid
 from collections import abc as collections_abc
 from collections.abc import (
-    Generator,
+    Callable,
     Hashable,
     Iterable,
     Mapping,
     MutableMapping,
     MutableSequence,
+    MutableSet,
     Sequence,
     Set,
 )
@@ -29,6 +30,7 @@ from typing import (
     Protocol,
     TypeVar,
     cast,
+    final,
     get_args,
     get_origin,
     get_type_hints,
@@ -41,7 +43,7 @@ from typing_extensions import is_typeddict as is_typeddict_ext  # keep this part
 from haiway import types as haiway_types
 from haiway.attributes.validation import (
     Validating,
-    ValidationContext,
+    ValidationError,
     Validator,
     Verifier,
     Verifying,
@@ -89,6 +91,8 @@ __all__ = (
     "UUIDAttribute",
     "UnionAttribute",
     "ValidableAttribute",
+    "passthrough_types",
+    "register_object_validator",
     "resolve_attribute",
     "resolve_self_attribute",
 )
@@ -1716,12 +1720,19 @@ class TupleAttribute(Immutable):
                     f"'{value}' does not match expected tuple length {len(self.values)}"
                 )
 
-            def validated() -> Generator[Any]:
-                for idx, element in enumerate(value):  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
-                    with ValidationContext.scope(f"[{idx}]"):
-                        yield self.values[idx].validate(element)
+            validated: list[Any] = []
+            for idx, element in enumerate(value):  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
+                try:
+                    validated.append(self.values[idx].validate(element))
+
+                except ValidationError as exc:
+                    exc.prepend(f"[{idx}]")
+                    raise
+
+                except Exception as exc:
+                    raise ValidationError(path=(f"[{idx}]",), cause=exc) from exc
 
-            return self.verifying(tuple(validated()))
+            return self.verifying(tuple(validated))
 
         else:
             raise TypeError(f"'{value}' is not matching expected type of 'tuple'")
@@ -1822,13 +1833,19 @@ class SequenceAttribute(Immutable):
             raise TypeError(f"'{value}' is not matching expected type of 'Sequence'")
 
         if isinstance(value, Sequence):
+            validated: list[Any] = []
+            for idx, element in enumerate(value):  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
+                try:
+                    validated.append(self.values.validate(element))
+
+                except ValidationError as exc:
+                    exc.prepend(f"[{idx}]")
+                    raise
 
-            def validated() -> Generator[Any]:
-                for idx, element in enumerate(value):  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
-                    with ValidationContext.scope(f"[{idx}]"):
-                        yield self.values.validate(element)
+                except Exception as exc:
+                    raise ValidationError(path=(f"[{idx}]",), cause=exc) from exc
 
-            return self.verifying(tuple(validated()))
+            return self.verifying(tuple(validated))
 
         else:
             raise TypeError(f"'{value}' is not matching expected type of 'Sequence'")
@@ -1928,13 +1945,19 @@ class SetAttribute(Immutable):
             raise TypeError(f"'{value}' is not matching expected type of 'Set'")
 
         if isinstance(value, Iterable):
+            validated: list[Any] = []
+            for idx, element in enumerate(value):  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
+                try:
+                    validated.append(self.values.validate(element))
 
-            def validated() -> Generator[Any]:
-                for idx, element in enumerate(value):  # pyright: ignore[reportUnknownVariableType, reportUnknownArgumentType]
-                    with ValidationContext.scope(f"[{idx}]"):
-                        yield self.values.validate(element)
+                except ValidationError as exc:
+                    exc.prepend(f"[{idx}]")
+                    raise
 
-            return self.verifying(frozenset(validated()))
+                except Exception as exc:
+                    raise ValidationError(path=(f"[{idx}]",), cause=exc) from exc
+
+            return self.verifying(frozenset(validated))
 
         else:
             raise TypeError(f"'{value}' is not matching expected type of 'Set'")
@@ -2031,13 +2054,19 @@ class MappingAttribute(Immutable):
         value: Any,
     ) -> Any:
         if isinstance(value, collections_abc.Mapping | typing.Mapping | typing_extensions.Mapping):
+            validated: dict[Any, Any] = {}
+            for key, element in value.items():  # pyright: ignore[reportUnknownVariableType]
+                try:
+                    validated[self.keys.validate(key)] = self.values.validate(element)
+
+                except ValidationError as exc:
+                    exc.prepend(f"[{key}]")
+                    raise
 
-            def validated() -> Generator[Any]:
-                for key, element in value.items():  # pyright: ignore[reportUnknownVariableType]
-                    with ValidationContext.scope(f"[{key}]"):
-                        yield (self.keys.validate(key), self.values.validate(element))
+                except Exception as exc:
+                    raise ValidationError(path=(f"[{key}]",), cause=exc) from exc
 
-            return self.verifying(Map(validated()))
+            return self.verifying(Map(validated))
 
         else:
             raise TypeError(f"'{value}' is not matching expected type of 'Mapping'")
@@ -2399,17 +2428,23 @@ class TypedDictAttribute(Immutable):
         value: Any,
     ) -> Any:
         if isinstance(value, collections_abc.Mapping | typing.Mapping | typing_extensions.Mapping):
+            validated: dict[str, Any] = {}
+            for key, attribute in self.attributes.items():
+                try:
+                    if key in value:
+                        validated[key] = attribute.validate(value[key])
+
+                    elif attribute.required:
+                        raise KeyError(f"Value for '{key}' is required")
 
-            def validated() -> Generator[Any]:
-                for key, attribute in self.attributes.items():
-                    with ValidationContext.scope(f'["{key}"]'):
-                        if key in value:
-                            yield (key, attribute.validate(value[key]))
+                except ValidationError as exc:
+                    exc.prepend(f'["{key}"]')
+                    raise
 
-                        elif attribute.required:
-                            raise KeyError(f"Value for '{key}' is required")
+                except Exception as exc:
+                    raise ValidationError(path=(f'["{key}"]',), cause=exc) from exc
 
-            return self.verifying(Map(validated()))
+            return self.verifying(Map(validated))
 
         else:
             raise TypeError(f"'{value}' is not matching expected type of '{self.base}'")
@@ -2625,6 +2660,8 @@ class UnionAttribute(Immutable):
     required: bool = True
     specification: TypeSpecification | None = None
     meta: Meta = Meta.empty
+    # dunder name keeps the lazily prepared dispatch out of the declared attributes
+    __union_dispatch__: _UnionDispatch | None = None
 
     @property
     def type_name(self) -> str:
@@ -2700,6 +2737,30 @@ class UnionAttribute(Immutable):
         self,
         value: Any,
     ) -> Any:
+        dispatch: _UnionDispatch | None = self.__union_dispatch__
+        if dispatch is None:  # prepared lazily when all alternatives are resolved
+            dispatch = _UnionDispatch(self.alternatives)
+            object.__setattr__(self, "__union_dispatch__", dispatch)
+
+        if dispatch.passthrough is None or value.__class__ in dispatch.passthrough:
+            return self.verifying(value)
+
+        tagged: AttributeAnnotation | None = dispatch.tagged(value)
+        if tagged is not None:
+            try:
+                return self.verifying(tagged.validate(value))
+
+            except Exception:
+                pass  # report failure with errors of all alternatives below
+
+        else:
+            for alternative in dispatch.candidates(value.__class__):
+                try:
+                    return self.verifying(alternative.validate(value))
+
+                except Exception:
+                    continue  # try next alternative
+
         errors: MutableSequence[Exception] = []
         for alternative in self.alternatives:
             try:
@@ -2721,6 +2782,210 @@ class UnionAttribute(Immutable):
         return any(alternative.check(value) for alternative in self.alternatives)
 
 
+@final
+class _UnionDispatch:
+    # precomputed selection of union alternatives avoiding exceptions on the hot path
+    __slots__ = (
+        "_alternatives",
+        "_candidates",
+        "_discriminator",
+        "_tags",
+        "passthrough",
+    )
+
+    def __init__(
+        self,
+        alternatives: Sequence[AttributeAnnotation],
+    ) -> None:
+        self._alternatives: Sequence[AttributeAnnotation] = alternatives
+        self._candidates: MutableMapping[type[Any], Sequence[AttributeAnnotation]] = {}
+        self.passthrough: Set[type[Any]] | None = _union_passthrough_types(
+            alternatives,
+            validators=_object_validators,
+        )
+        self._discriminator: tuple[str, ...]
+        self._tags: Mapping[Any, AttributeAnnotation]
+        self._discriminator, self._tags = _union_discriminator(alternatives)
+
+    def candidates(
+        self,
+        value_type: type[Any],
+        /,
+    ) -> Sequence[AttributeAnnotation]:
+        try:
+            return self._candidates[value_type]
+
+        except KeyError:
+            candidates: Sequence[AttributeAnnotation] = tuple(
+                alternative
+                for alternative in self._alternatives
+                if not _rejects_type(alternative, value_type)
+            )
+            self._candidates[value_type] = candidates
+            return candidates
+
+    def tagged(
+        self,
+        value: Any,
+        /,
+    ) -> AttributeAnnotation | None:
+        if not self._tags or not isinstance(value, collections_abc.Mapping):
+            return None
+
+        for key in self._discriminator:
+            tag: Any = value.get(key, MISSING)  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+            if tag is MISSING:
+                continue
+
+            try:
+                return self._tags.get(tag)
+
+            except TypeError:
+                return None  # unhashable values can't be tags
+
+        return None
+
+
+_object_validators: Final[MutableSet[Any]] = set()
+
+
+def register_object_validator(
+    validator: Callable[..., Any],
+    /,
+) -> None:
+    """
+    Register a function validating values of its class in a predictable way.
+
+    Registered functions have to accept only instances of the class, returned
+    unchanged, or mappings of its attributes, raising for any other value. It
+    allows skipping validation of such alternatives in unions when the value
+    can't be accepted and selecting them directly using discriminator fields.
+
+    Parameters
+    ----------
+    validator : Callable[..., Any]
+        Function underlying the ``validate`` classmethod of the class.
+    """
+    _object_validators.add(validator)
+
+
+def _object_alternative(
+    attribute: AttributeAnnotation,
+    /,
+) -> ObjectAttribute | None:
+    if (
+        isinstance(attribute, ValidableAttribute)
+        and getattr(attribute.validating, "__func__", None) in _object_validators
+        and isinstance(attribute.attribute, ObjectAttribute)
+    ):
+        return attribute.attribute
+
+    return None
+
+
+def _union_discriminator(
+    alternatives: Sequence[AttributeAnnotation],
+    /,
+) -> tuple[tuple[str, ...], Mapping[Any, AttributeAnnotation]]:
+    # discriminator is a literal field shared by all alternatives accepting mappings
+    objects: MutableSequence[tuple[AttributeAnnotation, ObjectAttribute]] = []
+    for alternative in alternatives:
+        if isinstance(alternative, NoneAttribute | MissingAttribute):
+            continue  # mappings are always rejected
+
+        object_attribute: ObjectAttribute | None = _object_alternative(alternative)
+        if object_attribute is None:
+            return ((), {})  # alternative could accept any mapping
+
+        objects.append((alternative, object_attribute))
+
+    if len(objects) < 2:  # noqa: PLR2004
+        return ((), {})  # nothing to select from
+
+    for name, field in objects[0][1].attributes.items():
+        if not isinstance(field, LiteralAttribute):
+            continue
+
+        tags: Mapping[Any, AttributeAnnotation] | None = _literal_tags(
+            objects,
+            name=name,
+            alias=field.alias,
+        )
+        if tags is not None:
+            keys: tuple[str, ...] = (field.alias, name) if field.alias else (name,)
+            return (keys, tags)
+
+    return ((), {})
+
+
+def _literal_tags(
+    objects: Sequence[tuple[AttributeAnnotation, ObjectAttribute]],
+    /,
+    *,
+    name: str,
+    alias: str | None,
+) -> Mapping[Any, AttributeAnnotation] | None:
+    tags: dict[Any, AttributeAnnotation] = {}
+    for alternative, object_attribute in objects:
+        field: AttributeAnnotation | None = object_attribute.attributes.get(name)
+        if not isinstance(field, LiteralAttribute) or field.alias != alias:
+            return None
+
+        for tag in field.values:
+            if tag in tags:
+                return None  # ambiguous tags can't select a single alternative
+
+            tags[tag] = alternative
+
+    return tags
+
+
+def _rejects_type(  # noqa: PLR0911
+    attribute: AttributeAnnotation,
+    value_type: type[Any],
+    /,
+) -> bool:
+    # True only when validation fails for any value of the type, before verification
+    match attribute:
+        case NoneAttribute():
+            return value_type is not types.NoneType
+
+        case MissingAttribute():
+            return not issubclass(value_type, haiway_types.Missing)
+
+        case StringAttribute():
+            return not issubclass(value_type, str)
+
+        case IntegerAttribute() | FloatAttribute():
+            return issubclass(value_type, bool) or not issubclass(value_type, int | float)
+
+        case BoolAttribute():
+            return not issubclass(value_type, int | str)
+
+        case UUIDAttribute():
+            return not issubclass(value_type, uuid.UUID | str)
+
+        case ObjectAttribute() if isinstance(attribute.base, type):
+            return not issubclass(value_type, attribute.base) and not issubclass(
+                value_type, collections_abc.Mapping
+            )
+
+        case ValidableAttribute():
+            object_attribute: ObjectAttribute | None = _object_alternative(attribute)
+            if object_attribute is None:
+                return False  # custom validation could accept anything
+
+            owner: Any = getattr(attribute.validating, "__self__", None)
+            return (
+                isinstance(owner, type)
+                and not issubclass(value_type, owner)
+                and not issubclass(value_type, collections_abc.Mapping)
+            )
+
+        case _:
+            return False
+
+
 class CustomAttribute(Immutable):
     base: Any
     parameters: Sequence[AttributeAnnotation] = ()
@@ -3046,11 +3311,168 @@ class IntEnumAttribute(Immutable):
         return isinstance(value, self.base)
 
 
+_NO_PASSTHROUGH: Final[Set[type[Any]]] = frozenset()
+
+
+def passthrough_types(  # noqa: C901, PLR0911, PLR0912
+    attribute: AttributeAnnotation,
+    /,
+    *,
+    validators: Set[Any] = frozenset(),
+) -> Set[type[Any]] | None:
+    """
+    Resolve exact types which are returned unchanged by the attribute validation.
+
+    Values whose ``__class__`` is one of the returned types can skip validation
+    entirely as the result would be the same object anyway.
+
+    Parameters
+    ----------
+    attribute : AttributeAnnotation
+        Attribute to analyze.
+    validators : Set[Any], default=frozenset()
+        Functions used by ``ValidableAttribute`` which are known to return
+        instances of the wrapped attribute base unchanged.
+
+    Returns
+    -------
+    Set[type[Any]] | None
+        Exact types passing validation unchanged, ``None`` when every value passes
+        unchanged, empty set when validation can't be skipped.
+    """
+    if isinstance(attribute, ValidableAttribute):
+        if getattr(attribute.validating, "__func__", attribute.validating) in validators:
+            return passthrough_types(
+                attribute.attribute,
+                validators=validators,
+            )
+
+        return _NO_PASSTHROUGH
+
+    if getattr(attribute, "verifying", None) is not _no_verify:
+        return _NO_PASSTHROUGH  # verification has to run or can't be determined
+
+    match attribute:
+        case AnyAttribute():
+            return None
+
+        case MissingAttribute():
+            return frozenset((haiway_types.Missing,))
+
+        case NoneAttribute():
+            return frozenset((types.NoneType,))
+
+        case StringAttribute():
+            return frozenset((str,))
+
+        case IntegerAttribute():
+            return frozenset((int,))
+
+        case FloatAttribute():
+            return frozenset((float,))
+
+        case BoolAttribute():
+            return frozenset((bool,))
+
+        case BytesAttribute():
+            return frozenset((bytes,))
+
+        case UUIDAttribute():
+            return frozenset((uuid.UUID,))
+
+        case DatetimeAttribute():
+            return frozenset((datetime.datetime,))
+
+        case DateAttribute():
+            return frozenset((datetime.date,))
+
+        case TimeAttribute():
+            return frozenset((datetime.time,))
+
+        case PathAttribute():
+            return frozenset((pathlib.Path, type(pathlib.Path())))
+
+        case MetaAttribute():
+            return frozenset((Meta,))
+
+        case StrEnumAttribute() | IntEnumAttribute():
+            return frozenset((attribute.base,))
+
+        case ObjectAttribute() | CustomAttribute() | ProtocolAttribute() if isinstance(
+            attribute.base, type
+        ):
+            return frozenset((attribute.base,))
+
+        case UnionAttribute():
+            return _union_passthrough_types(
+                attribute.alternatives,
+                validators=validators,
+            )
+
+        case _:
+            return _NO_PASSTHROUGH
+
+
+def _union_passthrough_types(
+    alternatives: Sequence[AttributeAnnotation],
+    /,
+    *,
+    validators: Set[Any],
+) -> Set[type[Any]] | None:
+    # alternatives are tried in order, a type passes through only when
+    # none of the preceding alternatives could convert it into something else
+    passthrough: set[type[Any]] = set()
+    converting: MutableSequence[Set[type[Any]]] = []
+    for alternative in alternatives:
+        alternative_types: Set[type[Any]] | None = passthrough_types(
+            alternative,
+            validators=validators,
+        )
+        if alternative_types is None:
+            if not converting:
+                return None  # every value passes unchanged
+
+            break  # following alternatives are unreachable
+
+        passthrough.update(
+            alternative_type
+            for alternative_type in alternative_types
+            if all(alternative_type in converted for converted in converting)
+        )
+
+        if not _non_converting(alternative):
+            converting.append(alternative_types)
+
+    return frozenset(passthrough)
+
+
+def _non_converting(
+    attribute: AttributeAnnotation,
+    /,
+) -> bool:
+    # attributes which either return the value unchanged or reject it
+    return (
+        isinstance(
+            attribute,
+            NoneAttribute
+            | MissingAttribute
+            | LiteralAttribute
+            | StringAttribute
+            | BytesAttribute
+            | CustomAttribute
+            | ProtocolAttribute
+            | FunctionAttribute,
+        )
+        and attribute.verifying is _no_verify
+    )
+
+
 def resolve_self_attribute(
     cls: type[Any],
     /,
     parameters: Mapping[str, Any],
     namespace: Mapping[str, Any] | None = None,
+    on_created: Callable[[ObjectAttribute], None] | None = None,
 ) -> ObjectAttribute:
     recursion_guard: MutableMapping[Any, AttributeAnnotation] = {}
     resolved_parameters: Mapping[str, AttributeAnnotation] = {
@@ -3078,6 +3500,8 @@ def resolve_self_attribute(
             parameters=tuple(resolved_parameters.values()),
         )
     ] = self_attribute
+    if on_created is not None:  # attributes are filled in place below
+        on_created(self_attribute)
 
     annotations: Mapping[str, Any]
     annotate = (
@@ -3850,7 +4274,139 @@ def _resolve_type(  # noqa: C901, PLR0911, PLR0912, PLR0915
             )
 
 
-def resolve_attribute(  # noqa: C901, PLR0911, PLR0912
+def resolve_attribute(
+    annotation: Any,
+    /,
+    module: str,
+    resolved_parameters: Mapping[str, Any],
+    recursion_guard: MutableMapping[Any, AttributeAnnotation],
+    localns: Mapping[str, Any] | None = None,
+) -> AttributeAnnotation:
+    cache_key: Hashable | None = _resolution_cache_key(annotation)
+    if cache_key is None:  # resolution depends on the context
+        return _resolve_attribute(
+            annotation,
+            localns=localns,
+            module=module,
+            resolved_parameters=resolved_parameters,
+            recursion_guard=recursion_guard,
+        )
+
+    try:
+        return _resolution_cache[cache_key]
+
+    except KeyError:
+        resolved: AttributeAnnotation = _resolve_attribute(
+            annotation,
+            localns=localns,
+            module=module,
+            resolved_parameters=resolved_parameters,
+            recursion_guard=recursion_guard,
+        )
+        _resolution_cache[cache_key] = resolved
+        return resolved
+
+
+# resolved attributes are immutable and can be shared between all classes
+_resolution_cache: Final[MutableMapping[Hashable, AttributeAnnotation]] = {}
+_CACHEABLE_TYPES: Final[Set[Any]] = frozenset(
+    (
+        types.NoneType,
+        typing.Any,
+        haiway_types.Missing,
+        str,
+        int,
+        float,
+        bool,
+        bytes,
+        uuid.UUID,
+        datetime.datetime,
+        datetime.date,
+        datetime.time,
+        pathlib.Path,
+    )
+)
+_CACHEABLE_CONTAINERS: Final[Set[Any]] = frozenset(
+    (
+        builtins.dict,
+        builtins.list,
+        builtins.set,
+        builtins.tuple,
+        collections_abc.Mapping,
+        collections_abc.MutableMapping,
+        collections_abc.Sequence,
+        collections_abc.MutableSequence,
+        collections_abc.Set,
+        collections_abc.MutableSet,
+    )
+)
+
+
+def _resolution_cache_key(  # noqa: C901, PLR0911
+    annotation: Any,
+    /,
+) -> Hashable | None:
+    # unions and literals compare equal regardless of the order of their arguments
+    # which matters for validation, keys are built to keep the order instead
+    if annotation is None:
+        return types.NoneType
+
+    if isinstance(annotation, type):
+        if annotation in _CACHEABLE_TYPES or issubclass(annotation, enum.StrEnum | enum.IntEnum):
+            return annotation
+
+        return None  # classes can be resolved depending on their current state
+
+    origin: Any = get_origin(annotation)
+    if origin is None:
+        return None  # forward references, type variables and other special forms
+
+    arguments: tuple[Any, ...] = get_args(annotation)
+    if origin is typing.Literal:
+        return _literal_cache_key(arguments)
+
+    if origin is typing.Union or origin is types.UnionType:
+        keys: list[Hashable] = [origin]
+
+    elif origin in _CACHEABLE_CONTAINERS:
+        keys = [type(annotation), origin]
+
+    else:
+        return None
+
+    for argument in arguments:
+        if argument is Ellipsis:
+            keys.append(Ellipsis)
+            continue
+
+        argument_key: Hashable | None = _resolution_cache_key(argument)
+        if argument_key is None:
+            return None
+
+        keys.append(argument_key)
+
+    return tuple(keys)
+
+
+def _literal_cache_key(
+    arguments: tuple[Any, ...],
+    /,
+) -> Hashable | None:
+    # literal values equal to each other (e.g. 1 and True) are distinguished by their types
+    literal_key: tuple[Hashable, ...] = (
+        typing.Literal,
+        *((argument.__class__, argument) for argument in arguments),
+    )
+    try:
+        hash(literal_key)
+
+    except TypeError:
+        return None  # unhashable values
+
+    return literal_key
+
+
+def _resolve_attribute(  # noqa: C901, PLR0911, PLR0912
     annotation: Any,
     /,
     module: str,
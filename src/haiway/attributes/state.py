@@ -1,7 +1,12 @@
 import json
 import typing
 from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Collection,
     Iterable,
+    Iterator,
     Mapping,
     MutableMapping,
     MutableSequence,
@@ -11,10 +16,15 @@ from collections.abc import (
 )
 from copy import deepcopy
 from dataclasses import fields, is_dataclass
+from datetime import date, time
+from functools import partial
+from pathlib import PurePath
+from threading import RLock
 from types import GenericAlias
 from typing import (
     Any,
     ClassVar,
+    Final,
     Generic,
     Literal,
     NoReturn,
@@ -25,20 +35,52 @@ from typing import (
     final,
     overload,
 )
-
-from haiway.attributes.annotations import ObjectAttribute, resolve_self_attribute
+from uuid import UUID
+from weakref import WeakSet
+
+from haiway.attributes.annotations import (
+    AliasAttribute,
+    AttributeAnnotation,
+    BoolAttribute,
+    BytesAttribute,
+    DateAttribute,
+    DatetimeAttribute,
+    FloatAttribute,
+    IntegerAttribute,
+    IntEnumAttribute,
+    LiteralAttribute,
+    MappingAttribute,
+    MissingAttribute,
+    NoneAttribute,
+    ObjectAttribute,
+    PathAttribute,
+    SequenceAttribute,
+    SetAttribute,
+    StrEnumAttribute,
+    StringAttribute,
+    TimeAttribute,
+    TupleAttribute,
+    UnionAttribute,
+    UUIDAttribute,
+    ValidableAttribute,
+    passthrough_types,
+    register_object_validator,
+    resolve_self_attribute,
+)
 from haiway.attributes.attribute import Attribute
 from haiway.attributes.coding import AttributesJSONEncoder
 from haiway.attributes.path import AttributePath
-from haiway.attributes.validation import ValidationContext
+from haiway.attributes.validation import ValidationContext, ValidationError
 from haiway.types import (
     MISSING,
     Default,
     DefaultValue,
+    Map,
     Missing,
     TypeSpecification,
     not_missing,
 )
+from haiway.types.coding import JSONArrayDecoder, json_decode, json_default, json_encode
 
 __all__ = ("State",)
 
@@ -70,10 +112,11 @@ class StateMeta(type):
     __FIELDS__: Sequence[Attribute]
     __ALLOWED_FIELDS__: Set[str]
     __SERIALIZABLE__: bool
+    __DEFERRED__: bool
     __slots__: tuple[str, ...]
     __match_args__: tuple[str, ...]
 
-    def __new__(  # noqa: C901, PLR0912
+    def __new__(
         mcs,
         /,
         name: str,
@@ -81,6 +124,7 @@ class StateMeta(type):
         namespace: dict[str, Any],
         type_parameters: dict[str, Any] | None = None,
         serializable: bool = False,
+        deferred: bool | None = None,
         **kwargs: Any,
     ) -> Any:
         cls = type.__new__(
@@ -91,18 +135,16 @@ class StateMeta(type):
             **kwargs,
         )
 
-        self_attribute: ObjectAttribute = resolve_self_attribute(
-            cls,
-            namespace=namespace,
-            parameters=type_parameters or {},
-        )
-
-        cls.__SELF_ATTRIBUTE__ = self_attribute  # pyright: ignore[reportConstantRedefinition]
         cls.__TYPE_PARAMETERS__ = type_parameters  # pyright: ignore[reportConstantRedefinition]
         cls._ = AttributePath(cls, attribute=cls)  # pyright: ignore[reportCallIssue, reportUnknownMemberType, reportAttributeAccessIssue]
 
         if not bases:  # handle base class - no fields specified
             assert not type_parameters  # nosec: B101
+            cls.__SELF_ATTRIBUTE__ = resolve_self_attribute(  # pyright: ignore[reportConstantRedefinition]
+                cls,
+                namespace=namespace,
+                parameters={},
+            )
             cls.__SPECIFICATION__ = {  # pyright: ignore[reportConstantRedefinition]
                 "type": "object",
                 "properties": {},
@@ -112,71 +154,32 @@ class StateMeta(type):
             cls.__FIELDS__ = ()  # pyright: ignore[reportAttributeAccessIssue, reportConstantRedefinition]
             cls.__ALLOWED_FIELDS__ = frozenset()  # pyright: ignore[reportConstantRedefinition]
             cls.__SERIALIZABLE__ = True  # pyright: ignore[reportConstantRedefinition]
+            cls.__DEFERRED__ = bool(deferred)  # pyright: ignore[reportConstantRedefinition]
             cls.__slots__ = ()  # pyright: ignore[reportAttributeAccessIssue]
             cls.__match_args__ = cls.__slots__  # pyright: ignore[reportAttributeAccessIssue]
 
             return cls  # early exit - base class
 
-        specification_fields: MutableMapping[str, TypeSpecification] | None = {}
-        required_fields: MutableSequence[str] = []
-        allowed_fields: MutableSet[str] = set()
-        fields: MutableSequence[Attribute] = []
-        for key, attribute in self_attribute.attributes.items():
-            field: Attribute = Attribute(
-                name=key,
-                annotation=attribute,
-                default=_resolve_default(getattr(cls, key, MISSING)),
-            )
-            assert key not in allowed_fields  # nosec: B101
-            allowed_fields.add(key)
-            if attribute.alias:
-                assert attribute.alias not in allowed_fields  # nosec: B101
-                allowed_fields.add(attribute.alias)
-
-            fields.append(field)
-
-            if specification_fields is None:
-                continue  # skip specification if it already failed
+        if deferred is None:  # inherit the mode from base classes
+            deferred = any(getattr(base, "__DEFERRED__", False) for base in bases)
 
-            if field.specification is None:
-                # there will be no specification at all
-                if field.required:
-                    specification_fields = None
+        cls.__DEFERRED__ = deferred  # pyright: ignore[reportConstantRedefinition]
 
-                # else continue skipping this field
+        if deferred:
+            _DeferredResolution(
+                cls,
+                namespace=namespace,
+                type_parameters=type_parameters,
+                serializable=serializable,
+            ).install()
 
-            elif field.alias is not None:
-                specification_fields[field.alias] = field.specification
-                if field.required:
-                    required_fields.append(field.alias)
-
-            else:
-                specification_fields[field.name] = field.specification
-                if field.required:
-                    required_fields.append(field.name)
-
-        if specification_fields is not None:  # it is technically not serializable otherwise
-            cls.__SPECIFICATION__ = {  # pyright: ignore[reportAttributeAccessIssue, reportConstantRedefinition]
-                "type": "object",
-                "properties": specification_fields,
-                "required": required_fields,
-                "additionalProperties": False,
-            }
-            cls.__SERIALIZABLE__ = True  # pyright: ignore[reportConstantRedefinition]
-
-        elif serializable:
-            raise TypeError(f"{cls.__name__} requires serialization but cannot produce json schema")
-
-        else:  # no specification
-            cls.__SERIALIZABLE__ = False  # pyright: ignore[reportConstantRedefinition]
-            cls.__SPECIFICATION__ = _no_specification  # pyright: ignore[reportAttributeAccessIssue, reportConstantRedefinition]
-
-        cls.__FIELDS__ = tuple(fields)  # pyright: ignore[reportConstantRedefinition]
-        cls.__ALLOWED_FIELDS__ = frozenset(allowed_fields)  # pyright: ignore[reportConstantRedefinition]
-        cls.__slots__ = tuple(  # pyright: ignore[reportAttributeAccessIssue]
-            field.name for field in fields
-        )
-        cls.__match_args__ = cls.__slots__  # pyright: ignore[reportAttributeAccessIssue]
+        else:
+            _resolve_state(
+                cls,
+                namespace=namespace,
+                type_parameters=type_parameters,
+                serializable=serializable,
+            )
 
         return cls
 
@@ -264,6 +267,187 @@ class StateMeta(type):
         return True
 
 
+def _resolve_state(  # noqa: C901, PLR0912
+    cls: StateMeta,
+    /,
+    *,
+    namespace: Mapping[str, Any],
+    type_parameters: Mapping[str, Any] | None,
+    serializable: bool,
+) -> None:
+    resolve_self_attribute(
+        cls,
+        namespace=namespace,
+        parameters=type_parameters or {},
+        # expose the attribute while resolving so references back to this class can use it
+        on_created=partial(type.__setattr__, cls, "__SELF_ATTRIBUTE__"),
+    )
+
+    specification_fields: MutableMapping[str, TypeSpecification] | None = {}
+    required_fields: MutableSequence[str] = []
+    allowed_fields: MutableSet[str] = set()
+    fields: MutableSequence[Attribute] = []
+    for key, attribute in cls.__SELF_ATTRIBUTE__.attributes.items():
+        field: Attribute = Attribute(
+            name=key,
+            annotation=attribute,
+            default=_resolve_default(getattr(cls, key, MISSING)),
+        )
+        assert key not in allowed_fields  # nosec: B101
+        allowed_fields.add(key)
+        if attribute.alias:
+            assert attribute.alias not in allowed_fields  # nosec: B101
+            allowed_fields.add(attribute.alias)
+
+        fields.append(field)
+
+        if specification_fields is None:
+            continue  # skip specification if it already failed
+
+        if field.specification is None:
+            # there will be no specification at all
+            if field.required:
+                specification_fields = None
+
+            # else continue skipping this field
+
+        elif field.alias is not None:
+            specification_fields[field.alias] = field.specification
+            if field.required:
+                required_fields.append(field.alias)
+
+        else:
+            specification_fields[field.name] = field.specification
+            if field.required:
+                required_fields.append(field.name)
+
+    if specification_fields is not None:  # it is technically not serializable otherwise
+        cls.__SPECIFICATION__ = {  # pyright: ignore[reportAttributeAccessIssue, reportConstantRedefinition]
+            "type": "object",
+            "properties": specification_fields,
+            "required": required_fields,
+            "additionalProperties": False,
+        }
+        cls.__SERIALIZABLE__ = True  # pyright: ignore[reportConstantRedefinition]
+
+    elif serializable:
+        raise TypeError(f"{cls.__name__} requires serialization but cannot produce json schema")
+
+    else:  # no specification
+        cls.__SERIALIZABLE__ = False  # pyright: ignore[reportConstantRedefinition]
+        cls.__SPECIFICATION__ = _no_specification  # pyright: ignore[reportAttributeAccessIssue, reportConstantRedefinition]
+
+    cls.__FIELDS__ = tuple(fields)  # pyright: ignore[reportConstantRedefinition]
+    cls.__ALLOWED_FIELDS__ = frozenset(allowed_fields)  # pyright: ignore[reportConstantRedefinition]
+    cls.__slots__ = tuple(  # pyright: ignore[reportAttributeAccessIssue]
+        field.name for field in fields
+    )
+    cls.__match_args__ = cls.__slots__  # pyright: ignore[reportAttributeAccessIssue]
+
+    # replace generic field loops with methods compiled for this class
+    if _compilable(cls, "__init__", namespace=namespace):
+        cls.__init__ = _compile_init(cls)  # pyright: ignore[reportAttributeAccessIssue]
+
+    if _compilable(cls, "__replace__", namespace=namespace):
+        cls.__replace__ = _compile_replace(cls)  # pyright: ignore[reportAttributeAccessIssue]
+
+
+@final
+class _DeferredResolution:
+    # postpones resolution of State class attributes until any of them is accessed
+    __slots__ = (
+        "_cls",
+        "_namespace",
+        "_resolving",
+        "_serializable",
+        "_type_parameters",
+    )
+
+    def __init__(
+        self,
+        cls: StateMeta,
+        /,
+        *,
+        namespace: Mapping[str, Any],
+        type_parameters: Mapping[str, Any] | None,
+        serializable: bool,
+    ) -> None:
+        self._cls: StateMeta = cls
+        self._namespace: Mapping[str, Any] = namespace
+        self._type_parameters: Mapping[str, Any] | None = type_parameters
+        self._serializable: bool = serializable
+        self._resolving: bool = False
+
+    def install(self) -> None:
+        for name in _DEFERRED_ATTRIBUTES:
+            type.__setattr__(self._cls, name, _DeferredAttribute(self, name=name))
+
+        # generic methods trigger resolution on first use, compiled ones are installed then
+        for name in ("__init__", "__replace__"):
+            if _compilable(self._cls, name, namespace=self._namespace):
+                type.__setattr__(self._cls, name, getattr(State, name))
+
+    def resolve(
+        self,
+        name: str,
+        /,
+    ) -> Any:
+        cls: StateMeta = self._cls
+        with _deferred_lock:  # reentrant, single lock prevents deadlocks between classes
+            if self._resolving:
+                # base class attributes are visible while resolving, as with eager resolution
+                return getattr(super(cls, cls), name)  # pyright: ignore[reportUnknownArgumentType]
+
+            self._resolving = True
+            try:
+                if isinstance(cls.__dict__.get(name), _DeferredAttribute):
+                    _resolve_state(
+                        cls,
+                        namespace=self._namespace,
+                        type_parameters=self._type_parameters,
+                        serializable=self._serializable,
+                    )
+
+            finally:
+                self._resolving = False
+
+        return getattr(cls, name)
+
+
+@final
+class _DeferredAttribute:
+    __slots__ = ("_name", "_resolution")
+
+    def __init__(
+        self,
+        resolution: _DeferredResolution,
+        /,
+        *,
+        name: str,
+    ) -> None:
+        self._resolution: _DeferredResolution = resolution
+        self._name: str = name
+
+    def __get__(
+        self,
+        instance: object,
+        owner: type[object],
+    ) -> Any:
+        return self._resolution.resolve(self._name)
+
+
+_deferred_lock: Final[RLock] = RLock()
+_DEFERRED_ATTRIBUTES: Final[tuple[str, ...]] = (
+    "__SELF_ATTRIBUTE__",
+    "__SPECIFICATION__",
+    "__FIELDS__",
+    "__ALLOWED_FIELDS__",
+    "__SERIALIZABLE__",
+    "__slots__",
+    "__match_args__",
+)
+
+
 def _resolve_default(
     value: DefaultValue | Any | Missing,
 ) -> DefaultValue:
@@ -338,6 +522,9 @@ class State(metaclass=StateMeta):
     ```
     """
 
+    # lazily computed hash, instances are immutable so it never changes
+    __slots__ = ("__dict__", "__hash_cache__", "__weakref__")
+
     _: ClassVar[Self]
 
     @classmethod
@@ -442,25 +629,90 @@ class State(metaclass=StateMeta):
             return value
 
         elif isinstance(value, Mapping | typing.Mapping):
-            for key in cast(Mapping[Any, Any], value.keys()):
-                if key not in cls.__ALLOWED_FIELDS__:
-                    raise TypeError(f"Unexpected attribute '{key}' for {cls.__name__}")
-
-            for field in cls.__FIELDS__:
-                if field.alias is None:
-                    continue
-
-                if field.alias in value and field.name in value:
-                    raise TypeError(
-                        f"Duplicate attribute '{field.name}'"
-                        f" with alias '{field.alias}' for {cls.__name__}"
-                    )
+            issue: str | None = _mapping_keys_issue(
+                cls,
+                cast(Collection[Any], value.keys()),
+            )
+            if issue is not None:
+                raise TypeError(issue)
 
             return cls(**value)
 
         else:
             raise TypeError(f"'{value}' is not matching expected type of '{cls}'")
 
+    @classmethod
+    def validate_many(
+        cls,
+        values: Iterable[Any],
+        /,
+    ) -> Sequence[Self]:
+        """
+        Validate and convert a batch of values to instances of this class.
+
+        Works like ``validate`` for each element, but keys of mappings sharing
+        the same shape are verified only once and all failures are reported
+        instead of stopping at the first one.
+
+        Parameters
+        ----------
+        values : Iterable[Any]
+            Values to validate, typically mappings e.g. database rows.
+
+        Returns
+        -------
+        Sequence[Self]
+            Tuple of instances in order of the provided values.
+
+        Raises
+        ------
+        ExceptionGroup
+            If any element fails validation, contains ``ValidationError`` for
+            each failed element with its index as the first path segment.
+        """
+        shapes: dict[tuple[Any, ...], str | None] = {}
+        validated: list[Self] = []
+        errors: list[ValidationError] = []
+        for idx, value in enumerate(values):
+            try:
+                if isinstance(value, cls):
+                    validated.append(value)
+                    continue
+
+                if not isinstance(value, Mapping | typing.Mapping):
+                    raise TypeError(f"'{value}' is not matching expected type of '{cls}'")
+
+                shape: tuple[Any, ...] = tuple(cast(Mapping[Any, Any], value).keys())
+                issue: str | None
+                if shape in shapes:
+                    issue = shapes[shape]
+
+                else:
+                    issue = _mapping_keys_issue(cls, shape)
+                    shapes[shape] = issue
+
+                if issue is not None:
+                    raise TypeError(issue)
+
+                validated.append(cls(**value))
+
+            except ValidationError as exc:
+                exc.prepend(f"[{idx}]")
+                errors.append(exc)
+
+            except Exception as exc:
+                error: ValidationError = ValidationError(path=(f"[{idx}]",), cause=exc)
+                error.__cause__ = exc
+                errors.append(error)
+
+        if errors:
+            raise ExceptionGroup(
+                f"Validation of {len(errors)} {cls.__name__} element(s) failed",
+                errors,
+            )
+
+        return tuple(validated)
+
     @classmethod
     def from_mapping(
         cls,
@@ -482,6 +734,47 @@ class State(metaclass=StateMeta):
         """
         return cls.validate(value)
 
+    @classmethod
+    def trusted(
+        cls,
+        **kwargs: Any,
+    ) -> Self:
+        """
+        Build an instance from already validated attribute values.
+
+        Type validation is skipped entirely, use it only for data which was
+        validated before, i.e. ``to_mapping()`` output or internally stored
+        records. Default values are still applied to absent attributes,
+        sequences are converted to tuples, sets to frozensets, mappings to
+        ``Map`` and nested mappings of State attributes to trusted instances.
+
+        Parameters
+        ----------
+        **kwargs : Any
+            Attribute values for the new instance, by name or alias.
+
+        Returns
+        -------
+        Self
+            New instance containing provided values as they are.
+        """
+        instance: Self = object.__new__(cls)
+        for field in cls.__FIELDS__:
+            value: Any = MISSING
+            if field.alias is not None:
+                value = kwargs.get(field.alias, MISSING)
+
+            if value is MISSING:
+                value = kwargs.get(field.name, MISSING)
+
+            object.__setattr__(
+                instance,
+                field.name,
+                field.default() if value is MISSING else _trusted(field.annotation, value),
+            )
+
+        return instance
+
     @overload
     @classmethod
     def json_schema(
@@ -568,7 +861,9 @@ class State(metaclass=StateMeta):
         """
         try:
             return cls.validate(
-                json.loads(
+                json_decode(value)
+                if decoder is json.JSONDecoder
+                else json.loads(
                     value,
                     cls=decoder,
                 )
@@ -606,9 +901,13 @@ class State(metaclass=StateMeta):
         """
         payload: Any
         try:
-            payload = json.loads(
-                value,
-                cls=decoder,
+            payload = (
+                json_decode(value)
+                if decoder is json.JSONDecoder
+                else json.loads(
+                    value,
+                    cls=decoder,
+                )
             )
 
         except Exception as exc:
@@ -627,6 +926,129 @@ class State(metaclass=StateMeta):
             case _:
                 raise ValueError("Provided json is not an array!")
 
+    @classmethod
+    def from_json_array_chunks(
+        cls,
+        chunks: Iterable[str | bytes],
+        /,
+    ) -> Iterator[Self]:
+        """
+        Incrementally deserialize instances from chunks of a JSON array payload.
+
+        Elements are decoded and validated one by one as soon as they are
+        complete, the whole payload is never held in memory at once.
+
+        Parameters
+        ----------
+        chunks : Iterable[str | bytes]
+            Consecutive parts of a JSON array payload split at arbitrary points.
+
+        Yields
+        ------
+        Self
+            Instances in order of their appearance within the array.
+
+        Raises
+        ------
+        ValueError
+            If decoding fails, the payload is not an array, or an element fails
+            validation. Validation failures are caused by ``ValidationError``
+            with the element index as the first path segment.
+        """
+        decoder: JSONArrayDecoder = JSONArrayDecoder()
+        index: int = 0
+        for chunk in chunks:
+            for element in cls._decoded_elements(decoder, chunk):
+                yield cls._validated_element(element, index=index)
+                index += 1
+
+        cls._decoded_close(decoder)
+
+    @classmethod
+    async def from_json_array_stream(
+        cls,
+        stream: AsyncIterable[str | bytes],
+        /,
+    ) -> AsyncIterator[Self]:
+        """
+        Incrementally deserialize instances from an asynchronous JSON array stream.
+
+        Works like ``from_json_array_chunks`` for asynchronous sources, e.g.
+        ``HTTPResponse.iter_bytes()``.
+
+        Parameters
+        ----------
+        stream : AsyncIterable[str | bytes]
+            Consecutive parts of a JSON array payload split at arbitrary points.
+
+        Yields
+        ------
+        Self
+            Instances in order of their appearance within the array.
+
+        Raises
+        ------
+        ValueError
+            If decoding fails, the payload is not an array, or an element fails
+            validation. Validation failures are caused by ``ValidationError``
+            with the element index as the first path segment.
+        """
+        decoder: JSONArrayDecoder = JSONArrayDecoder()
+        index: int = 0
+        async for chunk in stream:
+            for element in cls._decoded_elements(decoder, chunk):
+                yield cls._validated_element(element, index=index)
+                index += 1
+
+        cls._decoded_close(decoder)
+
+    @classmethod
+    def _decoded_elements(
+        cls,
+        decoder: JSONArrayDecoder,
+        chunk: str | bytes,
+    ) -> Sequence[Any]:
+        try:
+            return decoder.feed(chunk)
+
+        except Exception as exc:
+            raise ValueError(f"Failed to decode {cls.__name__} from json: {exc}") from exc
+
+    @classmethod
+    def _decoded_close(
+        cls,
+        decoder: JSONArrayDecoder,
+    ) -> None:
+        try:
+            decoder.close()
+
+        except Exception as exc:
+            raise ValueError(f"Failed to decode {cls.__name__} from json: {exc}") from exc
+
+    @classmethod
+    def _validated_element(
+        cls,
+        element: Any,
+        *,
+        index: int,
+    ) -> Self:
+        try:
+            return cls.validate(element)
+
+        except Exception as exc:
+            error: ValidationError
+            if isinstance(exc, ValidationError):
+                error = exc
+                error.prepend(f"[{index}]")
+
+            else:
+                error = ValidationError(path=(f"[{index}]",), cause=exc)
+                error.__cause__ = exc
+
+            raise ValueError(
+                f"Failed to decode {cls.__name__} from json array element {index}: {error}"
+            ) from error
+
     def to_json(
         self,
         indent: int | None = None,
@@ -635,6 +1057,9 @@ class State(metaclass=StateMeta):
         """
         Serialize this instance to a JSON string.
 
+        With the default encoder nested values are encoded directly, without
+        building an intermediate mapping first.
+
         Parameters
         ----------
         indent : int | None, optional
@@ -652,6 +1077,19 @@ class State(metaclass=StateMeta):
         ValueError
             If encoding fails.
         """
+        if encoder_class is AttributesJSONEncoder:
+            try:
+                return json_encode(
+                    self,
+                    indent=indent,
+                    default=_json_default,
+                )
+
+            except Exception as exc:
+                raise ValueError(
+                    f"Failed to encode {self.__class__.__name__} to json: {exc}"
+                ) from exc
+
         mapping: Mapping[str, Any] = self.to_mapping(recursive=True)
         try:
             return json.dumps(
@@ -747,21 +1185,23 @@ class State(metaclass=StateMeta):
             A mapping keyed by attribute aliases when present, otherwise by
             canonical field names. Values equal to ``MISSING`` are omitted.
         """
-        dict_result: MutableMapping[str, Any] = {}
         if recursive:
-            for field in self.__FIELDS__:
-                key: str = field.alias if field.alias is not None else field.name
-                value: Any | Missing = getattr(self, field.name, MISSING)
+            # serializer is compiled on first use, when all annotations are resolved
+            serializer: Callable[[State], Mapping[str, Any]] | None = self.__class__.__dict__.get(
+                "__MAPPING__"
+            )
+            if serializer is None:
+                serializer = _compile_mapping(self.__class__)
+                self.__class__.__MAPPING__ = serializer  # pyright: ignore[reportAttributeAccessIssue]
 
-                if not_missing(value):
-                    dict_result[key] = _recursive_mapping(value)
+            return serializer(self)
 
-        else:
-            for field in self.__FIELDS__:
-                key: str = field.alias if field.alias is not None else field.name
-                value: Any | Missing = getattr(self, field.name, MISSING)
-                if not_missing(value):
-                    dict_result[key] = value
+        dict_result: MutableMapping[str, Any] = {}
+        for field in self.__FIELDS__:
+            key: str = field.alias if field.alias is not None else field.name
+            value: Any | Missing = getattr(self, field.name, MISSING)
+            if not_missing(value):
+                dict_result[key] = value
 
         return dict_result
 
@@ -814,9 +1254,19 @@ class State(metaclass=StateMeta):
         bool
             True if the objects are equal, False otherwise
         """
+        if other is self:
+            return True
+
         if other.__class__ is not self.__class__:
             return False
 
+        # instances with different hashes can't be equal, compare only when known
+        self_hash: int | None = getattr(self, "__hash_cache__", None)
+        if self_hash is not None:
+            other_hash: int | None = getattr(other, "__hash_cache__", None)
+            if other_hash is not None and other_hash != self_hash:
+                return False
+
         return all(
             getattr(self, field.name, MISSING) == getattr(other, field.name, MISSING)
             for field in self.__FIELDS__
@@ -826,11 +1276,21 @@ class State(metaclass=StateMeta):
         """
         Compute a hash value for this immutable instance.
 
+        The hash is computed once and cached within the instance when all
+        attribute values are hashable.
+
         Returns
         -------
         int
             Hash derived from non-missing attribute values.
         """
+        try:
+            return self.__hash_cache__
+
+        except AttributeError:
+            pass  # not computed yet
+
+        complete: bool = True
         hash_values: MutableSequence[int] = []
         for field in self.__FIELDS__:
             value: Any = getattr(self, field.name, MISSING)
@@ -844,9 +1304,27 @@ class State(metaclass=StateMeta):
                 hash_values.append(hash(value))
 
             except TypeError:
+                complete = False
                 continue  # skip unhashable
 
-        return hash((self.__class__, tuple(hash_values)))
+        hash_value: int = hash((self.__class__, tuple(hash_values)))
+        if complete:  # partial hashes are not reliable for equality checks
+            object.__setattr__(self, "__hash_cache__", hash_value)
+
+        return hash_value
+
+    def __getstate__(self) -> dict[str, Any]:
+        """
+        Provide attribute values for pickling.
+
+        Cached hash is excluded as it is valid only within the current process.
+
+        Returns
+        -------
+        dict[str, Any]
+            Attribute values of this instance.
+        """
+        return dict(self.__dict__)
 
     def __setattr__(
         self,
@@ -1008,12 +1486,133 @@ class State(metaclass=StateMeta):
         return updated
 
 
-def _recursive_mapping(  # noqa: PLR0911
+def _trusted(  # noqa: C901, PLR0911, PLR0912
+    annotation: AttributeAnnotation,
     value: Any,
 ) -> Any:
-    if isinstance(value, str | bytes | float | int | bool | None):
+    # structural conversion only, trusted values are not checked against types
+    if isinstance(annotation, AliasAttribute):
+        return _trusted(annotation.resolved, value)
+
+    if isinstance(annotation, ValidableAttribute):
+        state: Any = getattr(annotation.validating, "__self__", None)
+        if (
+            isinstance(state, StateMeta)
+            and isinstance(value, Mapping)
+            and not isinstance(value, State)
+        ):
+            return cast(type[State], state).trusted(**value)
+
         return value
 
+    if isinstance(value, str | bytes | bytearray | memoryview):  # text is never converted
+        return value  # pyright: ignore[reportUnknownVariableType]
+
+    if isinstance(annotation, SequenceAttribute):
+        if not isinstance(value, list | tuple):
+            return value
+
+        if _trusted_leaf(annotation.values):
+            return tuple(cast(Sequence[Any], value))
+
+        return tuple(_trusted(annotation.values, element) for element in value)  # pyright: ignore[reportUnknownVariableType]
+
+    if isinstance(annotation, TupleAttribute):
+        if not isinstance(value, list | tuple) or len(value) != len(annotation.values):  # pyright: ignore[reportUnknownArgumentType]
+            return value  # pyright: ignore[reportUnknownVariableType]
+
+        return tuple(
+            _trusted(element, value[idx])  # pyright: ignore[reportUnknownArgumentType]
+            for idx, element in enumerate(annotation.values)
+        )
+
+    if isinstance(annotation, SetAttribute):
+        if not isinstance(value, list | tuple | set | frozenset):
+            return value
+
+        if _trusted_leaf(annotation.values):
+            return frozenset(cast(Iterable[Any], value))
+
+        return frozenset(_trusted(annotation.values, element) for element in value)  # pyright: ignore[reportUnknownVariableType]
+
+    if isinstance(annotation, MappingAttribute):
+        if not isinstance(value, Mapping):
+            return value
+
+        if _trusted_leaf(annotation.values):
+            return value if isinstance(value, Map) else Map(cast(Mapping[Any, Any], value))  # pyright: ignore[reportUnknownVariableType]
+
+        return Map(
+            {
+                key: _trusted(annotation.values, element)
+                for key, element in cast(Mapping[Any, Any], value).items()
+            }
+        )
+
+    if isinstance(annotation, UnionAttribute):
+        for alternative in annotation.alternatives:
+            if _trusted_leaf(alternative):
+                continue
+
+            # use the first structural alternative matching the value shape
+            converted: Any = _trusted(alternative, value)
+            if converted is not value:
+                return converted
+
+    return value
+
+
+def _trusted_leaf(
+    annotation: AttributeAnnotation,
+) -> bool:
+    if isinstance(annotation, AliasAttribute):
+        return _trusted_leaf(annotation.resolved)
+
+    if isinstance(annotation, ValidableAttribute):
+        return not isinstance(getattr(annotation.validating, "__self__", None), StateMeta)
+
+    return not isinstance(
+        annotation,
+        SequenceAttribute | TupleAttribute | SetAttribute | MappingAttribute | UnionAttribute,
+    )
+
+
+def _json_default(
+    value: Any,
+) -> Any:
+    if isinstance(value, State):
+        return value.to_mapping(recursive=False)
+
+    return json_default(value)
+
+
+def _mapping_keys_issue(
+    cls: type[State],
+    keys: Collection[Any],
+    /,
+) -> str | None:
+    for key in keys:
+        if key not in cls.__ALLOWED_FIELDS__:
+            return f"Unexpected attribute '{key}' for {cls.__name__}"
+
+    for field in cls.__FIELDS__:
+        if field.alias is None:
+            continue
+
+        if field.alias in keys and field.name in keys:
+            return (
+                f"Duplicate attribute '{field.name}' with alias '{field.alias}' for {cls.__name__}"
+            )
+
+    return None
+
+
+def _recursive_mapping(  # noqa: PLR0911
+    value: Any,
+) -> Any:
+    if isinstance(value, str | bytes | float | int | bool | UUID | date | time | PurePath | None):
+        return value  # immutable, no need to copy
+
     elif isinstance(value, State):
         return value.to_mapping(recursive=True)
 
@@ -1033,3 +1632,310 @@ def _recursive_mapping(  # noqa: PLR0911
 
     else:
         return deepcopy(value)
+
+
+_ABSENT: Final[object] = object()
+_PASSTHROUGH_VALIDATORS: Final[Set[Any]] = frozenset((State.validate.__func__,))
+register_object_validator(State.validate.__func__)
+_compiled_methods: WeakSet[Callable[..., Any]] = WeakSet()
+
+
+def _compilable(
+    cls: StateMeta,
+    name: str,
+    /,
+    *,
+    namespace: Mapping[str, Any],
+) -> bool:
+    if name in namespace:
+        return False  # explicitly defined by the class itself
+
+    method: Any = getattr(cls, name)
+    # replace only generic or previously compiled methods, keep custom ones inherited
+    return method is getattr(State, name) or method in _compiled_methods
+
+
+def _compile_init(
+    cls: StateMeta,
+    /,
+) -> Callable[..., None]:
+    namespace: dict[str, Any] = {
+        "ABSENT": _ABSENT,
+        "cls": cls,
+        "generic": State.__init__,
+        "ValidationError": ValidationError,
+        "setattr": object.__setattr__,
+    }
+    lines: MutableSequence[str] = [
+        "def __init__(self, **kwargs):",
+        # subclasses with custom initializers calling super() have their own fields
+        "    if self.__class__ is not cls:",
+        "        return generic(self, **kwargs)",
+    ]
+    for idx, field in enumerate(cls.__FIELDS__):
+        namespace[f"default_{idx}"] = field.default
+        if field.alias is None:
+            lines.append(f"    value = kwargs.get({field.name!r}, ABSENT)")
+
+        else:
+            lines.append(f"    value = kwargs.get({field.alias!r}, ABSENT)")
+            lines.append("    if value is ABSENT:")
+            lines.append(f"        value = kwargs.get({field.name!r}, ABSENT)")
+
+        lines.append("    if value is ABSENT:")
+        lines.append(f"        value = default_{idx}()")
+        lines.extend(
+            f"    {line}"
+            for line in _compile_validation(
+                field,
+                idx=idx,
+                namespace=namespace,
+            )
+        )
+        lines.append(f"    setattr(self, {field.name!r}, value)")
+
+    return _compile_method(
+        cls,
+        "__init__",
+        source="\n".join(lines),
+        namespace=namespace,
+    )
+
+
+def _compile_replace(
+    cls: StateMeta,
+    /,
+) -> Callable[..., Any]:
+    namespace: dict[str, Any] = {
+        "ABSENT": _ABSENT,
+        "MISSING": MISSING,
+        "cls": cls,
+        "generic": State.__replace__,
+        "keys": frozenset(
+            (
+                *(field.name for field in cls.__FIELDS__),
+                *(field.alias for field in cls.__FIELDS__ if field.alias is not None),
+            )
+        ),
+        "new": object.__new__,
+        "ValidationError": ValidationError,
+        "setattr": object.__setattr__,
+    }
+    lines: MutableSequence[str] = [
+        "def __replace__(self, **kwargs):",
+        # subclasses with custom replace calling super() have their own fields
+        "    if self.__class__ is not cls:",
+        "        return generic(self, **kwargs)",
+        # do not make a copy when nothing will be updated
+        "    if not kwargs or kwargs.keys().isdisjoint(keys):",
+        "        return self",
+        "    updated = new(cls)",
+    ]
+    for idx, field in enumerate(cls.__FIELDS__):
+        if field.alias is None:
+            lines.append(f"    value = kwargs.get({field.name!r}, ABSENT)")
+
+        else:
+            lines.append(f"    value = kwargs.get({field.alias!r}, ABSENT)")
+            lines.append("    if value is ABSENT:")
+            lines.append(f"        value = kwargs.get({field.name!r}, ABSENT)")
+
+        # reuse missing elements and validate updates
+        lines.append("    if value is ABSENT or value is MISSING:")
+        lines.append(f"        value = self.{field.name}")
+        validation: Sequence[str] = _compile_validation(
+            field,
+            idx=idx,
+            namespace=namespace,
+        )
+        if validation:
+            lines.append("    else:")
+            lines.extend(f"        {line}" for line in validation)
+
+        lines.append(f"    setattr(updated, {field.name!r}, value)")
+
+    lines.append("    return updated")
+
+    return _compile_method(
+        cls,
+        "__replace__",
+        source="\n".join(lines),
+        namespace=namespace,
+    )
+
+
+def _compile_validation(
+    field: Attribute,
+    /,
+    *,
+    idx: int,
+    namespace: MutableMapping[str, Any],
+) -> Sequence[str]:
+    passthrough: Set[type[Any]] | None = passthrough_types(
+        field.annotation,
+        validators=_PASSTHROUGH_VALIDATORS,
+    )
+    if passthrough is None:
+        return ()  # any value is valid
+
+    namespace[f"validate_{idx}"] = field.annotation.validate
+    # failure path is attached while unwinding, success path stays free of scopes
+    validation: Sequence[str] = (
+        "try:",
+        f"    value = validate_{idx}(value)",
+        "except ValidationError as exc:",
+        f"    exc.prepend({f'.{field.name}'!r})",
+        "    raise",
+        "except Exception as exc:",
+        f"    raise ValidationError(path=({f'.{field.name}'!r},), cause=exc) from exc",
+    )
+
+    if not passthrough:
+        return validation
+
+    condition: str
+    if len(passthrough) == 1:
+        namespace[f"type_{idx}"] = next(iter(passthrough))
+        condition = f"value.__class__ is not type_{idx}"
+
+    else:
+        namespace[f"types_{idx}"] = passthrough
+        condition = f"value.__class__ not in types_{idx}"
+
+    # skip validation for values which would be returned unchanged anyway
+    return (
+        f"if {condition}:",
+        *(f"    {line}" for line in validation),
+    )
+
+
+def _compile_method(
+    cls: StateMeta,
+    name: str,
+    /,
+    *,
+    source: str,
+    namespace: dict[str, Any],
+) -> Callable[..., Any]:
+    exec(  # nosec: B102
+        compile(
+            source,
+            f"<{cls.__module__}.{cls.__qualname__}.{name}>",
+            "exec",
+        ),
+        namespace,
+    )
+    method: Callable[..., Any] = namespace[name]
+    method.__module__ = cls.__module__
+    method.__qualname__ = f"{cls.__qualname__}.{name}"
+    method.__doc__ = getattr(State, name).__doc__
+    _compiled_methods.add(method)
+    return method
+
+
+def _compile_mapping(
+    cls: type[State],
+    /,
+) -> Callable[[State], Mapping[str, Any]]:
+    namespace: dict[str, Any] = {"MISSING": MISSING}
+    lines: MutableSequence[str] = [
+        "def to_mapping(self):",
+        "    mapping = {}",
+    ]
+    for idx, field in enumerate(cls.__FIELDS__):
+        key: str = field.alias if field.alias is not None else field.name
+        converter: Callable[[Any], Any] | None = _mapping_converter(field.annotation)
+        lines.append(f"    value = getattr(self, {field.name!r}, MISSING)")
+        lines.append("    if value is not MISSING:")
+        if converter is None:  # immutable leaves are used directly
+            lines.append(f"        mapping[{key!r}] = value")
+
+        else:
+            namespace[f"convert_{idx}"] = converter
+            lines.append(f"        mapping[{key!r}] = convert_{idx}(value)")
+
+    lines.append("    return mapping")
+
+    exec(  # nosec: B102
+        compile(
+            "\n".join(lines),
+            f"<{cls.__module__}.{cls.__qualname__}.to_mapping>",
+            "exec",
+        ),
+        namespace,
+    )
+    return namespace["to_mapping"]
+
+
+def _mapping_converter(  # noqa: C901, PLR0911
+    annotation: AttributeAnnotation,
+) -> Callable[[Any], Any] | None:
+    # conversion chosen by declared type, None when value can be used as is
+    if isinstance(annotation, _MAPPING_LEAVES):
+        return None
+
+    if isinstance(annotation, ValidableAttribute):
+        if isinstance(getattr(annotation.validating, "__self__", None), StateMeta):
+            return _state_mapping
+
+        return _recursive_mapping
+
+    if isinstance(annotation, SequenceAttribute | SetAttribute):
+        element: Callable[[Any], Any] | None = _mapping_converter(annotation.values)
+        if element is None:
+            return list
+
+        def convert_elements(value: Any) -> Any:
+            return [element(item) for item in value]
+
+        return convert_elements
+
+    if isinstance(annotation, TupleAttribute):
+        if all(_mapping_converter(element) is None for element in annotation.values):
+            return list
+
+        return _recursive_mapping
+
+    if isinstance(annotation, MappingAttribute):
+        values: Callable[[Any], Any] | None = _mapping_converter(annotation.values)
+        if values is None:
+            return dict
+
+        def convert_values(value: Any) -> Any:
+            return {key: values(item) for key, item in value.items()}
+
+        return convert_values
+
+    if isinstance(annotation, UnionAttribute):
+        if all(_mapping_converter(alternative) is None for alternative in annotation.alternatives):
+            return None
+
+        return _recursive_mapping
+
+    # aliases (possibly recursive) and dynamic types are resolved at runtime
+    return _recursive_mapping
+
+
+def _state_mapping(
+    value: State,
+) -> Mapping[str, Any]:
+    return value.to_mapping(recursive=True)
+
+
+_MAPPING_LEAVES: Final[tuple[type[Any], ...]] = (
+    BoolAttribute,
+    BytesAttribute,
+    DateAttribute,
+    DatetimeAttribute,
+    FloatAttribute,
+    IntEnumAttribute,
+    IntegerAttribute,
+    LiteralAttribute,
+    MissingAttribute,
+    NoneAttribute,
+    PathAttribute,
+    StrEnumAttribute,
+    StringAttribute,
+    TimeAttribute,
+    UUIDAttribute,
+)
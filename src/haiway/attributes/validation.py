@@ -1,9 +1,7 @@
 from collections.abc import Sequence
-from contextvars import ContextVar, Token
 from types import TracebackType
 from typing import (
     Any,
-    ClassVar,
     NoReturn,
     Protocol,
     Self,
@@ -55,7 +53,12 @@ class Verifying[Type](Protocol):
 
 @final
 class ValidationContext:
-    _context: ClassVar[ContextVar[Sequence[str]]] = ContextVar[Sequence[str]]("ValidationContext")
+    """
+    Context manager attributing validation failures to a nested attribute path.
+
+    Path segments are attached to ``ValidationError`` only while an exception
+    unwinds through the scope, successful validation does not build any path.
+    """
 
     @classmethod
     def scope(
@@ -63,31 +66,21 @@ class ValidationContext:
         name: str,
         /,
     ) -> Self:
-        try:
-            context: Sequence[str] = cls._context.get()
-            return cls((*context, name))
+        return cls((name,))
 
-        except LookupError:
-            return cls((name,))
-
-    __slots__ = (
-        "_path",
-        "_token",
-    )
+    __slots__ = ("_path",)
 
     def __init__(
         self,
         path: Sequence[str],
     ) -> None:
         self._path: Sequence[str] = path
-        self._token: Token[Sequence[str]] | None = None
 
     def __str__(self) -> str:
         return "".join(self._path)
 
     def __enter__(self) -> None:
-        assert self._token is None, "ValidatorContext reentrance is not allowed"  # nosec: B101
-        self._token = ValidationContext._context.set(self._path)
+        pass  # path is resolved lazily on failure
 
     def __exit__(
         self,
@@ -95,12 +88,10 @@ class ValidationContext:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        assert self._token is not None, "Unbalanced context enter/exit"  # nosec: B101
-
-        ValidationContext._context.reset(self._token)
-        self._token = None
+        if isinstance(exc_val, ValidationError):
+            exc_val.prepend(*self._path)  # propagate with extended path
 
-        if isinstance(exc_val, Exception) and not isinstance(exc_val, ValidationError):
+        elif isinstance(exc_val, Exception):
             raise ValidationError(
                 path=self._path,
                 cause=exc_val,
@@ -112,7 +103,8 @@ class ValidationError(Exception):
     Exception raised when validation fails.
 
     This exception wraps the original validation error together with the nested
-    attribute path at which the failure occurred.
+    attribute path at which the failure occurred. The path is completed while
+    the exception propagates through enclosing validation layers.
     """
 
     __slots__ = (
@@ -130,6 +122,21 @@ class ValidationError(Exception):
         self.path: Sequence[str] = path
         self.cause: Exception = cause
 
+    def prepend(
+        self,
+        *segments: str,
+    ) -> None:
+        """
+        Prefix the failure path with segments of an enclosing attribute.
+
+        Parameters
+        ----------
+        *segments : str
+            Path segments of the enclosing attribute, outermost first.
+        """
+        self.path = (*segments, *self.path)
+        self.args = (f"Validation of {''.join(self.path)} failed: {self.cause}",)
+
 
 @final
 class Validator[Type]:
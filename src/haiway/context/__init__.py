@@ -1,7 +1,13 @@
 from haiway.context.access import ctx
-from haiway.context.disposables import ContextDisposables, Disposable, Disposables, DisposableState
-from haiway.context.events import ContextEvents, EventsSubscription
-from haiway.context.identifier import ContextIdentifier
+from haiway.context.disposables import (
+    ContextDisposables,
+    Disposable,
+    DisposableRequiring,
+    Disposables,
+    DisposableState,
+)
+from haiway.context.events import ContextEvents, EventsPolicy, EventsSubscription
+from haiway.context.identifier import ContextIdentifier, unique_id
 from haiway.context.observability import (
     ContextObservability,
     Observability,
@@ -17,6 +23,7 @@ from haiway.context.observability import (
     ObservabilityTraceIdentifying,
 )
 from haiway.context.presets import ContextPresets
+from haiway.context.scope import ContextScopeTemplate
 from haiway.context.state import ContextState
 from haiway.context.types import ContextException, ContextMissing, ContextStateMissing
 
@@ -28,11 +35,14 @@ __all__ = (
     "ContextMissing",
     "ContextObservability",
     "ContextPresets",
+    "ContextScopeTemplate",
     "ContextState",
     "ContextStateMissing",
     "Disposable",
+    "DisposableRequiring",
     "DisposableState",
     "Disposables",
+    "EventsPolicy",
     "EventsSubscription",
     "Observability",
     "ObservabilityAttribute",
@@ -46,4 +56,5 @@ __all__ = (
     "ObservabilityScopeExiting",
     "ObservabilityTraceIdentifying",
     "ctx",
+    "unique_id",
 )
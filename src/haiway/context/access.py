@@ -13,11 +13,12 @@ from collections.abc import (
 )
 from contextlib import AbstractAsyncContextManager, AbstractContextManager
 from logging import Logger
+from os import PathLike
 from typing import Any, NoReturn, final, overload
 
 from haiway.attributes import State
-from haiway.context.disposables import ContextDisposables, Disposable, Disposables, DisposableState
-from haiway.context.events import ContextEvents, EventsSubscription
+from haiway.context.disposables import ContextDisposables, Disposable, Disposables
+from haiway.context.events import ContextEvents, EventsPolicy, EventsSubscription
 from haiway.context.observability import (
     ContextObservability,
     Observability,
@@ -28,7 +29,7 @@ from haiway.context.observability import (
 
 # Import after other imports to avoid circular dependencies
 from haiway.context.presets import ContextPresets, ContextPresetsRegistry
-from haiway.context.scope import ContextScope
+from haiway.context.scope import ContextScope, ContextScopeTemplate
 from haiway.context.state import ContextState
 from haiway.context.tasks import (
     BackgroundTaskGroup,
@@ -126,6 +127,7 @@ class ctx:
         disposables: Iterable[Disposable | None] | None = None,
         observability: Observability | Logger | None = None,
         isolated: bool = False,
+        profiling: PathLike[str] | str | bool = False,
     ) -> AbstractAsyncContextManager[str]:
         """
         Prepare scope context with given parameters.
@@ -175,6 +177,13 @@ class ctx:
             still flows from parent to child when the scope is entered, but updates remain local
             to the child scope. Root scope is always isolated.
 
+        profiling: PathLike[str] | str | bool = False
+            enables measuring time spent on entering and exiting the scope, including presets
+            resolution, each disposable enter and exit, state merge and waiting for tasks.
+            Measured segments are recorded as the ``scope.profile`` metric with the segment
+            path attribute. When a path is provided, segments are also appended to that file
+            in the folded stacks format accepted by flame graph tools.
+
         Returns
         -------
         AbstractAsyncContextManager[str]
@@ -192,22 +201,81 @@ class ctx:
             name = scope
             presets = None
 
-        context_disposables: Disposables
-        if disposables is None:
-            context_disposables = Disposables.of(
-                DisposableState.of(*(element for element in state if element is not None))
-            )
+        return ContextScope(
+            name=name,
+            presets=presets,
+            state=tuple(element for element in state if element is not None),
+            disposables=Disposables(disposables) if disposables is not None else None,
+            observability=observability,
+            isolated=isolated,
+            profiling=profiling,
+        )
+
+    @staticmethod
+    def scope_template(
+        scope: ContextPresets | str,
+        /,
+        *state: State | None,
+        observability: Observability | Logger | None = None,
+        isolated: bool = False,
+    ) -> ContextScopeTemplate:
+        """
+        Prepare reusable template for frequently entered scope contexts.
+
+        Template state is merged into the state of the enclosing scope once and reused
+        for as long as that state remains the same, presets selected by name are looked
+        up once for each presets registry. Each entry only merges the state provided with
+        the call and assigns a new scope identifier. It is intended for scopes entered at
+        high frequency i.e. for each handled request.
+
+        Parameters
+        ----------
+        scope: ContextPresets | str
+            Either a name of the scope context (can be associated with state presets with
+            matching name from preset registry), or a context preset to be used directly
+            within each scope context. Disposables of presets are resolved each time
+            a scope is entered.
+
+        *state: State | None
+            state propagated within each scope context, overridden by state provided
+            when calling the template.
+
+        observability: Observability | Logger | None = None
+            observability solution used by each scope context. When not provided,
+            the observability of the context the scope is entered within is reused.
+
+        isolated: bool = False
+            controls whether task and event handling of each scope context are isolated
+            from its parent scope.
+
+        Returns
+        -------
+        ContextScopeTemplate
+            template producing scope context managers when called with per scope
+            state and disposables.
+
+        Examples
+        --------
+        >>> request_scope = ctx.scope_template("request")
+        >>> async def handle(request: Request) -> None:
+        ...     async with request_scope(request):
+        ...         ...
+        """
+
+        name: str
+        presets: ContextPresets | None
+        if isinstance(scope, ContextPresets):
+            name = scope.name
+            presets = scope
 
         else:
-            context_disposables = Disposables.of(
-                *disposables,
-                DisposableState.of(*(element for element in state if element is not None)),
-            )
+            name = scope
+            presets = None
 
-        return ContextScope(
+        return ContextScopeTemplate(
             name=name,
             presets=presets,
-            disposables=context_disposables,
+            state=tuple(element for element in state if element is not None),
             observability=observability,
             isolated=isolated,
         )
@@ -503,8 +571,9 @@ class ctx:
 
         Retrieves state objects that have been propagated within the current execution context.
         State objects are automatically made available through context scopes and disposables.
-        Resolution is by exact concrete type. If no matching state is found inside a
-        scope, a default instance is created lazily when possible.
+        Resolution prefers the exact concrete type and falls back to the most recently
+        provided state which is a subclass of the requested type. If no matching state
+        is found inside a scope, a default instance is created lazily when possible.
 
         Parameters
         ----------
@@ -568,9 +637,13 @@ class ctx:
         """
         Send an event to all active subscribers within the current context.
 
-        Events are dispatched based on their exact type - subscribers must
-        subscribe to the specific State type to receive events. Only subscribers
-        that already exist receive the event.
+        Events are dispatched to subscribers of their type and of its base classes,
+        and to subscribers of enclosing isolated scopes which opted into nested events.
+        Only subscribers that already exist receive the event.
+
+        Sending is thread-safe. Events sent from other threads or event loops are
+        handed over to the loop owning the event bus, many sends are dispatched
+        together within a single wakeup of that loop.
 
         Parameters
         ----------
@@ -600,21 +673,58 @@ class ctx:
         """
         ContextEvents.send(event)
 
+    @staticmethod
+    async def deliver(
+        event: State,
+        /,
+    ) -> None:
+        """
+        Send an event waiting until bounded subscriptions are able to accept it.
+
+        Works like ``ctx.send`` but waits for room in buffers of subscriptions
+        using the ``"block"`` policy, applying back-pressure to the sender.
+
+        Parameters
+        ----------
+        event : State
+            The event payload to send. Must be a State instance.
+
+        Raises
+        ------
+        ContextMissing
+            If no event bus is installed in the current scope.
+        """
+        await ContextEvents.deliver(event)
+
     @staticmethod
     def subscribe[Event: State](
         event: type[Event],
+        *,
+        capacity: int | None = None,
+        policy: EventsPolicy = "drop_oldest",
+        predicate: Callable[[Event], bool] | None = None,
+        nested: bool = False,
     ) -> EventsSubscription[Event]:
         """
         Subscribe to events of a specific type within the current context.
 
-        Creates a subscription that receives all events of the specified type
-        sent after the subscription is created. Delivery is FIFO for a given event
-        type within the current scope and event loop.
+        Creates a subscription that receives all events of the specified type,
+        including its subclasses, sent after the subscription is created. Delivery
+        is FIFO for a given event type within the current scope and event loop.
 
         Parameters
         ----------
         event : type[Event]
             The State type to subscribe to. Must be a State class.
+        capacity : int | None, default=None
+            Maximum number of events buffered for this subscription. Unbounded
+            subscriptions keep all events which were not consumed yet.
+        policy : EventsPolicy, default="drop_oldest"
+            Policy applied when the buffer of a bounded subscription is full.
+        predicate : Callable[[Event], bool] | None, default=None
+            Optional filter, only events matching it are delivered.
+        nested : bool, default=False
+            Receive also events sent within nested isolated scopes.
 
         Returns
         -------
@@ -656,7 +766,13 @@ class ctx:
         ctx.send : For sending events
         EventsSubscription : The subscription iterator
         """
-        return ContextEvents.subscribe(event)
+        return ContextEvents.subscribe(
+            event,
+            capacity=capacity,
+            policy=policy,
+            predicate=predicate,
+            nested=nested,
+        )
 
     @staticmethod
     def log_error(
@@ -1,14 +1,19 @@
 from asyncio import CancelledError, gather
-from collections.abc import Collection, Generator, Iterable, Iterator, MutableSequence, Sequence
+from collections.abc import Collection, Generator, Iterable, MutableSequence, Sequence
+from time import perf_counter
 from types import TracebackType
 from typing import Any, NoReturn, Protocol, Self, cast, final, runtime_checkable
 
 from haiway.attributes import State
+from haiway.context.observability import ContextObservability, ObservabilityLevel
+from haiway.context.profiling import ContextProfiling
 from haiway.context.state import ContextState
+from haiway.context.types import ContextStateMissing
 
 __all__ = (
     "ContextDisposables",
     "Disposable",
+    "DisposableRequiring",
     "DisposableState",
     "Disposables",
 )
@@ -77,6 +82,53 @@ class DisposableState:
         pass  # nothing to dispose
 
 
+@final  # consider immutable
+class DisposableRequiring:
+    """
+    Disposable entered only after states it requires become available.
+
+    Wraps other disposable declaring state types it depends on. ``Disposables``
+    enter it after disposables producing the required states were entered, with
+    the produced states available through ``ctx.state`` while entering, and
+    exit it before exiting them. Requirements already available in the current
+    context are satisfied right away, unless other disposable declares that it
+    ``provides`` the required state.
+    """
+
+    __slots__ = (
+        "_disposable",
+        "provides",
+        "requires",
+    )
+
+    def __init__(
+        self,
+        disposable: Disposable,
+        /,
+        *,
+        requires: Collection[type[State]] = (),
+        provides: Collection[type[State]] = (),
+    ) -> None:
+        self._disposable: Disposable = disposable
+        self.requires: Collection[type[State]] = requires
+        self.provides: Collection[type[State]] = provides
+
+    async def __aenter__(self) -> Iterable[State] | State:
+        return await self._disposable.__aenter__()
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        await self._disposable.__aexit__(
+            exc_type,
+            exc_val,
+            exc_tb,
+        )
+
+
 @final  # consider immutable
 class Disposables:
     @classmethod
@@ -88,7 +140,7 @@ class Disposables:
 
     __slots__ = (
         "_disposables",
-        "_status",
+        "_entered",
     )
 
     def __init__(
@@ -99,25 +151,94 @@ class Disposables:
         self._disposables: Collection[Disposable] = tuple(
             disposable for disposable in disposables if disposable is not None
         )
-        self._status: bool = False  # TODO: to be converted to status tracking of partial success
-
-    async def __aenter__(self) -> Iterator[State]:
-        assert self._status is False  # nosec: B101
+        # disposables entered within consecutive waves, None when not entered
+        self._entered: MutableSequence[Sequence[Disposable]] | None = None
+
+    async def __aenter__(self) -> Sequence[State]:
+        assert self._entered is None  # nosec: B101
+        self._entered = []
+        produced: MutableSequence[State] = []
+        # types of produced states including their bases to satisfy requirements
+        available: set[type[Any]] = set()
+        pending: Sequence[Disposable] = tuple(self._disposables)
         try:
-            return _collect_state(
-                await gather(
-                    *(disposable.__aenter__() for disposable in self._disposables),
-                    return_exceptions=True,
+            while pending:  # enter disposables in waves of ones with requirements available
+                # types still to be provided by pending disposables including their bases
+                awaited: set[type[Any]] = {
+                    base
+                    for disposable in pending
+                    for provided in _provisions(disposable)
+                    for base in provided.__mro__
+                }
+                wave: Sequence[Disposable] = tuple(
+                    disposable
+                    for disposable in pending
+                    if all(
+                        required in available
+                        # use current context unless a pending disposable provides it
+                        or (required not in awaited and ContextState.contains(required))
+                        for required in _requirements(disposable)
+                    )
                 )
-            )
+                if not wave:
+                    raise ContextStateMissing(
+                        "Disposables requirements can't be satisfied for: "
+                        + ", ".join(_name(disposable) for disposable in pending)
+                    )
+
+                started: set[int] = {id(disposable) for disposable in wave}
+                pending = tuple(
+                    disposable for disposable in pending if id(disposable) not in started
+                )
+                entered: MutableSequence[Disposable] = []
+                self._entered.append(entered)
+                results: Sequence[BaseException | Iterable[State] | State]
+                if produced:  # make already produced state available for requiring disposables
+                    with ContextState.updating(produced):
+                        results = await _enter_wave(wave, entered=entered)
+
+                else:
+                    results = await _enter_wave(wave, entered=entered)
+
+                for state in _collect_state(results):
+                    produced.append(state)
+                    available.update(type(state).__mro__)
 
-        except BaseException:
-            # TODO: FIXME: dispose only those which succeeded
+        except BaseException as exc:
+            # dispose only those which succeeded
+            await self._rollback(exc)
+            raise  # reraise original exception
 
-            raise  # reraise exception
+        return produced
+
+    async def _rollback(
+        self,
+        exception: BaseException,
+    ) -> None:
+        assert self._entered is not None  # nosec: B101
+        try:
+            for wave in reversed(self._entered):
+                results: Sequence[BaseException | None] = await gather(
+                    *(
+                        disposable.__aexit__(
+                            type(exception),
+                            exception,
+                            exception.__traceback__,
+                        )
+                        for disposable in wave
+                    ),
+                    return_exceptions=True,
+                )
+                for result in results:
+                    if isinstance(result, BaseException):
+                        ContextObservability.record_log(
+                            ObservabilityLevel.ERROR,
+                            "Disposables rollback failed",
+                            exception=result,
+                        )
 
         finally:
-            self._status = True
+            self._entered = None
 
     async def __aexit__(
         self,
@@ -125,20 +246,19 @@ class Disposables:
         exc_val: BaseException | None,
         exc_tb: TracebackType | None,
     ) -> None:
-        assert self._status is True  # nosec: B101
+        assert self._entered is not None  # nosec: B101
         try:
-            results: Iterable[BaseException | None] = await gather(
-                *(
-                    disposable.__aexit__(exc_type, exc_val, exc_tb)
-                    for disposable in self._disposables
-                ),
-                return_exceptions=True,
-            )
-
             exceptions: MutableSequence[BaseException] = []
-            for result in results:
-                if isinstance(result, BaseException):
-                    exceptions.append(result)
+            # exit requiring disposables before ones producing their requirements
+            for wave in reversed(self._entered):
+                results: Iterable[BaseException | None] = await gather(
+                    *(_exit(disposable, exc_type, exc_val, exc_tb) for disposable in wave),
+                    return_exceptions=True,
+                )
+
+                for result in results:
+                    if isinstance(result, BaseException):
+                        exceptions.append(result)
 
             if not exceptions:
                 return  # no errors
@@ -158,13 +278,13 @@ class Disposables:
             raise BaseExceptionGroup("Disposables disposal errors", exceptions)
 
         finally:
-            self._status = False
+            self._entered = None
 
     def extended(
         self,
         *disposables: Disposable,
     ) -> Self:
-        assert self._status is False  # nosec: B101
+        assert self._entered is None  # nosec: B101
 
         if not disposables:
             return self
@@ -175,6 +295,86 @@ class Disposables:
         return len(self._disposables) > 0
 
 
+def _requirements(
+    disposable: Disposable,
+) -> Collection[type[State]]:
+    if isinstance(disposable, DisposableRequiring):
+        return disposable.requires
+
+    return ()
+
+
+def _provisions(
+    disposable: Disposable,
+) -> Collection[type[State]]:
+    if isinstance(disposable, DisposableRequiring):
+        return disposable.provides
+
+    return ()
+
+
+def _name(
+    disposable: Disposable,
+) -> str:
+    if isinstance(disposable, DisposableRequiring):
+        return _name(disposable._disposable)  # pyright: ignore[reportPrivateUsage]
+
+    # use name of the function for disposables made with contextlib decorators
+    function: Any = getattr(disposable, "func", None)
+    if function is not None:
+        return getattr(function, "__qualname__", type(disposable).__qualname__)
+
+    return type(disposable).__qualname__
+
+
+async def _enter_wave(
+    wave: Sequence[Disposable],
+    *,
+    entered: MutableSequence[Disposable],
+) -> Sequence[BaseException | Iterable[State] | State]:
+    return await gather(
+        *(_enter(disposable, entered=entered) for disposable in wave),
+        return_exceptions=True,
+    )
+
+
+async def _enter(
+    disposable: Disposable,
+    *,
+    entered: MutableSequence[Disposable],
+) -> Iterable[State] | State:
+    name: str = _name(disposable)
+    start: float = perf_counter()
+    result: Iterable[State] | State
+    with ContextProfiling.measure(name):
+        result = await disposable.__aenter__()
+
+    entered.append(disposable)  # track as entered as soon as possible
+    ContextObservability.record_metric(
+        ObservabilityLevel.DEBUG,
+        "disposable.startup",
+        value=perf_counter() - start,
+        unit="s",
+        kind="histogram",
+        attributes={"disposable": name},
+    )
+    return result
+
+
+async def _exit(
+    disposable: Disposable,
+    exc_type: type[BaseException] | None,
+    exc_val: BaseException | None,
+    exc_tb: TracebackType | None,
+) -> None:
+    with ContextProfiling.measure(_name(disposable)):
+        await disposable.__aexit__(
+            exc_type,
+            exc_val,
+            exc_tb,
+        )
+
+
 def _collect_state(
     results: Sequence[BaseException | Iterable[State] | State],
 ) -> Generator[State]:
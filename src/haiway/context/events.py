@@ -1,21 +1,43 @@
-from asyncio import AbstractEventLoop, Future, InvalidStateError, get_running_loop
-from collections.abc import AsyncIterator, MutableMapping
+from asyncio import (
+    AbstractEventLoop,
+    Future,
+    InvalidStateError,
+    get_running_loop,
+    run_coroutine_threadsafe,
+    wrap_future,
+)
+from collections import deque
+from collections.abc import AsyncIterator, Callable, MutableMapping, Sequence
 from contextvars import ContextVar, Token
+from threading import Lock
 from types import TracebackType
-from typing import Any, ClassVar, Self, final
+from typing import Any, ClassVar, Literal, Self, final
+from weakref import WeakSet
 
 from haiway.attributes import State
 from haiway.context.types import ContextMissing
 
 __all__ = (
     "ContextEvents",
+    "EventsPolicy",
     "EventsSubscription",
 )
 
+type EventsPolicy = Literal["drop_oldest", "drop_newest", "block", "coalesce"]
+"""
+Policy applied when a bounded subscription buffer is full.
+
+- ``"drop_oldest"`` removes the oldest buffered event to make room for the new one
+- ``"drop_newest"`` discards the new event keeping the buffer unchanged
+- ``"block"`` makes ``ctx.deliver`` wait for room, ``ctx.send`` can't wait and buffers anyway
+- ``"coalesce"`` discards all buffered events keeping only the new one
+"""
+
 
 @final  # consider immutable
 class Event[Payload: State]:
     __slots__ = (
+        "index",
         "next",
         "payload",
     )
@@ -23,26 +45,349 @@ class Event[Payload: State]:
     def __init__(
         self,
         payload: Payload,
+        index: int,
         next: Future[Self],  # noqa: A002
     ) -> None:
         self.payload: Payload = payload
+        self.index: int = index
         self.next: Future[Self] = next
 
 
+@final
+class EventsBuffer[Payload: State]:
+    # events buffered for a single bounded subscription
+    __slots__ = (
+        "__weakref__",
+        "_capacity",
+        "_closed",
+        "_loop",
+        "_policy",
+        "_predicate",
+        "_queue",
+        "_space",
+        "_waiting",
+        "dropped",
+    )
+
+    def __init__(
+        self,
+        capacity: int,
+        policy: EventsPolicy,
+        predicate: Callable[[Payload], bool] | None,
+        loop: AbstractEventLoop,
+    ) -> None:
+        self._capacity: int = capacity
+        self._policy: EventsPolicy = policy
+        self._predicate: Callable[[Payload], bool] | None = predicate
+        self._loop: AbstractEventLoop = loop
+        self._queue: deque[Payload] = deque()
+        self._waiting: Future[Payload] | None = None
+        self._space: Future[None] | None = None
+        self._closed: bool = False
+        self.dropped: int = 0
+
+    @property
+    def pending(self) -> int:
+        return len(self._queue)
+
+    @property
+    def is_full(self) -> bool:
+        return self._policy == "block" and len(self._queue) >= self._capacity
+
+    def push(
+        self,
+        payload: Payload,
+    ) -> None:
+        if self._closed:
+            return  # ignore events after closing
+
+        if self._predicate is not None and not self._predicate(payload):
+            return  # filtered out events are not counted as dropped
+
+        if self._waiting is not None and not self._waiting.done():
+            self._waiting.set_result(payload)  # deliver directly to waiting consumer
+            return
+
+        if len(self._queue) < self._capacity:
+            self._queue.append(payload)
+            return
+
+        match self._policy:
+            case "drop_oldest":
+                self._queue.popleft()
+                self._queue.append(payload)
+                self.dropped += 1
+
+            case "drop_newest":
+                self.dropped += 1
+
+            case "coalesce":
+                self.dropped += len(self._queue)
+                self._queue.clear()
+                self._queue.append(payload)
+
+            case "block":  # sender was not able to wait, buffer anyway
+                self._queue.append(payload)
+
+    async def wait_space(self) -> None:
+        while self.is_full and not self._closed:
+            if self._space is None or self._space.done():
+                self._space = self._loop.create_future()
+
+            await self._space
+
+    async def next(self) -> Payload:
+        assert self._waiting is None, "Only a single subscription consumer is supported!"  # nosec: B101
+
+        if self._queue:
+            payload: Payload = self._queue.popleft()
+            if self._space is not None and not self._space.done():
+                self._space.set_result(None)  # wake up waiting senders
+
+            return payload
+
+        if self._closed:
+            raise StopAsyncIteration()
+
+        try:
+            self._waiting = self._loop.create_future()
+            return await self._waiting
+
+        finally:
+            self._waiting = None
+
+    def close(self) -> None:
+        self._closed = True
+        if self._waiting is not None and not self._waiting.done():
+            self._waiting.set_exception(StopAsyncIteration())
+
+        if self._space is not None and not self._space.done():
+            self._space.set_result(None)  # release waiting senders
+
+
 @final  # consider immutable
 class EventsSubscription[Payload: State](AsyncIterator[Payload]):
-    __slots__ = ("_future_event",)
+    """
+    Asynchronous iterator over events of a State type and its subclasses.
+
+    Unbounded subscriptions share the chain of sent events with other subscriptions
+    of the same type and keep every event they did not consume yet. Bounded
+    subscriptions buffer at most ``capacity`` events on their own and apply
+    their ``EventsPolicy`` when the buffer is full.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_channels",
+        "_future_event",
+        "_payload",
+        "_predicate",
+        "_received",
+    )
 
     def __init__(
         self,
-        future_event: Future[Event[Payload]],
+        future_event: Future[Event[Payload]] | None,
+        *,
+        buffer: EventsBuffer[Payload] | None = None,
+        channels: EventsChannels | None = None,
+        payload: type[Payload] | None = None,
+        predicate: Callable[[Payload], bool] | None = None,
+        received: int = 0,
     ) -> None:
-        self._future_event: Future[Event[Payload]] = future_event
+        self._future_event: Future[Event[Payload]] | None = future_event
+        self._buffer: EventsBuffer[Payload] | None = buffer
+        self._channels: EventsChannels | None = channels
+        self._payload: type[Payload] | None = payload
+        self._predicate: Callable[[Payload], bool] | None = predicate
+        self._received: int = received
+
+    @property
+    def lag(self) -> int:
+        """
+        Number of events sent to this subscription and not consumed yet.
+
+        Unbounded subscriptions using a predicate count events before filtering.
+        """
+        if self._buffer is not None:
+            return self._buffer.pending
+
+        if self._channels is None or self._payload is None:
+            return 0
+
+        return self._channels.sent(self._payload) - self._received
+
+    @property
+    def dropped(self) -> int:
+        """
+        Number of events dropped or coalesced due to the buffer capacity.
+        """
+        if self._buffer is not None:
+            return self._buffer.dropped
+
+        return 0  # unbounded subscriptions never drop
 
     async def __anext__(self) -> Payload:
-        event: Event[Payload] = await self._future_event
-        self._future_event = event.next
-        return event.payload
+        if self._buffer is not None:
+            return await self._buffer.next()
+
+        assert self._future_event is not None  # nosec: B101
+        while True:
+            event: Event[Payload] = await self._future_event
+            self._future_event = event.next
+            self._received = event.index + 1
+            if self._predicate is None or self._predicate(event.payload):
+                return event.payload
+
+
+@final
+class EventsChannels:
+    # subscriptions of a single bus keyed by subscribed types
+    __slots__ = (
+        "_buffers",
+        "_loop",
+        "_routes",
+        "_sent",
+        "_threads",
+    )
+
+    def __init__(
+        self,
+        loop: AbstractEventLoop,
+    ) -> None:
+        self._loop: AbstractEventLoop = loop
+        self._threads: MutableMapping[type[State], Future[Event[Any]]] = {}
+        # bounded subscriptions are referenced weakly, abandoned ones are dropped with their buffer
+        self._buffers: MutableMapping[type[State], WeakSet[EventsBuffer[Any]]] = {}
+        # number of events sent to unbounded subscriptions, used to compute their lag
+        self._sent: MutableMapping[type[State], int] = {}
+        # subscribed types matching each sent payload type, precomputed from its MRO
+        self._routes: MutableMapping[type[State], Sequence[type[State]]] = {}
+
+    def sent(
+        self,
+        payload: type[State],
+    ) -> int:
+        return self._sent.get(payload, 0)
+
+    def _route(
+        self,
+        payload: type[State],
+    ) -> Sequence[type[State]]:
+        routes: Sequence[type[State]] | None = self._routes.get(payload)
+        if routes is None:
+            routes = tuple(
+                base for base in payload.__mro__ if base in self._threads or base in self._buffers
+            )
+            self._routes[payload] = routes
+
+        return routes
+
+    def dispatch(
+        self,
+        payload: State,
+    ) -> None:
+        for route in self._route(type(payload)):
+            buffers: WeakSet[EventsBuffer[Any]] | None = self._buffers.get(route)
+            if buffers is not None:
+                if buffers:
+                    for buffer in buffers:
+                        buffer.push(payload)
+
+                else:  # all bounded subscriptions are gone
+                    del self._buffers[route]
+                    self._routes.clear()
+
+            current: Future[Event[State]] | None = self._threads.get(route)
+            if current is None:
+                continue  # no unbounded subscriptions
+
+            assert not current.done()  # nosec: B101
+
+            index: int = self._sent.get(route, 0)
+            event: Event[State] = Event(
+                payload=payload,
+                index=index,
+                next=self._loop.create_future(),
+            )
+            self._threads[route] = event.next
+            self._sent[route] = index + 1
+            current.set_result(event)
+
+    def full_buffer(
+        self,
+        payload: type[State],
+    ) -> EventsBuffer[Any] | None:
+        for route in self._route(payload):
+            for buffer in self._buffers.get(route, ()):
+                if buffer.is_full:
+                    return buffer
+
+        return None
+
+    def subscribe[Payload: State](
+        self,
+        payload: type[Payload],
+        *,
+        capacity: int | None,
+        policy: EventsPolicy,
+        predicate: Callable[[Payload], bool] | None,
+    ) -> EventsSubscription[Payload]:
+        if payload not in self._threads and payload not in self._buffers:
+            self._routes.clear()  # new subscribed type changes routes
+
+        if capacity is not None:
+            assert capacity > 0  # nosec: B101
+            buffer: EventsBuffer[Payload] = EventsBuffer(
+                capacity=capacity,
+                policy=policy,
+                predicate=predicate,
+                loop=self._loop,
+            )
+            buffers: WeakSet[EventsBuffer[Any]] | None = self._buffers.get(payload)
+            if buffers is None:
+                buffers = WeakSet()
+                self._buffers[payload] = buffers
+
+            buffers.add(buffer)
+            return EventsSubscription(
+                future_event=None,
+                buffer=buffer,
+            )
+
+        current: Future[Event[Payload]] | None = self._threads.get(payload)
+        if current is None:  # prepare for upcoming events
+            current = self._loop.create_future()
+            self._threads[payload] = current
+
+        return EventsSubscription(
+            future_event=current,
+            channels=self,
+            payload=payload,
+            predicate=predicate,
+            received=self._sent.get(payload, 0),
+        )
+
+    def close(self) -> None:
+        for future in tuple(self._threads.values()):
+            if future.done():
+                continue
+
+            # end all incomplete futures
+            try:
+                future.set_exception(StopAsyncIteration())
+
+            except InvalidStateError:
+                pass  # Already done by concurrent send
+
+        for buffers in tuple(self._buffers.values()):
+            for buffer in tuple(buffers):
+                buffer.close()
+
+        # Clear all references to allow garbage collection
+        self._threads.clear()
+        self._buffers.clear()
+        self._routes.clear()
 
 
 @final  # consider immutable
@@ -58,14 +403,49 @@ class ContextEvents:
         except LookupError:
             raise ContextMissing("ContextEvents requested but not defined!") from None
 
+    @classmethod
+    async def deliver(
+        cls,
+        event: State,
+    ) -> None:
+        try:
+            events: ContextEvents = cls._context.get()
+
+        except LookupError:
+            raise ContextMissing("ContextEvents requested but not defined!") from None
+
+        if get_running_loop() is events._loop:
+            await events._wait_space(type(event))
+
+        else:  # wait within the owning loop when delivering from other loop
+            await wrap_future(
+                run_coroutine_threadsafe(
+                    events._wait_space(type(event)),
+                    events._loop,
+                )
+            )
+
+        events._send(event)
+
     @classmethod
     def subscribe[Event: State](
         cls,
         event: type[Event],
         /,
+        *,
+        capacity: int | None = None,
+        policy: EventsPolicy = "drop_oldest",
+        predicate: Callable[[Event], bool] | None = None,
+        nested: bool = False,
     ) -> EventsSubscription[Event]:
         try:
-            return cls._context.get()._subscribe(event)
+            return cls._context.get()._subscribe(
+                event,
+                capacity=capacity,
+                policy=policy,
+                predicate=predicate,
+                nested=nested,
+            )
 
         except LookupError:
             raise ContextMissing("ContextEvents requested but not defined!") from None
@@ -73,8 +453,13 @@ class ContextEvents:
     _context: ClassVar[ContextVar[Self]] = ContextVar("ContextEvents")
 
     __slots__ = (
+        "_ancestors",
+        "_local",
         "_loop",
-        "_threads",
+        "_nested",
+        "_pending",
+        "_pending_lock",
+        "_pending_scheduled",
         "_token",
     )
 
@@ -83,59 +468,124 @@ class ContextEvents:
         loop: AbstractEventLoop,
     ) -> None:
         self._loop: AbstractEventLoop = loop
-        self._threads: MutableMapping[type[State], Future[Event[Any]]] = {}
+        # subscriptions receiving events sent within this bus only
+        self._local: EventsChannels = EventsChannels(loop=loop)
+        # subscriptions receiving also events sent within buses of nested isolated scopes
+        self._nested: EventsChannels = EventsChannels(loop=loop)
+        # buses of enclosing isolated scopes, resolved when entering
+        self._ancestors: Sequence[ContextEvents] = ()
+        # events sent from other threads or loops waiting for dispatch within the owning loop
+        self._pending: list[State] = []
+        self._pending_lock: Lock = Lock()
+        self._pending_scheduled: bool = False
         self._token: Token[ContextEvents] | None = None
 
     def _send(
         self,
         payload: State,
+    ) -> None:
+        running: AbstractEventLoop | None
+        try:
+            running = get_running_loop()
+
+        except RuntimeError:
+            running = None  # sending from a thread without event loop
+
+        if running is self._loop:
+            self._dispatch(payload)
+
+        else:
+            self._send_threadsafe(payload)
+
+    def _send_threadsafe(
+        self,
+        payload: State,
+    ) -> None:
+        with self._pending_lock:
+            self._pending.append(payload)
+            if self._pending_scheduled:
+                return  # already scheduled flush will dispatch this event as well
+
+            self._pending_scheduled = True
+
+        try:  # schedule a single wakeup of the owning loop for all pending events
+            self._loop.call_soon_threadsafe(self._flush_pending)
+
+        except RuntimeError:  # owning loop is already closed, events can't be delivered
+            with self._pending_lock:
+                self._pending.clear()
+                self._pending_scheduled = False
+
+    def _flush_pending(self) -> None:
+        with self._pending_lock:
+            pending: list[State] = self._pending
+            self._pending = []
+            self._pending_scheduled = False
+
+        for payload in pending:
+            self._dispatch(payload)
+
+    def _dispatch(
+        self,
+        payload: State,
+    ) -> None:
+        self._local.dispatch(payload)
+        self._nested.dispatch(payload)
+        for ancestor in self._ancestors:
+            if ancestor._loop is self._loop:
+                ancestor._nested.dispatch(payload)
+
+            else:  # ancestor might be owned by other loop
+                try:
+                    ancestor._loop.call_soon_threadsafe(ancestor._nested.dispatch, payload)
+
+                except RuntimeError:
+                    pass  # ancestor loop is already closed
+
+    async def _wait_space(
+        self,
+        payload: type[State],
     ) -> None:
         assert self._loop == get_running_loop()  # nosec: B101
 
-        payload_type: type[State] = type(payload)
-        current: Future[Event[State]] | None = self._threads.get(payload_type)
-        if current is None:
-            return  # if no one watches, no need to send anywhere
+        while True:  # other senders may fill buffers again while waiting
+            full: EventsBuffer[Any] | None = self._local.full_buffer(payload)
+            if full is None:
+                full = self._nested.full_buffer(payload)
 
-        assert not current.done()  # nosec: B101
+            if full is None:
+                return  # all buffers have room
 
-        event: Event[State] = Event(
-            payload=payload,
-            next=self._loop.create_future(),
-        )
-        self._threads[payload_type] = event.next
-        current.set_result(event)
+            await full.wait_space()
 
     def _subscribe[Payload: State](
         self,
         payload: type[Payload],
+        *,
+        capacity: int | None,
+        policy: EventsPolicy,
+        predicate: Callable[[Payload], bool] | None,
+        nested: bool,
     ) -> EventsSubscription[Payload]:
         assert self._loop == get_running_loop()  # nosec: B101
 
-        current: Future[Event[Payload]] | None = self._threads.get(payload)
-        if current is None:  # prepare for upcoming events
-            current = self._loop.create_future()
-            self._threads[payload] = current
-
-        return EventsSubscription(future_event=current)
+        return (self._nested if nested else self._local).subscribe(
+            payload,
+            capacity=capacity,
+            policy=policy,
+            predicate=predicate,
+        )
 
     def _close(self) -> None:
-        for future in tuple(self._threads.values()):
-            if future.done():
-                continue
-
-            # end all incomplete futures
-            try:
-                future.set_exception(StopAsyncIteration())
-
-            except InvalidStateError:
-                pass  # Already done by concurrent send
-
-        # Clear all references to allow garbage collection
-        self._threads.clear()
+        self._local.close()
+        self._nested.close()
 
     async def __aenter__(self) -> None:
         assert self._token is None, "Context reentrance is not allowed"  # nosec: B101
+        parent: ContextEvents | None = ContextEvents._context.get(None)
+        if parent is not None:
+            self._ancestors = (parent, *parent._ancestors)
+
         self._token = ContextEvents._context.set(self)
 
     async def __aexit__(
@@ -149,6 +599,7 @@ class ContextEvents:
         try:
             ContextEvents._context.reset(self._token)
             self._close()
+            self._ancestors = ()
 
         finally:
             self._token = None
@@ -1,11 +1,63 @@
+import os
+import sys
+from collections.abc import Iterator
 from contextvars import ContextVar, Token
+from itertools import count
+from os import urandom
 from types import TracebackType
-from typing import Any, ClassVar, Self, final
-from uuid import UUID, uuid4
+from typing import Any, ClassVar, Final, Self, final
+from uuid import UUID
 
 from haiway.context.types import ContextMissing
 
-__all__ = ("ContextIdentifier",)
+__all__ = (
+    "ContextIdentifier",
+    "unique_id",
+)
+
+
+def unique_id() -> UUID:
+    """
+    Generate a unique identifier without requesting system randomness each time.
+
+    Identifiers combine a random prefix drawn once per process with a monotonic
+    counter and are formatted as version 4 UUIDs. They are unique within the process
+    and across processes with overwhelming probability but, unlike ``uuid4``, they
+    are predictable and must not be used as secrets.
+
+    Returns
+    -------
+    UUID
+        New identifier, its ``hex`` representation is a valid W3C trace id.
+    """
+    return UUID(int=_SOURCE.prefix | (next(_SOURCE.counter) & _COUNTER_MASK))
+
+
+@final
+class _IdentifierSource:
+    __slots__ = ("counter", "prefix")
+
+    def __init__(self) -> None:
+        self.prefix: int = _random_prefix()
+        self.counter: Iterator[int] = count()
+
+    def reseed(self) -> None:
+        # forked processes share the parent prefix, draw a new one to keep identifiers unique
+        self.prefix = _random_prefix()
+
+
+def _random_prefix() -> int:
+    # random upper half with version 4 bits, lower half carries the variant and counter
+    return ((int.from_bytes(urandom(8)) << 64) & ~_VERSION_MASK) | _VERSION_BITS | _VARIANT_BITS
+
+
+_VERSION_MASK: Final[int] = 0xF << 76
+_VERSION_BITS: Final[int] = 0x4 << 76
+_VARIANT_BITS: Final[int] = 0x2 << 62
+_COUNTER_MASK: Final[int] = (1 << 62) - 1
+_SOURCE: Final[_IdentifierSource] = _IdentifierSource()
+if sys.platform != "win32":  # fork is not available on windows
+    os.register_at_fork(after_in_child=_SOURCE.reseed)
 
 
 @final  # consider immutable
@@ -27,30 +79,31 @@ class ContextIdentifier:
         name: str,
         /,
     ) -> Self:
+        # identifiers are generated lazily, many scopes never need them
+        identifier: Self = object.__new__(cls)
+        identifier.name = name
+        identifier._scope_id = None
+        identifier._parent_id = None
+        identifier._unique_name = None
+        identifier._token = None
         try:  # check for current scope
-            return cls(
-                name=name,
-                scope_id=uuid4(),
-                # create nested scope
-                parent_id=cls._context.get().scope_id,
-            )
+            # create nested scope
+            identifier._parent = cls._context.get()
 
         except LookupError:  # create root scope when missing
-            scope_id: UUID = uuid4()
-            return cls(
-                name=name,
-                scope_id=scope_id,
-                parent_id=scope_id,  # own id is parent_id for root
-            )
+            identifier._parent = None
+
+        return identifier
 
     _context: ClassVar[ContextVar[Self]] = ContextVar("ContextIdentifier")
 
     __slots__ = (
+        "_parent",
+        "_parent_id",
+        "_scope_id",
         "_token",
+        "_unique_name",
         "name",
-        "parent_id",
-        "scope_id",
-        "unique_name",
     )
 
     def __init__(
@@ -59,15 +112,41 @@ class ContextIdentifier:
         scope_id: UUID,
         name: str,
     ) -> None:
-        self.parent_id: UUID = parent_id
-        self.scope_id: UUID = scope_id
         self.name: str = name
-        self.unique_name: str = f"[{name}] [{scope_id}]"
+        self._scope_id: UUID | None = scope_id
+        self._parent_id: UUID | None = parent_id
+        self._parent: ContextIdentifier | None = None
+        self._unique_name: str | None = None
         self._token: Token[ContextIdentifier] | None = None
 
+    @property
+    def scope_id(self) -> UUID:
+        if self._scope_id is None:
+            self._scope_id = unique_id()
+
+        return self._scope_id
+
+    @property
+    def parent_id(self) -> UUID:
+        if self._parent_id is None:
+            # own id is parent_id for root
+            self._parent_id = self.scope_id if self._parent is None else self._parent.scope_id
+
+        return self._parent_id
+
+    @property
+    def unique_name(self) -> str:
+        if self._unique_name is None:
+            self._unique_name = f"[{self.name}] [{self.scope_id}]"
+
+        return self._unique_name
+
     @property
     def is_root(self) -> bool:
-        return self.scope_id == self.parent_id
+        if self._parent is not None:
+            return False
+
+        return self._parent_id is None or self._parent_id == self._scope_id
 
     def __str__(self) -> str:
         return self.unique_name
@@ -8,9 +8,9 @@ from logging import WARNING as WARNING_LOGGING
 from logging import Logger, getLogger
 from types import TracebackType
 from typing import Any, ClassVar, Literal, NoReturn, Protocol, Self, final, runtime_checkable
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from haiway.context.identifier import ContextIdentifier
+from haiway.context.identifier import ContextIdentifier, unique_id
 from haiway.context.types import ContextMissing
 from haiway.types import Missing
 from haiway.utils.formatting import format_str
@@ -234,7 +234,7 @@ def _logger_observability(  # noqa: C901
     logger: Logger,
     /,
 ) -> Observability:
-    trace_id: UUID = uuid4()
+    trace_id: UUID = unique_id()
     trace_id_hex: str = str(trace_id)
 
     def trace_identifying(
@@ -316,10 +316,12 @@ def _logger_observability(  # noqa: C901
         scope: ContextIdentifier,
         /,
     ) -> str:
-        logger.log(
-            ObservabilityLevel.DEBUG,
-            f"[{trace_id_hex}] {scope.unique_name} Entering scope: {scope.name}",
-        )
+        if logger.isEnabledFor(ObservabilityLevel.DEBUG):  # avoid formatting scope identifiers
+            logger.log(
+                ObservabilityLevel.DEBUG,
+                f"[{trace_id_hex}] {scope.unique_name} Entering scope: {scope.name}",
+            )
+
         return trace_id_hex
 
     def scope_exiting(
@@ -328,11 +330,12 @@ def _logger_observability(  # noqa: C901
         *,
         exception: BaseException | None,
     ) -> None:
-        logger.log(
-            ObservabilityLevel.DEBUG,
-            f"[{trace_id_hex}] {scope.unique_name} Exiting scope: {scope.name}",
-            exc_info=exception,
-        )
+        if logger.isEnabledFor(ObservabilityLevel.DEBUG):  # avoid formatting scope identifiers
+            logger.log(
+                ObservabilityLevel.DEBUG,
+                f"[{trace_id_hex}] {scope.unique_name} Exiting scope: {scope.name}",
+                exc_info=exception,
+            )
 
         if isinstance(exception, Exception):
             logger.log(
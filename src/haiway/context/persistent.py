@@ -0,0 +1,331 @@
+from collections.abc import Hashable, Iterable, Iterator, Mapping
+from typing import Any, Final, NoReturn, Self, final
+
+__all__ = ("PersistentMap",)
+
+
+@final  # immutable
+class PersistentMap[Key: Hashable, Value](Mapping[Key, Value]):
+    """
+    Immutable mapping sharing structure between its versions.
+
+    Entries are stored in a hash array mapped trie, updates copy only the path
+    leading to the changed entry leaving all other nodes shared with the source
+    mapping. Both lookups and updates are O(log32 n).
+    """
+
+    __slots__ = ("_length", "_root")
+
+    def __init__(
+        self,
+        elements: Iterable[tuple[Key, Value]] = (),
+        /,
+    ) -> None:
+        root: _Node = _EMPTY_NODE
+        length: int = 0
+        for key, value in elements:
+            root, added = _assoc(root, _key_hash(key), key, value, 0)
+            length += added
+
+        self._root: _Node
+        object.__setattr__(
+            self,
+            "_root",
+            root,
+        )
+        self._length: int
+        object.__setattr__(
+            self,
+            "_length",
+            length,
+        )
+
+    def updating(
+        self,
+        elements: Iterable[tuple[Key, Value]],
+        /,
+    ) -> Self:
+        """
+        Prepare a copy of this mapping with provided entries added or replaced.
+
+        Parameters
+        ----------
+        elements : Iterable[tuple[Key, Value]]
+            Key and value pairs to store, later pairs replace earlier ones.
+
+        Returns
+        -------
+        Self
+            Updated mapping, or this mapping when nothing has changed.
+        """
+        root: _Node = self._root
+        length: int = self._length
+        for key, value in elements:
+            root, added = _assoc(root, _key_hash(key), key, value, 0)
+            length += added
+
+        if root is self._root:
+            return self
+
+        updated: Self = object.__new__(self.__class__)
+        object.__setattr__(updated, "_root", root)
+        object.__setattr__(updated, "_length", length)
+        return updated
+
+    def __getitem__(
+        self,
+        key: Key,
+    ) -> Value:
+        value: Any = _lookup(self._root, _key_hash(key), key)
+        if value is _ABSENT:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(
+        self,
+        key: object,
+    ) -> bool:
+        return _lookup(self._root, _key_hash(key), key) is not _ABSENT
+
+    def __iter__(self) -> Iterator[Key]:
+        for entry in _entries(self._root):
+            yield entry.key
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __repr__(self) -> str:
+        return f"PersistentMap({dict(self.items())!r})"
+
+    def __setattr__(
+        self,
+        name: str,
+        value: Any,
+    ) -> NoReturn:
+        raise AttributeError(
+            f"Can't modify immutable {self.__class__.__qualname__}"
+            f" attribute - '{name}' cannot be modified"
+        )
+
+    def __delattr__(
+        self,
+        name: str,
+    ) -> NoReturn:
+        raise AttributeError(
+            f"Can't modify immutable {self.__class__.__qualname__}"
+            f" attribute - '{name}' cannot be deleted"
+        )
+
+
+@final
+class _Entry:
+    __slots__ = ("hash", "key", "value")
+
+    def __init__(
+        self,
+        hash: int,  # noqa: A002
+        key: Any,
+        value: Any,
+    ) -> None:
+        self.hash: int = hash
+        self.key: Any = key
+        self.value: Any = value
+
+
+@final
+class _Collision:
+    # entries with equal hashes
+    __slots__ = ("entries", "hash")
+
+    def __init__(
+        self,
+        hash: int,  # noqa: A002
+        entries: tuple[_Entry, ...],
+    ) -> None:
+        self.hash: int = hash
+        self.entries: tuple[_Entry, ...] = entries
+
+
+@final
+class _Node:
+    # children are placed at positions of set bits within the bitmap
+    __slots__ = ("bitmap", "children")
+
+    def __init__(
+        self,
+        bitmap: int,
+        children: tuple[_Entry | _Collision | _Node, ...],
+    ) -> None:
+        self.bitmap: int = bitmap
+        self.children: tuple[_Entry | _Collision | _Node, ...] = children
+
+
+_BITS: Final[int] = 5
+_MASK: Final[int] = (1 << _BITS) - 1
+_HASH_MASK: Final[int] = (1 << 64) - 1
+_ABSENT: Final[object] = object()
+_EMPTY_NODE: Final[_Node] = _Node(0, ())
+
+
+def _key_hash(
+    key: Any,
+    /,
+) -> int:
+    return hash(key) & _HASH_MASK
+
+
+def _lookup(
+    node: _Node,
+    key_hash: int,
+    key: Any,
+    /,
+) -> Any:
+    shift: int = 0
+    while True:
+        bit: int = 1 << ((key_hash >> shift) & _MASK)
+        if not node.bitmap & bit:
+            return _ABSENT
+
+        child: _Entry | _Collision | _Node = node.children[(node.bitmap & (bit - 1)).bit_count()]
+        if isinstance(child, _Node):
+            node = child
+            shift += _BITS
+            continue
+
+        if isinstance(child, _Entry):
+            if child.key is key or (child.hash == key_hash and child.key == key):
+                return child.value
+
+            return _ABSENT
+
+        if child.hash != key_hash:
+            return _ABSENT
+
+        for entry in child.entries:
+            if entry.key is key or entry.key == key:
+                return entry.value
+
+        return _ABSENT
+
+
+def _assoc(
+    node: _Node,
+    key_hash: int,
+    key: Any,
+    value: Any,
+    shift: int,
+    /,
+) -> tuple[_Node, bool]:
+    # returns updated node and flag telling if a new key was added
+    bit: int = 1 << ((key_hash >> shift) & _MASK)
+    index: int = (node.bitmap & (bit - 1)).bit_count()
+    if not node.bitmap & bit:
+        return (
+            _Node(
+                node.bitmap | bit,
+                (*node.children[:index], _Entry(key_hash, key, value), *node.children[index:]),
+            ),
+            True,
+        )
+
+    child: _Entry | _Collision | _Node = node.children[index]
+    updated: _Entry | _Collision | _Node
+    added: bool
+    if isinstance(child, _Node):
+        updated, added = _assoc(child, key_hash, key, value, shift + _BITS)
+
+    elif isinstance(child, _Entry) and (
+        child.key is key or (child.hash == key_hash and child.key == key)
+    ):
+        if child.value is value:
+            return (node, False)  # nothing changes
+
+        updated, added = _Entry(key_hash, key, value), False
+
+    elif isinstance(child, _Collision) and child.hash == key_hash:
+        updated, added = _collision_assoc(child, key, value)
+
+    else:
+        updated, added = _merge(child, _Entry(key_hash, key, value), shift + _BITS), True
+
+    if updated is child:
+        return (node, False)
+
+    return (
+        _Node(
+            node.bitmap,
+            (*node.children[:index], updated, *node.children[index + 1 :]),
+        ),
+        added,
+    )
+
+
+def _collision_assoc(
+    collision: _Collision,
+    key: Any,
+    value: Any,
+    /,
+) -> tuple[_Collision, bool]:
+    for index, entry in enumerate(collision.entries):
+        if entry.key is key or entry.key == key:
+            if entry.value is value:
+                return (collision, False)  # nothing changes
+
+            return (
+                _Collision(
+                    collision.hash,
+                    (
+                        *collision.entries[:index],
+                        _Entry(collision.hash, key, value),
+                        *collision.entries[index + 1 :],
+                    ),
+                ),
+                False,
+            )
+
+    return (
+        _Collision(
+            collision.hash,
+            (*collision.entries, _Entry(collision.hash, key, value)),
+        ),
+        True,
+    )
+
+
+def _merge(
+    current: _Entry | _Collision,
+    entry: _Entry,
+    shift: int,
+    /,
+) -> _Node | _Collision:
+    if current.hash == entry.hash:
+        if isinstance(current, _Collision):
+            return _Collision(current.hash, (*current.entries, entry))
+
+        return _Collision(entry.hash, (current, entry))
+
+    current_bit: int = 1 << ((current.hash >> shift) & _MASK)
+    entry_bit: int = 1 << ((entry.hash >> shift) & _MASK)
+    if current_bit == entry_bit:  # still the same position, go one level deeper
+        return _Node(current_bit, (_merge(current, entry, shift + _BITS),))
+
+    if current_bit < entry_bit:
+        return _Node(current_bit | entry_bit, (current, entry))
+
+    return _Node(current_bit | entry_bit, (entry, current))
+
+
+def _entries(
+    node: _Node,
+    /,
+) -> Iterator[_Entry]:
+    for child in node.children:
+        if isinstance(child, _Node):
+            yield from _entries(child)
+
+        elif isinstance(child, _Collision):
+            yield from child.entries
+
+        else:
+            yield child
@@ -198,6 +198,10 @@ class ContextPresetsRegistry:
         except LookupError:
             return None  # no presets
 
+    @classmethod
+    def current(cls) -> Self | None:
+        return cls._context.get(None)
+
     _context: ClassVar[ContextVar[Self]] = ContextVar("ContextPresetsRegistry")
     __slots__ = (
         "_registry",
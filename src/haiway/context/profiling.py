@@ -0,0 +1,287 @@
+from asyncio import to_thread
+from collections.abc import AsyncGenerator, Iterator, MutableSequence, Sequence
+from contextlib import AbstractContextManager, asynccontextmanager, nullcontext
+from contextvars import ContextVar, Token
+from os import PathLike
+from pathlib import Path
+from time import perf_counter
+from types import TracebackType
+from typing import ClassVar, Final, Protocol, final
+
+from haiway.context.observability import ContextObservability, ObservabilityLevel
+
+__all__ = ("ContextProfiling",)
+
+
+class _AsyncContext[Value](Protocol):
+    async def __aenter__(self) -> Value: ...
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+        /,
+    ) -> bool | None: ...
+
+
+@final
+class ProfileNode:
+    # single measured segment with its nested segments
+    __slots__ = (
+        "children",
+        "duration",
+        "name",
+    )
+
+    def __init__(
+        self,
+        name: str,
+    ) -> None:
+        self.name: str = name
+        self.duration: float = 0.0
+        self.children: MutableSequence[ProfileNode] = []
+
+    def folded(
+        self,
+        prefix: str,
+    ) -> Iterator[tuple[str, float]]:
+        path: str = f"{prefix};{self.name}" if prefix else self.name
+        # concurrent children may take longer in total than their parent
+        yield (path, max(self.duration - sum(child.duration for child in self.children), 0.0))
+        for child in self.children:
+            yield from child.folded(path)
+
+
+@final
+class _Measurement:
+    # measures a single segment nested in the currently measured one
+    __slots__ = (
+        "_context",
+        "_node",
+        "_parent",
+        "_start",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        /,
+        *,
+        parent: ProfileNode,
+        context: ContextVar[ProfileNode | None],
+    ) -> None:
+        self._context: ContextVar[ProfileNode | None] = context
+        self._parent: ProfileNode = parent
+        self._node: ProfileNode = ProfileNode(name)
+        self._start: float = 0.0
+        self._token: Token[ProfileNode | None] | None = None
+
+    def __enter__(self) -> None:
+        self._parent.children.append(self._node)
+        self._token = self._context.set(self._node)
+        self._start = perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        assert self._token is not None, "Unbalanced context enter/exit"  # nosec: B101
+        self._node.duration = perf_counter() - self._start
+        self._context.reset(self._token)
+        self._token = None
+
+
+@final
+class ContextProfiling:
+    """
+    Timing profile of entering and exiting a single scope.
+
+    Segments measured within the scope startup and shutdown form a tree which is
+    recorded as the ``scope.profile`` metric for each segment when the scope
+    exits. Optionally the tree is also written to a file using the folded stacks
+    format accepted by flame graph tools, with self times in microseconds,
+    appended from a worker thread to keep the file access off the event loop.
+    The scope body is not profiled, measuring is skipped altogether outside of
+    startup and shutdown of a profiled scope.
+    """
+
+    @classmethod
+    def measure(
+        cls,
+        name: str,
+        /,
+    ) -> AbstractContextManager[None]:
+        parent: ProfileNode | None = cls._context.get()
+        if parent is None:  # profiling is not active, skip measuring altogether
+            return _INACTIVE
+
+        return _Measurement(
+            name,
+            parent=parent,
+            context=cls._context,
+        )
+
+    @classmethod
+    def measured[Value](
+        cls,
+        name: str,
+        context: _AsyncContext[Value],
+        /,
+    ) -> _AsyncContext[Value]:
+        if cls._context.get() is None:  # profiling is not active, use context directly
+            return context
+
+        return _measured(name, context)
+
+    _context: ClassVar[ContextVar[ProfileNode | None]] = ContextVar(
+        "ContextProfiling",
+        default=None,
+    )
+    __slots__ = (
+        "_output",
+        "_phase",
+        "_scope",
+        "_shutdown",
+        "_shutdown_start",
+        "_startup",
+        "_startup_start",
+        "_token",
+    )
+
+    def __init__(
+        self,
+        scope: str,
+        *,
+        output: PathLike[str] | str | None,
+    ) -> None:
+        self._scope: str = scope
+        self._output: Path | None = Path(output) if output is not None else None
+        self._startup: ProfileNode = ProfileNode("startup")
+        self._shutdown: ProfileNode = ProfileNode("shutdown")
+        self._startup_start: float = 0.0
+        self._shutdown_start: float = 0.0
+        self._token: Token[ProfileNode | None] | None = None
+        # token of switching between startup, scope body and shutdown
+        self._phase: Token[ProfileNode | None] | None = None
+
+    async def __aenter__(self) -> None:
+        assert self._token is None, "Context reentrance is not allowed"  # nosec: B101
+        self._startup_start = perf_counter()
+        self._token = ContextProfiling._context.set(self._startup)
+
+    def started(self) -> None:
+        assert self._token is not None, "Profiling has not been entered"  # nosec: B101
+        assert self._phase is None, "Profiling has already started"  # nosec: B101
+        self._startup.duration = perf_counter() - self._startup_start
+        # scope body, including nested scopes and spawned tasks, is not a part of the profile
+        self._phase = ContextProfiling._context.set(None)
+
+    def stopping(self) -> None:
+        assert self._token is not None, "Profiling has not been entered"  # nosec: B101
+        self._shutdown_start = perf_counter()
+        if not self._startup.duration:  # startup has failed before completing
+            self._startup.duration = self._shutdown_start - self._startup_start
+
+        if self._phase is not None:
+            ContextProfiling._context.reset(self._phase)
+
+        # nested segments measured from now on belong to the shutdown
+        self._phase = ContextProfiling._context.set(self._shutdown)
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        assert self._token is not None, "Unbalanced context enter/exit"  # nosec: B101
+        self._shutdown.duration = perf_counter() - self._shutdown_start
+        if self._phase is not None:
+            ContextProfiling._context.reset(self._phase)
+            self._phase = None
+
+        ContextProfiling._context.reset(self._token)
+        self._token = None
+
+        segments: Sequence[tuple[str, ProfileNode]] = tuple(
+            _segments(self._scope, (self._startup, self._shutdown))
+        )
+        for path, node in segments:
+            ContextObservability.record_metric(
+                ObservabilityLevel.INFO,
+                _PROFILE_METRIC,
+                value=node.duration,
+                unit="s",
+                kind="histogram",
+                attributes={"segment": path},
+            )
+
+        if self._output is None:
+            return
+
+        folded: str = "".join(
+            f"{path} {round(self_time * 1_000_000)}\n"
+            for node in (self._startup, self._shutdown)
+            for path, self_time in node.folded(self._scope)
+        )
+        try:
+            await to_thread(_append, self._output, folded)
+
+        except OSError as exc:
+            ContextObservability.record_log(
+                ObservabilityLevel.ERROR,
+                f"Failed to write scope profile to {self._output}",
+                exception=exc,
+            )
+
+
+def _segments(
+    prefix: str,
+    nodes: Sequence[ProfileNode],
+) -> Iterator[tuple[str, ProfileNode]]:
+    for node in nodes:
+        path: str = f"{prefix};{node.name}"
+        yield (path, node)
+        yield from _segments(path, node.children)
+
+
+def _append(
+    path: Path,
+    text: str,
+    /,
+) -> None:
+    with path.open("a", encoding="utf-8") as file:
+        file.write(text)
+
+
+_PROFILE_METRIC: Final[str] = "scope.profile"
+
+
+@asynccontextmanager
+async def _measured[Value](
+    name: str,
+    context: _AsyncContext[Value],
+    /,
+) -> AsyncGenerator[Value]:
+    # measures both entering and exiting, exit is measured within the current segment
+    with ContextProfiling.measure(name):
+        value: Value = await context.__aenter__()
+
+    try:
+        yield value
+
+    except BaseException as exc:
+        with ContextProfiling.measure(name):
+            if not await context.__aexit__(type(exc), exc, exc.__traceback__):
+                raise
+
+    else:
+        with ContextProfiling.measure(name):
+            await context.__aexit__(None, None, None)
+
+
+_INACTIVE: Final[AbstractContextManager[None]] = nullcontext()
@@ -1,20 +1,27 @@
 from asyncio import CancelledError, get_running_loop
+from collections.abc import Iterable, Sequence
 from contextlib import AsyncExitStack
 from logging import Logger
+from os import PathLike
 from types import TracebackType
-from typing import final
+from typing import Any, NoReturn, final
 
-from haiway.context.disposables import Disposables
+from haiway.attributes import State
+from haiway.context.disposables import Disposable, Disposables
 from haiway.context.events import ContextEvents
 from haiway.context.identifier import ContextIdentifier
 from haiway.context.observability import ContextObservability, Observability, ObservabilityLevel
 
 # Import after other imports to avoid circular dependencies
 from haiway.context.presets import ContextPresets, ContextPresetsRegistry
-from haiway.context.state import ContextState
+from haiway.context.profiling import ContextProfiling
+from haiway.context.state import ContextState, ContextStateTemplate
 from haiway.context.tasks import ContextTaskGroup
 
-__all__ = ("ContextScope",)
+__all__ = (
+    "ContextScope",
+    "ContextScopeTemplate",
+)
 
 
 @final  # consider immutable
@@ -27,17 +34,26 @@ class ContextScope:
         "_isolated",
         "_observability",
         "_presets",
+        "_presets_selected",
+        "_profiling",
+        "_scope_state",
         "_state",
         "_task_group",
+        "_template_state",
     )
 
     def __init__(
         self,
         name: str,
         presets: ContextPresets | None,
-        disposables: Disposables,
+        state: Sequence[State],
+        disposables: Disposables | None,
         observability: Observability | Logger | None,
         isolated: bool,
+        profiling: PathLike[str] | str | bool = False,
+        *,
+        template_state: ContextStateTemplate | None = None,
+        presets_selected: bool = False,
     ) -> None:
         # prepare new context identifier, will become nested if able otherwise becomes root
         self._identifier: ContextIdentifier = ContextIdentifier.scope(name)
@@ -46,66 +62,170 @@ class ContextScope:
             self._identifier,
             observability=observability,
         )
-        # remember requested presets
+        # remember requested presets, when already selected there is no need to look them up
         self._presets: ContextPresets | None = presets
-        # store provided disposables extended with provided state
-        self._disposables: Disposables = disposables
+        self._presets_selected: bool = presets_selected
+        # store provided state, it overrides state produced by disposables
+        self._scope_state: Sequence[State] = state
+        # state of a template, merged before the provided state
+        self._template_state: ContextStateTemplate | None = template_state
+        # store provided disposables, empty ones are skipped altogether
+        self._disposables: Disposables | None = disposables if disposables else None
         # prepare for context state management
         self._state: ContextState | None = None
         # prepare for isolation
         self._isolated: bool = isolated or self._identifier.is_root
         self._task_group: ContextTaskGroup | None = None
         self._events: ContextEvents | None = None
-        self._exit_stack: AsyncExitStack = AsyncExitStack()
+        # exit stack is used only when entering requires more than the fast path
+        self._exit_stack: AsyncExitStack | None = None
+        # prepare timing profile if requested, optionally written to a file
+        self._profiling: ContextProfiling | None
+        if profiling is False:
+            self._profiling = None
+
+        else:
+            self._profiling = ContextProfiling(
+                self._identifier.name,
+                output=None if profiling is True else profiling,
+            )
 
     async def __aenter__(self) -> str:
+        # resolve presets
+        presets: ContextPresets | None
+        if self._presets is not None or self._presets_selected:
+            presets = self._presets
+
+        else:
+            presets = ContextPresetsRegistry.select(self._identifier.name)
+
+        if (
+            presets is None
+            and self._disposables is None
+            and not self._isolated
+            and self._profiling is None
+        ):
+            return self._enter_lightweight()
+
         # start scope exit stack
-        await self._exit_stack.__aenter__()
+        exit_stack: AsyncExitStack = AsyncExitStack()
+        self._exit_stack = exit_stack
+        await exit_stack.__aenter__()
+        profiling: ContextProfiling | None = None  # set only when profiling was entered
         try:
             # propagate new scope identifier
-            self._exit_stack.enter_context(self._identifier)
+            exit_stack.enter_context(self._identifier)
             # ensure associated observability and obtain trace identifier
-            trace_id: str = self._exit_stack.enter_context(self._observability)
+            trace_id: str = exit_stack.enter_context(self._observability)
+            # start profiling after observability so it is able to record the results
+            if self._profiling is not None:
+                await exit_stack.enter_async_context(self._profiling)
+                profiling = self._profiling
 
-            # resolve presets
-            if self._presets is not None:
-                presets: ContextPresets | None = self._presets
+            # resolve combined state, presets are entered first so they exit last
+            presets_state: Sequence[State] = ()
+            if presets is not None:
+                presets_disposables: Disposables
+                with ContextProfiling.measure("presets"):
+                    presets_disposables = presets.resolve()
 
-            else:
-                presets = ContextPresetsRegistry.select(self._identifier.name)
+                presets_state = await exit_stack.enter_async_context(
+                    ContextProfiling.measured("presets disposables", presets_disposables)
+                )
 
-            # resolve combined state
-            if presets is None:
-                self._state = ContextState.updating(
-                    await self._exit_stack.enter_async_context(self._disposables)
+            disposables_state: Sequence[State] = ()
+            if self._disposables is not None:
+                disposables_state = await exit_stack.enter_async_context(
+                    ContextProfiling.measured("disposables", self._disposables)
                 )
 
-            else:
-                presets_disposables: Disposables = presets.resolve()
-                self._state = ContextState.updating(
-                    (
-                        *await self._exit_stack.enter_async_context(presets_disposables),
-                        *await self._exit_stack.enter_async_context(self._disposables),
-                    )
+            with ContextProfiling.measure("state"):
+                self._state = self._merged_state(
+                    presets_state,
+                    disposables_state,
                 )
 
             # and ensure state is used
-            self._exit_stack.enter_context(self._state)
+            exit_stack.enter_context(self._state)
 
             # provide isolation for tasks and events last so they exit first
             if self._isolated:
                 self._task_group = ContextTaskGroup()
-                await self._exit_stack.enter_async_context(self._task_group)
+                await exit_stack.enter_async_context(
+                    ContextProfiling.measured("tasks", self._task_group)
+                )
                 self._events = ContextEvents(loop=get_running_loop())
-                await self._exit_stack.enter_async_context(self._events)
+                await exit_stack.enter_async_context(self._events)
+
+            if profiling is not None:
+                profiling.started()
 
             return trace_id
 
         except BaseException as exc:
+            if profiling is not None:
+                profiling.stopping()
+
             # ensure stack exiting on error
-            await self._exit_stack.__aexit__(type(exc), exc, exc.__traceback__)
+            await exit_stack.__aexit__(type(exc), exc, exc.__traceback__)
             raise  # reraise original
 
+    def _merged_state(
+        self,
+        presets_state: Sequence[State],
+        disposables_state: Sequence[State],
+        /,
+    ) -> ContextState:
+        if self._template_state is None:
+            return ContextState.updating(
+                (
+                    *presets_state,
+                    *disposables_state,
+                    *self._scope_state,
+                )
+            )
+
+        if presets_state or disposables_state:
+            # template state has to override state produced by disposables again
+            return ContextState.templated(
+                self._template_state,
+                (
+                    *presets_state,
+                    *disposables_state,
+                    *self._template_state.state,
+                    *self._scope_state,
+                ),
+            )
+
+        return ContextState.templated(
+            self._template_state,
+            self._scope_state,
+        )
+
+    def _enter_lightweight(self) -> str:
+        # nested scope without presets, disposables and isolation requires
+        # only propagating identifier, observability and optionally state
+        self._identifier.__enter__()
+        try:
+            trace_id: str = self._observability.__enter__()
+
+        except BaseException as exc:
+            self._identifier.__exit__(type(exc), exc, exc.__traceback__)
+            raise  # reraise original
+
+        if self._template_state is not None:
+            self._state = ContextState.templated(
+                self._template_state,
+                self._scope_state,
+            )
+            self._state.__enter__()
+
+        elif self._scope_state:  # reuse current state otherwise
+            self._state = ContextState.updating(self._scope_state)
+            self._state.__enter__()
+
+        return trace_id
+
     async def __aexit__(
         self,
         exc_type: type[BaseException] | None,
@@ -113,11 +233,22 @@ class ContextScope:
         exc_tb: TracebackType | None,
     ) -> None:
         try:  # exit stack
-            await self._exit_stack.__aexit__(
-                exc_type,
-                exc_val,
-                exc_tb,
-            )
+            if self._exit_stack is None:
+                self._exit_lightweight(
+                    exc_type,
+                    exc_val,
+                    exc_tb,
+                )
+
+            else:
+                if self._profiling is not None:
+                    self._profiling.stopping()
+
+                await self._exit_stack.__aexit__(
+                    exc_type,
+                    exc_val,
+                    exc_tb,
+                )
 
         except CancelledError:
             raise  # reraise cancellation
@@ -129,3 +260,175 @@ class ContextScope:
                 exception=exc,
             )
             raise  # record and reraise other errors
+
+    def _exit_lightweight(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        try:
+            if self._state is not None:
+                self._state.__exit__(
+                    exc_type,
+                    exc_val,
+                    exc_tb,
+                )
+
+            self._observability.__exit__(
+                exc_type,
+                exc_val,
+                exc_tb,
+            )
+
+        finally:
+            self._identifier.__exit__(
+                exc_type,
+                exc_val,
+                exc_tb,
+            )
+
+
+@final  # immutable
+class ContextScopeTemplate:
+    """
+    Reusable configuration for frequently entered scope contexts.
+
+    The template state is merged into the state of the context the scopes are entered
+    within once and reused for as long as that state remains the same. Presets selected
+    by the scope name are looked up once for each active presets registry. Calling the
+    template prepares a new scope context which is entered the same way as ``ctx.scope``,
+    leaving only the identifier assignment and merging the state provided with the call
+    for each entry. Templates can be shared between concurrent tasks.
+    """
+
+    __slots__ = (
+        "_isolated",
+        "_name",
+        "_observability",
+        "_presets",
+        "_selected",
+        "_state",
+    )
+
+    def __init__(
+        self,
+        name: str,
+        presets: ContextPresets | None,
+        state: Sequence[State],
+        observability: Observability | Logger | None,
+        isolated: bool,
+    ) -> None:
+        self._name: str
+        object.__setattr__(
+            self,
+            "_name",
+            name,
+        )
+        self._presets: ContextPresets | None
+        object.__setattr__(
+            self,
+            "_presets",
+            presets,
+        )
+        # presets selected from the registry by name, along with that registry
+        self._selected: tuple[ContextPresetsRegistry | None, ContextPresets | None] | None
+        object.__setattr__(
+            self,
+            "_selected",
+            None,
+        )
+        self._state: ContextStateTemplate
+        object.__setattr__(
+            self,
+            "_state",
+            ContextStateTemplate(state),
+        )
+        # loggers are wrapped for each scope to start a new trace each time
+        self._observability: Observability | Logger | None
+        object.__setattr__(
+            self,
+            "_observability",
+            observability,
+        )
+        self._isolated: bool
+        object.__setattr__(
+            self,
+            "_isolated",
+            isolated,
+        )
+
+    @property
+    def name(self) -> str:
+        return self._name
+
+    def __call__(
+        self,
+        *state: State | None,
+        disposables: Iterable[Disposable | None] | None = None,
+    ) -> ContextScope:
+        """
+        Prepare scope context using this template.
+
+        Parameters
+        ----------
+        *state: State | None
+            state propagated within the scope context, overrides the template state
+            on conflict.
+        disposables: Iterable[Disposable | None] | None
+            disposables consumed within the context when entered, in addition to
+            ones provided by the template presets.
+
+        Returns
+        -------
+        ContextScope
+            context manager object intended to enter the scope with.
+            context manager will provide trace_id of current scope.
+        """
+        return ContextScope(
+            name=self._name,
+            presets=self._presets if self._presets is not None else self._select_presets(),
+            state=tuple(element for element in state if element is not None) if state else (),
+            disposables=Disposables(disposables) if disposables is not None else None,
+            observability=self._observability,
+            isolated=self._isolated,
+            template_state=self._state,
+            presets_selected=True,
+        )
+
+    def _select_presets(self) -> ContextPresets | None:
+        registry: ContextPresetsRegistry | None = ContextPresetsRegistry.current()
+        selected: tuple[ContextPresetsRegistry | None, ContextPresets | None] | None = (
+            self._selected
+        )
+        if selected is None or selected[0] is not registry:
+            selected = (
+                registry,
+                registry.preset(self._name) if registry is not None else None,
+            )
+            object.__setattr__(
+                self,
+                "_selected",
+                selected,
+            )
+
+        return selected[1]
+
+    def __setattr__(
+        self,
+        name: str,
+        value: Any,
+    ) -> NoReturn:
+        raise AttributeError(
+            f"Can't modify immutable {self.__class__.__qualname__}"
+            f" attribute - '{name}' cannot be modified"
+        )
+
+    def __delattr__(
+        self,
+        name: str,
+    ) -> NoReturn:
+        raise AttributeError(
+            f"Can't modify immutable {self.__class__.__qualname__}"
+            f" attribute - '{name}' cannot be deleted"
+        )
@@ -1,13 +1,17 @@
-from collections.abc import Collection, Iterable, Mapping, MutableMapping
+from collections.abc import Collection, Iterable, MutableMapping, Sequence
 from contextvars import ContextVar, Token
 from threading import Lock
 from types import TracebackType
-from typing import ClassVar, Self, cast, final
+from typing import Any, ClassVar, Final, Generic, Self, final
 
 from haiway.attributes import State
+from haiway.context.persistent import PersistentMap
 from haiway.context.types import ContextMissing, ContextStateMissing
 
-__all__ = ("ContextState",)
+__all__ = (
+    "ContextState",
+    "ContextStateTemplate",
+)
 
 
 @final  # consider immutable
@@ -27,7 +31,7 @@ class ContextState:
         /,
     ) -> bool:
         try:
-            return state in cls._context.get()._state
+            return cls._context.get()._resolve(state) is not None
 
         except LookupError:
             return False  # no context no state
@@ -39,36 +43,49 @@ class ContextState:
         /,
         default: StateType | None = None,
     ) -> StateType:
+        current: Self
         try:
-            current: Self = cls._context.get()
-            if state in current._state:
-                return cast(StateType, current._state[state])
+            current = cls._context.get()
 
+        except LookupError:
             if default is not None:
-                return default  # do not store default
+                return default
 
-            initialized: StateType
-            try:
-                initialized = state()  # initialize out of lock to prevent recursion
+            raise ContextMissing("ContextState requested but not defined!") from None
 
-            except Exception as exc:
-                raise ContextStateMissing(
-                    f"{state.__qualname__} is not defined in current scope"
-                    " and failed to provide a default value"
-                ) from exc
+        # memoized lookups skip resolving the state again
+        memoized: State | None = current._memo.get(state)
+        if memoized is not None:
+            return memoized  # pyright: ignore[reportReturnType]
 
-            with current._lock:
-                if state in current._state:  # check again under lock
-                    return cast(StateType, current._state[state])
+        resolved: State | None = current._resolve(state)
+        if resolved is not None:
+            current._memo[state] = resolved
+            return resolved  # pyright: ignore[reportReturnType]
 
-                current._state[state] = initialized
-                return initialized
+        if default is not None:
+            return default  # do not store default
 
-        except LookupError:
-            if default is not None:
-                return default
+        initialized: StateType
+        try:
+            initialized = state()  # initialize out of lock to prevent recursion
 
-            raise ContextMissing("ContextState requested but not defined!") from None
+        except Exception as exc:
+            raise ContextStateMissing(
+                f"{state.__qualname__} is not defined in current scope"
+                " and failed to provide a default value"
+            ) from exc
+
+        with _defaults_lock:
+            resolved = current._resolve(state)
+            if resolved is not None:  # check again under lock
+                return resolved  # pyright: ignore[reportReturnType]
+
+            # state is never modified in place, sharing it with nested contexts is safe
+            # defaults are not indexed to keep resolving base classes stable
+            current._state = current._state.updating(((state, initialized),))
+            current._memo[state] = initialized
+            return initialized
 
     @classmethod
     def updating(
@@ -82,16 +99,19 @@ class ContextState:
         ----------
         state:
             Iterable of states to merge. ``None`` entries are ignored. Later items
-            override earlier items by their concrete ``type``.
+            override earlier items by their concrete ``type`` and take precedence
+            when resolving their base classes.
 
         Returns
         -------
         Self
             A new context instance. When a current context exists, this method
-            allocates a copy via ``object.__new__(cls)``, merges into
-            ``updated._state`` from the current state and the resolved input, and
-            assigns a fresh ``Lock`` for thread-safety. When no current context
-            exists, it creates a new root by delegating to ``cls(state=state)``.
+            allocates a copy via ``object.__new__(cls)`` holding the current state
+            updated with the resolved input. The state is a persistent mapping, so
+            the update shares its structure with the current state instead of
+            copying it. The same applies to the index of base classes. When no
+            current context exists, it creates a new root by
+            delegating to ``cls(state=state)``.
 
         Raises
         ------
@@ -99,24 +119,63 @@ class ContextState:
             If ``cls(state=state)`` fails due to missing required state in the
             constructor. Any such exception is propagated from that creation path.
         """
+        current: Self
         try:  # update current scope context
-            current: Self = cls._context.get()
-            resolved: Mapping[type[State], State] = {
-                type(element): element for element in state if element is not None
-            }
-
-            updated: Self = object.__new__(cls)  # always provide a copy
-            updated._state = {**current._state, **resolved}
-            updated._lock = Lock()
-            updated._token = None
-            return updated
+            current = cls._context.get()
 
         except LookupError:  # or create root scope when missing
             return cls(state=state)
 
+        return current._updated(state)
+
+    @classmethod
+    def templated(
+        cls,
+        template: ContextStateTemplate,
+        state: Iterable[State | None],
+        /,
+    ) -> ContextState:
+        """Create a new context by merging the current state with template and provided values.
+
+        The template state is merged into the current state once and the result is
+        reused for as long as the current state remains the same, leaving only the
+        provided values to be merged each time.
+
+        Parameters
+        ----------
+        template:
+            Template holding the state merged before the provided values.
+        state:
+            Iterable of states to merge, overriding the template state.
+
+        Returns
+        -------
+        ContextState
+            A new context instance, equal to the result of ``updating`` with the
+            template state followed by the provided values.
+        """
+        current: ContextState | None = cls._context.get(None)
+        current_state: PersistentMap[type[State], State] | None = (
+            current._state if current is not None else None
+        )
+        merged: _TemplateMerge | None = template.merged
+        # default state added to the current context replaces its mapping
+        if merged is None or merged[0] is not current or merged[1] is not current_state:
+            merged = (
+                current,
+                current_state,
+                current._updated(template.state)
+                if current is not None
+                else ContextState(state=template.state),
+            )
+            template.merged = merged
+
+        return merged[2]._updated(state)
+
     _context: ClassVar[ContextVar[Self]] = ContextVar("ContextState")
     __slots__ = (
-        "_lock",
+        "_index",
+        "_memo",
         "_state",
         "_token",
     )
@@ -125,12 +184,44 @@ class ContextState:
         self,
         state: Iterable[State | None],
     ) -> None:
-        self._state: MutableMapping[type[State], State] = {
-            type(element): element for element in state if element is not None
-        }
-        self._lock: Lock = Lock()
+        elements: tuple[State, ...] = tuple(element for element in state if element is not None)
+        self._state: PersistentMap[type[State], State] = PersistentMap(
+            (type(element), element) for element in elements
+        )
+        # base classes of provided state types pointing to the latest state providing them
+        self._index: PersistentMap[type[Any], State] = _indexed(
+            PersistentMap(),
+            elements,
+        )
+        # resolved lookups, valid as long as the state is not updated
+        self._memo: MutableMapping[type[Any], State] = {}
         self._token: Token[ContextState] | None = None
 
+    def _updated(
+        self,
+        state: Iterable[State | None],
+        /,
+    ) -> Self:
+        elements: tuple[State, ...] = tuple(element for element in state if element is not None)
+        updated: Self = object.__new__(self.__class__)  # always provide a copy
+        updated._state = self._state.updating((type(element), element) for element in elements)
+        updated._index = _indexed(self._index, elements)
+        updated._memo = {}
+        updated._token = None
+        return updated
+
+    def _resolve(
+        self,
+        state: type[Any],
+        /,
+    ) -> State | None:
+        # exact type takes precedence over subclasses
+        resolved: State | None = self._state.get(state)
+        if resolved is not None:
+            return resolved
+
+        return self._index.get(state)
+
     def __enter__(self) -> None:
         assert self._token is None, "Context reentrance is not allowed"  # nosec: B101
         self._token = ContextState._context.set(self)
@@ -144,3 +235,44 @@ class ContextState:
         assert self._token is not None, "Unbalanced context enter/exit"  # nosec: B101
         ContextState._context.reset(self._token)
         self._token = None
+
+
+@final
+class ContextStateTemplate:
+    # state merged into the current context state once, reused by subsequent merges
+    __slots__ = (
+        "merged",
+        "state",
+    )
+
+    def __init__(
+        self,
+        state: Sequence[State],
+    ) -> None:
+        self.state: Sequence[State] = state
+        self.merged: _TemplateMerge | None = None
+
+
+def _indexed(
+    index: PersistentMap[type[Any], State],
+    elements: Iterable[State],
+    /,
+) -> PersistentMap[type[Any], State]:
+    return index.updating(
+        (base, element)
+        for element in elements
+        for base in type(element).__mro__[1:]
+        if base not in _UNINDEXED
+    )
+
+
+# context and its state mapping the template state was merged into, with the merge result
+type _TemplateMerge = tuple[
+    ContextState | None,
+    PersistentMap[type[State], State] | None,
+    ContextState,
+]
+# common bases of all states are never looked up
+_UNINDEXED: Final[frozenset[Any]] = frozenset((State, Generic, object))
+# guards only storing default state instances which is rare, contexts do not need own locks
+_defaults_lock: Final[Lock] = Lock()
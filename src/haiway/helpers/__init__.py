@@ -1,8 +1,13 @@
 from haiway.helpers.asynchrony import asynchronous
 from haiway.helpers.caching import CacheMakeKey, CacheRead, CacheWrite, cache, cache_externally
 from haiway.helpers.concurrent import (
+    AdaptiveConcurrency,
     concurrently,
+    execute_batches_concurrently,
     execute_concurrently,
+    execute_concurrently_streaming,
+    merge_streams,
+    process_batches_concurrently,
     process_concurrently,
     stream_concurrently,
 )
@@ -36,6 +41,7 @@ from haiway.helpers.throttling import throttle
 from haiway.helpers.timeouting import timeout
 
 __all__ = (
+    "AdaptiveConcurrency",
     "CacheMakeKey",
     "CacheRead",
     "CacheWrite",
@@ -62,7 +68,11 @@ __all__ = (
     "cache",
     "cache_externally",
     "concurrently",
+    "execute_batches_concurrently",
     "execute_concurrently",
+    "execute_concurrently_streaming",
+    "merge_streams",
+    "process_batches_concurrently",
     "process_concurrently",
     "retry",
     "statemethod",
@@ -1,35 +1,304 @@
-from asyncio import ALL_COMPLETED, FIRST_COMPLETED, CancelledError, Task, wait
+from asyncio import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    AbstractEventLoop,
+    CancelledError,
+    Future,
+    Lock,
+    Task,
+    TimerHandle,
+    current_task,
+    get_running_loop,
+    sleep,
+    wait,
+)
+from collections import deque
 from collections.abc import (
+    AsyncGenerator,
     AsyncIterable,
+    AsyncIterator,
+    Awaitable,
     Callable,
     Collection,
     Coroutine,
+    Generator,
     Iterable,
     Iterator,
     MutableSequence,
     MutableSet,
     Sequence,
 )
-from typing import Any, Literal, overload
+from contextvars import Context, copy_context
+from itertools import batched
+from time import monotonic
+from typing import Any, Final, Literal, final, overload
 
 from haiway.context import ctx
 from haiway.context.tasks import ContextTaskGroup
 from haiway.utils.stream import AsyncStream
 
 __all__ = (
+    "AdaptiveConcurrency",
     "concurrently",
+    "execute_batches_concurrently",
     "execute_concurrently",
+    "execute_concurrently_streaming",
+    "merge_streams",
+    "process_batches_concurrently",
     "process_concurrently",
     "stream_concurrently",
 )
 
 
-async def process_concurrently[Element](  # noqa: C901, PLR0912, PLR0915
+@final
+class AdaptiveConcurrency:
+    """Concurrency limit adjusting to the observed latency and errors.
+
+    Can be used in place of a fixed ``concurrent_tasks`` number of concurrent helpers.
+    The limit grows by one task each time a full window of tasks succeeds and
+    shrinks multiplicatively when tasks fail or their latency exceeds the tolerated
+    multiple of the lowest observed latency (additive increase, multiplicative
+    decrease). The limit is decreased at most once per observed latency, so a single
+    overloaded window is not punished repeatedly.
+
+    The limit grows only when tasks run with all slots taken, a source providing
+    elements slower than they are processed does not inflate it. The limit is kept
+    between calls and enforced by the instance itself: calls exceeding it wait before
+    starting, so a single instance can be shared by all helpers calling the same
+    downstream service within one event loop. Each change of the limit is recorded
+    as the ``concurrency.limit`` gauge metric.
+
+    Parameters
+    ----------
+    name : str, default="concurrency"
+        Name of the limiter, recorded as the ``limiter`` metric attribute.
+    initial : int, default=4
+        Limit used before any task completes.
+    minimum : int, default=1
+        Lowest allowed limit. Must be greater than 0.
+    maximum : int, default=256
+        Highest allowed limit.
+    latency_tolerance : float, default=2.0
+        Multiple of the lowest observed latency treated as overload.
+    backoff : float, default=0.5
+        Factor applied to the limit on overload or failure, between 0 and 1.
+
+    Examples
+    --------
+    >>> limit = AdaptiveConcurrency(name="search", maximum=64)
+    >>> await process_concurrently(
+    ...     queries,
+    ...     search,
+    ...     concurrent_tasks=limit,
+    ... )
+    """
+
+    __slots__ = (
+        "_backoff",
+        "_baseline",
+        "_decreased",
+        "_in_flight",
+        "_latency",
+        "_limit",
+        "_maximum",
+        "_minimum",
+        "_name",
+        "_tolerance",
+        "_waiting",
+        "_window",
+    )
+
+    def __init__(
+        self,
+        *,
+        name: str = "concurrency",
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 256,
+        latency_tolerance: float = 2.0,
+        backoff: float = 0.5,
+    ) -> None:
+        assert 0 < minimum <= initial <= maximum  # nosec: B101
+        assert latency_tolerance > 1.0  # nosec: B101
+        assert 0.0 < backoff < 1.0  # nosec: B101
+        self._name: str = name
+        self._minimum: int = minimum
+        self._maximum: int = maximum
+        self._tolerance: float = latency_tolerance
+        self._backoff: float = backoff
+        # fractional window grows smoothly, tasks are limited by its integer part
+        self._window: float = float(initial)
+        self._limit: int = initial
+        self._baseline: float | None = None
+        self._latency: float | None = None
+        self._decreased: float = 0.0
+        # calls running and waiting for the limit, shared by all helpers using this instance
+        self._in_flight: int = 0
+        self._waiting: deque[Future[None]] = deque()
+
+    @property
+    def limit(self) -> int:
+        """Current limit of concurrently running tasks."""
+        return self._limit
+
+    @property
+    def maximum(self) -> int:
+        """Highest allowed limit of concurrently running tasks."""
+        return self._maximum
+
+    def measured[**Args, Result](
+        self,
+        function: Callable[Args, Coroutine[None, None, Result]],
+        /,
+    ) -> Callable[Args, Coroutine[None, None, Result]]:
+        """Wrap a coroutine function to run within the limit and adjust it after each call.
+
+        Calls exceeding the current limit, counting calls of all functions measured by
+        this instance, wait until a running call completes or the limit grows.
+
+        Parameters
+        ----------
+        function : Callable[Args, Coroutine[None, None, Result]]
+            Coroutine function which latency and errors drive the limit.
+
+        Returns
+        -------
+        Callable[Args, Coroutine[None, None, Result]]
+            Function with the same interface as the wrapped one.
+        """
+
+        async def measured(
+            *args: Args.args,
+            **kwargs: Args.kwargs,
+        ) -> Result:
+            await self._acquire()
+            try:
+                saturated: bool = self._in_flight >= self._limit
+                start: float = monotonic()
+                try:
+                    result: Result = await function(*args, **kwargs)
+
+                except Exception:
+                    self._decrease(monotonic())
+                    raise
+
+                self._record(
+                    monotonic() - start,
+                    saturated=saturated,
+                )
+                return result
+
+            finally:
+                self._release()
+
+        return measured
+
+    async def _acquire(self) -> None:
+        if self._in_flight < self._limit and not self._waiting:
+            self._in_flight += 1
+            return
+
+        waiting: Future[None] = get_running_loop().create_future()
+        self._waiting.append(waiting)
+        try:
+            await waiting  # slot is taken on our behalf when resumed
+
+        except CancelledError:
+            if waiting.done() and not waiting.cancelled():
+                self._release()  # resumed and cancelled at once, pass the slot on
+
+            else:
+                self._waiting.remove(waiting)
+
+            raise
+
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._resume()
+
+    def _resume(self) -> None:
+        while self._waiting and self._in_flight < self._limit:
+            waiting: Future[None] = self._waiting.popleft()
+            if waiting.done():
+                continue  # already cancelled
+
+            self._in_flight += 1
+            waiting.set_result(None)
+
+    def _record(
+        self,
+        latency: float,
+        /,
+        *,
+        saturated: bool,
+    ) -> None:
+        baseline: float
+        if self._baseline is None or latency < self._baseline:
+            baseline = latency
+
+        elif self._limit == self._minimum:
+            # latency at the lowest limit is not caused by the load, follow the service slowing down
+            baseline = self._baseline + (latency - self._baseline) * _BASELINE_DRIFT
+
+        else:
+            baseline = self._baseline
+
+        self._baseline = baseline
+        if self._latency is None:
+            self._latency = latency
+
+        else:
+            self._latency += (latency - self._latency) * _LATENCY_SMOOTHING
+
+        if self._latency > max(baseline, _LATENCY_FLOOR) * self._tolerance:
+            self._decrease(monotonic())
+
+        elif saturated:  # grow by one task for each window of successful tasks using all slots
+            self._update(min(self._window + 1.0 / self._window, float(self._maximum)))
+
+    def _decrease(
+        self,
+        now: float,
+        /,
+    ) -> None:
+        if now - self._decreased < (self._latency or 0.0):
+            return  # tasks started before the last decrease are still completing
+
+        self._decreased = now
+        self._update(max(self._window * self._backoff, float(self._minimum)))
+
+    def _update(
+        self,
+        window: float,
+        /,
+    ) -> None:
+        self._window = window
+        limit: int = int(window)
+        if limit == self._limit:
+            return
+
+        self._limit = limit
+        ctx.record_info(
+            metric="concurrency.limit",
+            value=limit,
+            kind="gauge",
+            attributes={"limiter": self._name},
+        )
+        self._resume()  # start waiting calls when the limit grows
+
+
+_BASELINE_DRIFT: Final[float] = 0.05
+_LATENCY_SMOOTHING: Final[float] = 0.2
+_LATENCY_FLOOR: Final[float] = 0.001  # ignore differences below timing noise
+_YIELD_INTERVAL: Final[int] = 256
+
+
+async def process_concurrently[Element](
     source: AsyncIterable[Element] | Iterable[Element],
     /,
     handler: Callable[[Element], Coroutine[None, None, None]],
     *,
-    concurrent_tasks: int = 2,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
     ignore_exceptions: bool = False,
 ) -> None:
     """Process elements from an iterable concurrently.
@@ -37,7 +306,12 @@ async def process_concurrently[Element](  # noqa: C901, PLR0912, PLR0915
     Consumes elements from an iterable and processes them using the provided
     handler function. Processing happens concurrently with a configurable maximum
     number of concurrent tasks. Elements are processed as they become available,
-    maintaining the specified concurrency limit.
+    maintaining the specified concurrency limit. Each of the concurrent tasks is a
+    long-lived worker pulling consecutive elements from the shared source, so no
+    task is created for a single element. Handlers share the contextvars context of
+    their worker, values set by a handler remain visible when the same worker
+    processes its next elements. With AdaptiveConcurrency, workers are spawned up
+    to the current limit as it grows and stop when it shrinks.
 
     The function continues until the source iterator is exhausted. If the function
     is cancelled, all running tasks are also cancelled. When ignore_exceptions is
@@ -51,9 +325,11 @@ async def process_concurrently[Element](  # noqa: C901, PLR0912, PLR0915
     handler : Callable[[Element], Coroutine[None, None, None]]
         A coroutine function that processes each element. The handler should
         not return a value (returns None).
-    concurrent_tasks : int, default=2
+    concurrent_tasks : int | AdaptiveConcurrency, default=2
         Maximum number of concurrent tasks. Must be greater than 0. Higher
-        values allow more parallelism but consume more resources.
+        values allow more parallelism but consume more resources. When
+        AdaptiveConcurrency is provided, the limit follows observed latency
+        and errors of the tasks instead.
     ignore_exceptions : bool, default=False
         If True, exceptions from handler tasks will be logged but not propagated,
         allowing processing to continue. If False, the first exception stops
@@ -82,132 +358,23 @@ async def process_concurrently[Element](  # noqa: C901, PLR0912, PLR0915
     ... )
 
     """
-    assert concurrent_tasks > 0  # nosec: B101
-    tasks: MutableSet[Task[None]] = set()
+    workers: int
+    limit: Callable[[], int] | None = None  # only adaptive limit changes over time
+    if isinstance(concurrent_tasks, AdaptiveConcurrency):
+        handler = concurrent_tasks.measured(handler)
+        limit = _limit_of(concurrent_tasks)
+        workers = concurrent_tasks.limit  # more workers are spawned when the limit grows
 
-    if ignore_exceptions:
-
-        async def process(
-            element: Element,
-            /,
-        ) -> None:
-            try:
-                await handler(element)
-
-            except Exception as exc:
-                ctx.log_error(
-                    f"Concurrent processing error - {type(exc)}: {exc}",
-                    exception=exc,
-                )
-                # do not propagate exception
     else:
+        assert concurrent_tasks > 0  # nosec: B101
+        workers = concurrent_tasks
 
-        async def process(
-            element: Element,
-            /,
-        ) -> None:
-            try:
-                await handler(element)
-
-            except Exception as exc:
-                ctx.log_error(
-                    f"Concurrent processing error - {type(exc)}: {exc}",
-                    exception=exc,
-                )
-                raise  # reraise exception
-
-    async with ContextTaskGroup():  # local task group for more granular management
-        if isinstance(source, AsyncIterable):
-            async for element in source:
-                tasks.add(ctx.spawn(process, element))
-                if len(tasks) < concurrent_tasks:
-                    continue  # keep spawning tasks
-
-                try:
-                    completed, tasks = await wait(
-                        tasks,
-                        return_when=FIRST_COMPLETED,
-                    )
-
-                except CancelledError:
-                    for task in tasks:
-                        if not task.done() or task.cancelled():
-                            continue  # examine only done tasks
-
-                        exc: BaseException | None = task.exception()
-                        if exc is not None:
-                            raise exc from None  # raise task error and break processing
-
-                    raise  # raise cancellation
-
-                else:
-                    for task in completed:
-                        if task.cancelled():
-                            continue
-
-                        exc: BaseException | None = task.exception()
-                        if exc is not None:
-                            raise exc from None  # raise task error and break processing
-
-        else:
-            assert isinstance(source, Iterable)  # nosec: B101
-            for element in source:
-                tasks.add(ctx.spawn(process, element))
-                if len(tasks) < concurrent_tasks:
-                    continue  # keep spawning tasks
-
-                try:
-                    completed, tasks = await wait(
-                        tasks,
-                        return_when=FIRST_COMPLETED,
-                    )
-
-                except CancelledError:
-                    for task in tasks:
-                        if not task.done() or task.cancelled():
-                            continue  # examine only done tasks
-
-                        exc: BaseException | None = task.exception()
-                        if exc is not None:
-                            raise exc from None  # raise task error and break processing
-
-                    raise  # raise cancellation
-
-                else:
-                    for task in completed:
-                        if task.cancelled():
-                            continue
-
-                        exc: BaseException | None = task.exception()
-                        if exc is not None:
-                            raise exc from None  # raise task error and break processing
-
-        if tasks:
-            try:
-                completed, _ = await wait(
-                    tasks,
-                    return_when=ALL_COMPLETED,
-                )
-
-            except CancelledError:
-                for task in tasks:
-                    if not task.done() or task.cancelled():
-                        continue  # examine only done tasks
-
-                    exc: BaseException | None = task.exception()
-                    if exc is not None:
-                        raise exc from None  # raise task error and break processing
-
-                raise  # raise cancellation
-
-            else:
-                for task in completed:
-                    if task.cancelled():
-                        continue
-
-                    exc: BaseException | None = task.exception()
-                    if exc is not None:
-                        raise exc from None  # raise task error and break processing
+    await _ProcessingWorkers(
+        source,
+        handler=handler,
+        limit=limit,
+        ignore_exceptions=ignore_exceptions,
+    ).run(workers)
 
 
 @overload
@@ -216,7 +383,7 @@ async def execute_concurrently[Element, Result](
     /,
     elements: AsyncIterable[Element] | Iterable[Element],
     *,
-    concurrent_tasks: int = 2,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
 ) -> Sequence[Result]: ...
 
 
@@ -226,7 +393,7 @@ async def execute_concurrently[Element, Result](
     /,
     elements: AsyncIterable[Element] | Iterable[Element],
     *,
-    concurrent_tasks: int = 2,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
     return_exceptions: Literal[True],
 ) -> Sequence[Result | Exception]: ...
 
@@ -236,7 +403,7 @@ async def execute_concurrently[Element, Result](  # noqa: C901, PLR0912, PLR0915
     /,
     elements: AsyncIterable[Element] | Iterable[Element],
     *,
-    concurrent_tasks: int = 2,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
     return_exceptions: bool = False,
 ) -> Sequence[Result | Exception] | Sequence[Result]:
     """Execute handler for each element from a collection concurrently.
@@ -260,9 +427,11 @@ async def execute_concurrently[Element, Result](  # noqa: C901, PLR0912, PLR0915
     elements : AsyncIterable[Element] | Iterable[Element]
         A source of elements to process. The source size determines
         the result sequence length.
-    concurrent_tasks : int, default=2
+    concurrent_tasks : int | AdaptiveConcurrency, default=2
         Maximum number of concurrent tasks. Must be greater than 0. Higher
-        values allow more parallelism but consume more resources.
+        values allow more parallelism but consume more resources. When
+        AdaptiveConcurrency is provided, the limit follows observed latency
+        and errors of the tasks instead.
     return_exceptions : bool, default=False
         If True, exceptions from handler tasks are included in the results
         as Exception instances. If False, the first exception stops
@@ -308,7 +477,10 @@ async def execute_concurrently[Element, Result](  # noqa: C901, PLR0912, PLR0915
     ...         print(f"Got data from {url}")
 
     """
-    assert concurrent_tasks > 0  # nosec: B101
+    limit: Callable[[], int] = _limit_of(concurrent_tasks)
+    if isinstance(concurrent_tasks, AdaptiveConcurrency):
+        handler = concurrent_tasks.measured(handler)
+
     tasks: MutableSet[Task[Result | Exception]] = set()
     results: MutableSequence[Task[Result | Exception]] = []  # ordered results collection
 
@@ -346,34 +518,32 @@ async def execute_concurrently[Element, Result](  # noqa: C901, PLR0912, PLR0915
                 task: Task[Any] = ctx.spawn(process, element)
                 results.append(task)
                 tasks.add(task)
-                if len(tasks) < concurrent_tasks:
-                    continue  # keep spawning tasks
-
-                try:
-                    completed, tasks = await wait(
-                        tasks,
-                        return_when=FIRST_COMPLETED,
-                    )
+                while len(tasks) >= limit():  # wait until there is a free slot
+                    try:
+                        completed, tasks = await wait(
+                            tasks,
+                            return_when=FIRST_COMPLETED,
+                        )
 
-                except CancelledError:
-                    for task in tasks:
-                        if not task.done() or task.cancelled():
-                            continue  # examine only done tasks
+                    except CancelledError:
+                        for task in tasks:
+                            if not task.done() or task.cancelled():
+                                continue  # examine only done tasks
 
-                        exc: BaseException | None = task.exception()
-                        if exc is not None:
-                            raise exc from None  # raise task error and break processing
+                            exc: BaseException | None = task.exception()
+                            if exc is not None:
+                                raise exc from None  # raise task error and break processing
 
-                    raise  # raise cancellation
+                        raise  # raise cancellation
 
-                else:
-                    for task in completed:
-                        if task.cancelled():
-                            continue
+                    else:
+                        for task in completed:
+                            if task.cancelled():
+                                continue
 
-                        exc: BaseException | None = task.exception()
-                        if exc is not None:
-                            raise exc from None  # raise task error and break processing
+                            exc: BaseException | None = task.exception()
+                            if exc is not None:
+                                raise exc from None  # raise task error and break processing
 
         else:
             assert isinstance(elements, Iterable)  # nosec: B101
@@ -381,34 +551,32 @@ async def execute_concurrently[Element, Result](  # noqa: C901, PLR0912, PLR0915
                 task: Task[Any] = ctx.spawn(process, element)
                 results.append(task)
                 tasks.add(task)
-                if len(tasks) < concurrent_tasks:
-                    continue  # keep spawning tasks
-
-                try:
-                    completed, tasks = await wait(
-                        tasks,
-                        return_when=FIRST_COMPLETED,
-                    )
+                while len(tasks) >= limit():  # wait until there is a free slot
+                    try:
+                        completed, tasks = await wait(
+                            tasks,
+                            return_when=FIRST_COMPLETED,
+                        )
 
-                except CancelledError:
-                    for task in tasks:
-                        if not task.done() or task.cancelled():
-                            continue  # examine only done tasks
+                    except CancelledError:
+                        for task in tasks:
+                            if not task.done() or task.cancelled():
+                                continue  # examine only done tasks
 
-                        exc: BaseException | None = task.exception()
-                        if exc is not None:
-                            raise exc from None  # raise task error and break processing
+                            exc: BaseException | None = task.exception()
+                            if exc is not None:
+                                raise exc from None  # raise task error and break processing
 
-                    raise  # raise cancellation
+                        raise  # raise cancellation
 
-                else:
-                    for task in completed:
-                        if task.cancelled():
-                            continue
+                    else:
+                        for task in completed:
+                            if task.cancelled():
+                                continue
 
-                        exc: BaseException | None = task.exception()
-                        if exc is not None:
-                            raise exc from None  # raise task error and break processing
+                            exc: BaseException | None = task.exception()
+                            if exc is not None:
+                                raise exc from None  # raise task error and break processing
 
         if tasks:
             try:
@@ -440,13 +608,362 @@ async def execute_concurrently[Element, Result](  # noqa: C901, PLR0912, PLR0915
     return [result.result() for result in results]
 
 
+@overload
+def execute_concurrently_streaming[Element, Result](
+    handler: Callable[[Element], Coroutine[None, None, Result]],
+    /,
+    elements: AsyncIterable[Element] | Iterable[Element],
+    *,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
+    ordered: bool = False,
+    reorder_buffer: int | None = None,
+) -> AsyncIterator[Result]: ...
+
+
+@overload
+def execute_concurrently_streaming[Element, Result](
+    handler: Callable[[Element], Coroutine[None, None, Result]],
+    /,
+    elements: AsyncIterable[Element] | Iterable[Element],
+    *,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
+    ordered: bool = False,
+    reorder_buffer: int | None = None,
+    return_exceptions: Literal[True],
+) -> AsyncIterator[Result | Exception]: ...
+
+
+async def execute_concurrently_streaming[Element, Result](
+    handler: Callable[[Element], Coroutine[None, None, Result]],
+    /,
+    elements: AsyncIterable[Element] | Iterable[Element],
+    *,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
+    ordered: bool = False,
+    reorder_buffer: int | None = None,
+    return_exceptions: bool = False,
+) -> AsyncIterator[Result | Exception]:
+    """Execute handler for each element concurrently, streaming the results.
+
+    Streaming counterpart of `execute_concurrently` yielding results as soon as
+    they are available instead of collecting them all. Elements are pulled from
+    the source only when there is capacity for their results: while the consumer
+    does not request the next result, at most the limit of tasks keep running and
+    no further elements are requested. This allows processing sources of any size
+    with constant memory.
+
+    By default results are yielded in the order of completion. When ``ordered`` is
+    True, results are yielded in the order of the input elements, results completed
+    ahead of the earliest still running task are held in a reorder buffer. When
+    the buffer is full no new tasks are started until the earliest task completes.
+
+    Parameters
+    ----------
+    handler : Callable[[Element], Coroutine[None, None, Result]]
+        A coroutine function that processes each element and returns a result.
+    elements : AsyncIterable[Element] | Iterable[Element]
+        A source of elements to process.
+    concurrent_tasks : int | AdaptiveConcurrency, default=2
+        Maximum number of concurrent tasks, see `execute_concurrently`.
+    ordered : bool, default=False
+        If True, results are yielded in the same order as input elements.
+    reorder_buffer : int | None, default=None
+        Maximum number of completed results held while waiting for earlier results
+        when ordered. None uses the current concurrency limit.
+    return_exceptions : bool, default=False
+        If True, exceptions from handler tasks are yielded as results. If False,
+        the first exception stops processing and is raised.
+
+    Yields
+    ------
+    Result or Result | Exception
+        Results of handler invocations, in completion or input order.
+
+    Raises
+    ------
+    CancelledError
+        If the consumer is cancelled, propagated after cancelling all running tasks.
+    Exception
+        Any exception raised by handler tasks when return_exceptions is False.
+
+    Examples
+    --------
+    >>> async for document in execute_concurrently_streaming(
+    ...     fetch_document,
+    ...     document_ids(),
+    ...     concurrent_tasks=16,
+    ...     ordered=True,
+    ... ):
+    ...     await index(document)
+
+    Notes
+    -----
+    Closing the iterator before it is exhausted cancels all running tasks.
+
+    """
+    assert reorder_buffer is None or reorder_buffer >= 0  # nosec: B101
+    limit: Callable[[], int] = _limit_of(concurrent_tasks)
+    if isinstance(concurrent_tasks, AdaptiveConcurrency):
+        handler = concurrent_tasks.measured(handler)
+
+    execution: _StreamingExecution[Element, Result] = _StreamingExecution(
+        handler,
+        limit=limit,
+        ordered=ordered,
+        reorder_buffer=reorder_buffer,
+        return_exceptions=return_exceptions,
+    )
+    # running tasks are owned by the iterator, not by a task group which would
+    # cancel the consumer task on failure while it could be awaiting anything else
+    reader: Task[None] | None = None
+    sync_iterator: Iterator[Element] | None = None
+    if isinstance(elements, AsyncIterable):
+        # single task pulls elements from the async source whenever there is capacity
+        reader = get_running_loop().create_task(execution.read(aiter(elements)))
+
+    else:
+        assert isinstance(elements, Iterable)  # nosec: B101
+        sync_iterator = iter(elements)
+
+    try:
+        while True:
+            if sync_iterator is not None:
+                # pull new elements only when there is capacity for their results
+                execution.pull(sync_iterator)
+
+            completed: Task[Result] | None = execution.completed()
+            if completed is not None:
+                yield execution.result(completed)
+
+            elif execution.finished:
+                return  # all elements processed
+
+            else:
+                await execution.wait()
+
+    finally:
+        if reader is not None:
+            reader.cancel()
+
+        execution.cancel()
+
+
+async def process_batches_concurrently[Element](
+    source: AsyncIterable[Element] | Iterable[Element],
+    /,
+    handler: Callable[[Sequence[Element]], Coroutine[None, None, None]],
+    *,
+    batch_size: int = 32,
+    batch_linger: float | None = 0.05,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
+    ignore_exceptions: bool = False,
+) -> None:
+    """Process batches of elements from an iterable concurrently.
+
+    Groups consecutive elements from the source into batches and processes them
+    with the provided handler in the same way as `process_concurrently` processes
+    single elements. A batch is dispatched when it reaches ``batch_size`` elements,
+    when ``batch_linger`` seconds have passed since its first element arrived from
+    an asynchronous source, or when the source is exhausted.
+
+    Parameters
+    ----------
+    source : AsyncIterable[Element] | Iterable[Element]
+        An iterable providing elements to process.
+    handler : Callable[[Sequence[Element]], Coroutine[None, None, None]]
+        A coroutine function that processes each batch of elements.
+    batch_size : int, default=32
+        Maximum number of elements in a single batch. Must be greater than 0.
+    batch_linger : float | None, default=0.05
+        Maximum time in seconds to wait for filling a batch with elements from
+        an asynchronous source. None waits until the batch is full or the source
+        is exhausted. Elements of synchronous sources are available immediately.
+    concurrent_tasks : int | AdaptiveConcurrency, default=2
+        Maximum number of concurrently processed batches, see `process_concurrently`.
+    ignore_exceptions : bool, default=False
+        If True, exceptions from handler tasks will be logged but not propagated,
+        allowing processing to continue. If False, the first exception stops
+        all processing.
+
+    Raises
+    ------
+    CancelledError
+        If the function is cancelled, propagated after cancelling all running tasks.
+    Exception
+        Any exception raised by handler tasks when ignore_exceptions is False.
+
+    Examples
+    --------
+    >>> async def store(rows: Sequence[Row]) -> None:
+    ...     await database.insert_many(rows)
+    ...
+    >>> await process_batches_concurrently(
+    ...     rows(),
+    ...     store,
+    ...     batch_size=500,
+    ...     concurrent_tasks=4,
+    ... )
+
+    """
+    await process_concurrently(
+        _batches(
+            source,
+            size=batch_size,
+            linger=batch_linger,
+        ),
+        handler,
+        concurrent_tasks=concurrent_tasks,
+        ignore_exceptions=ignore_exceptions,
+    )
+
+
+@overload
+async def execute_batches_concurrently[Element, Result](
+    handler: Callable[[Sequence[Element]], Coroutine[None, None, Sequence[Result]]],
+    /,
+    elements: AsyncIterable[Element] | Iterable[Element],
+    *,
+    batch_size: int = 32,
+    batch_linger: float | None = 0.05,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
+) -> Sequence[Result]: ...
+
+
+@overload
+async def execute_batches_concurrently[Element, Result](
+    handler: Callable[[Sequence[Element]], Coroutine[None, None, Sequence[Result]]],
+    /,
+    elements: AsyncIterable[Element] | Iterable[Element],
+    *,
+    batch_size: int = 32,
+    batch_linger: float | None = 0.05,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
+    return_exceptions: Literal[True],
+) -> Sequence[Result | Exception]: ...
+
+
+async def execute_batches_concurrently[Element, Result](
+    handler: Callable[[Sequence[Element]], Coroutine[None, None, Sequence[Result]]],
+    /,
+    elements: AsyncIterable[Element] | Iterable[Element],
+    *,
+    batch_size: int = 32,
+    batch_linger: float | None = 0.05,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
+    return_exceptions: bool = False,
+) -> Sequence[Result | Exception] | Sequence[Result]:
+    """Execute handler for batches of elements from a collection concurrently.
+
+    Groups consecutive elements into batches the same way as
+    `process_batches_concurrently` and executes the handler for each batch in the
+    same way as `execute_concurrently` executes it for single elements. The handler
+    returns one result for each element of the batch, results of all batches are
+    returned as a single sequence in the same order as the input elements.
+
+    Parameters
+    ----------
+    handler : Callable[[Sequence[Element]], Coroutine[None, None, Sequence[Result]]]
+        A coroutine function that processes each batch and returns results for
+        each of its elements in the same order.
+    elements : AsyncIterable[Element] | Iterable[Element]
+        A source of elements to process.
+    batch_size : int, default=32
+        Maximum number of elements in a single batch. Must be greater than 0.
+    batch_linger : float | None, default=0.05
+        Maximum time in seconds to wait for filling a batch with elements from
+        an asynchronous source. None waits until the batch is full or the source
+        is exhausted.
+    concurrent_tasks : int | AdaptiveConcurrency, default=2
+        Maximum number of concurrently executed batches, see `execute_concurrently`.
+    return_exceptions : bool, default=False
+        If True, an exception raised for a batch is returned as the result of
+        each of its elements. If False, the first exception stops processing
+        and is raised.
+
+    Returns
+    -------
+    Sequence[Result] or Sequence[Result | Exception]
+        Results for each element, in the same order as input elements.
+
+    Raises
+    ------
+    CancelledError
+        If the function is cancelled, propagated after cancelling all running tasks.
+    ValueError
+        When the handler returns a different number of results than the number
+        of elements in the batch and return_exceptions is False.
+    Exception
+        Any exception raised by handler tasks when return_exceptions is False.
+
+    Examples
+    --------
+    >>> async def embed(texts: Sequence[str]) -> Sequence[Embedding]:
+    ...     return await client.embed_many(texts)
+    ...
+    >>> embeddings = await execute_batches_concurrently(
+    ...     embed,
+    ...     texts,
+    ...     batch_size=64,
+    ... )
+    >>> # embeddings[0] corresponds to texts[0], embeddings[1] to texts[1], etc.
+
+    """
+
+    async def execute(
+        batch: Sequence[Element],
+        /,
+    ) -> Sequence[Result]:
+        results: Sequence[Result] = await handler(batch)
+        if len(results) != len(batch):
+            raise ValueError(
+                f"Batch handler returned {len(results)} results for {len(batch)} elements"
+            )
+
+        return results
+
+    batches: AsyncIterable[Sequence[Element]] | Iterable[Sequence[Element]] = _batches(
+        elements,
+        size=batch_size,
+        linger=batch_linger,
+    )
+    if not return_exceptions:
+        return [
+            result
+            for batch_results in await execute_concurrently(
+                execute,
+                batches,
+                concurrent_tasks=concurrent_tasks,
+            )
+            for result in batch_results
+        ]
+
+    # sizes of batches in the order of their results, required to expand batch failures
+    sizes: MutableSequence[int] = []
+    # failures propagate out of the handler task, so adaptive limit is able to back off
+    batches_results: Sequence[Sequence[Result] | Exception] = await execute_concurrently(
+        execute,
+        _sizes_recording(batches, sizes=sizes),
+        concurrent_tasks=concurrent_tasks,
+        return_exceptions=True,
+    )
+
+    return [
+        result
+        for size, batch_results in zip(sizes, batches_results, strict=True)
+        for result in (
+            # share exception for each element of the batch
+            [batch_results] * size if isinstance(batch_results, Exception) else batch_results
+        )
+    ]
+
+
 @overload
 async def concurrently[Result](
     coroutines: AsyncIterable[Coroutine[None, None, Result]]
     | Iterable[Coroutine[None, None, Result]],
     /,
     *,
-    concurrent_tasks: int = 2,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
     return_exceptions: Literal[False] = False,
 ) -> Sequence[Result]: ...
 
@@ -457,7 +974,7 @@ async def concurrently[Result](
     | Iterable[Coroutine[None, None, Result]],
     /,
     *,
-    concurrent_tasks: int = 2,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
     return_exceptions: Literal[True],
 ) -> Sequence[Result | Exception]: ...
 
@@ -467,7 +984,7 @@ async def concurrently[Result](  # noqa: C901, PLR0912, PLR0915
     | Iterable[Coroutine[None, None, Result]],
     /,
     *,
-    concurrent_tasks: int = 2,
+    concurrent_tasks: int | AdaptiveConcurrency = 2,
     return_exceptions: bool = False,
 ) -> Sequence[Result | Exception] | Sequence[Result]:
     """Execute multiple coroutines concurrently with controlled parallelism.
@@ -490,9 +1007,11 @@ async def concurrently[Result](  # noqa: C901, PLR0912, PLR0915
     coroutines : AsyncIterable[Coroutine] | Iterable[Coroutine]
         A collection of coroutine objects to execute. Each coroutine should
         return a Result type value.
-    concurrent_tasks : int, default=2
+    concurrent_tasks : int | AdaptiveConcurrency, default=2
         Maximum number of concurrent tasks. Must be greater than 0. Higher
-        values allow more parallelism but consume more resources.
+        values allow more parallelism but consume more resources. When
+        AdaptiveConcurrency is provided, the limit follows observed latency
+        and errors of the tasks instead.
     return_exceptions : bool, default=False
         If True, exceptions from coroutines are included in the results
         as Exception instances. If False, the first exception stops
@@ -541,7 +1060,11 @@ async def concurrently[Result](  # noqa: C901, PLR0912, PLR0915
     ...         print(f"Coroutine {i} succeeded")
 
     """
-    assert concurrent_tasks > 0  # nosec: B101
+    limit: Callable[[], int] = _limit_of(concurrent_tasks)
+    awaiting: Callable[[Coroutine[None, None, Result]], Awaitable[Result]] = _awaitable
+    if isinstance(concurrent_tasks, AdaptiveConcurrency):
+        awaiting = concurrent_tasks.measured(_awaited)
+
     tasks: MutableSet[Task[Any]] = set()
     results: MutableSequence[Task[Any]] = []  # ordered results collection
 
@@ -552,7 +1075,7 @@ async def concurrently[Result](  # noqa: C901, PLR0912, PLR0915
             /,
         ) -> Result | Exception:
             try:
-                return await coroutine
+                return await awaiting(coroutine)
 
             except Exception as exc:
                 return exc  # return exception as result
@@ -564,7 +1087,7 @@ async def concurrently[Result](  # noqa: C901, PLR0912, PLR0915
             /,
         ) -> Result | Exception:
             try:
-                return await coroutine
+                return await awaiting(coroutine)
 
             except Exception as exc:
                 ctx.log_error(
@@ -579,46 +1102,7 @@ async def concurrently[Result](  # noqa: C901, PLR0912, PLR0915
                 task: Task[Any] = ctx.spawn(process, element)
                 results.append(task)
                 tasks.add(task)
-                if len(tasks) < concurrent_tasks:
-                    continue  # keep spawning tasks
-
-                try:
-                    completed, tasks = await wait(
-                        tasks,
-                        return_when=FIRST_COMPLETED,
-                    )
-
-                except CancelledError:
-                    for task in tasks:
-                        if not task.done() or task.cancelled():
-                            continue  # examine only done tasks
-
-                        exc: BaseException | None = task.exception()
-                        if exc is not None:
-                            raise exc from None  # raise task error and break processing
-
-                    raise  # raise cancellation
-
-                else:
-                    for task in completed:
-                        if task.cancelled():
-                            continue
-
-                        exc: BaseException | None = task.exception()
-                        if exc is not None:
-                            raise exc from None  # raise task error and break processing
-
-        else:
-            assert isinstance(coroutines, Iterable)  # nosec: B101
-            iterator: Iterator[Coroutine[None, None, Result]] = iter(coroutines)
-            try:
-                for element in iterator:
-                    task: Task[Any] = ctx.spawn(process, element)
-                    results.append(task)
-                    tasks.add(task)
-                    if len(tasks) < concurrent_tasks:
-                        continue  # keep spawning tasks
-
+                while len(tasks) >= limit():  # wait until there is a free slot
                     try:
                         completed, tasks = await wait(
                             tasks,
@@ -645,6 +1129,41 @@ async def concurrently[Result](  # noqa: C901, PLR0912, PLR0915
                             if exc is not None:
                                 raise exc from None  # raise task error and break processing
 
+        else:
+            assert isinstance(coroutines, Iterable)  # nosec: B101
+            iterator: Iterator[Coroutine[None, None, Result]] = iter(coroutines)
+            try:
+                for element in iterator:
+                    task: Task[Any] = ctx.spawn(process, element)
+                    results.append(task)
+                    tasks.add(task)
+                    while len(tasks) >= limit():  # wait until there is a free slot
+                        try:
+                            completed, tasks = await wait(
+                                tasks,
+                                return_when=FIRST_COMPLETED,
+                            )
+
+                        except CancelledError:
+                            for task in tasks:
+                                if not task.done() or task.cancelled():
+                                    continue  # examine only done tasks
+
+                                exc: BaseException | None = task.exception()
+                                if exc is not None:
+                                    raise exc from None  # raise task error and break processing
+
+                            raise  # raise cancellation
+
+                        else:
+                            for task in completed:
+                                if task.cancelled():
+                                    continue
+
+                                exc: BaseException | None = task.exception()
+                                if exc is not None:
+                                    raise exc from None  # raise task error and break processing
+
             finally:
                 # cleanup already created coros
                 if isinstance(coroutines, Collection):
@@ -800,3 +1319,836 @@ async def stream_concurrently[ElementA, ElementB](  # noqa: C901
 
             if not task_b.done():
                 task_b.cancel()
+
+
+async def merge_streams[Element](
+    *sources: AsyncIterable[Element],
+    exhaustive: bool = False,
+    fairness: Literal["first_ready", "round_robin"] = "first_ready",
+    source_buffer: int = 1,
+) -> AsyncIterator[Element]:
+    """Merge any number of async streams consumed concurrently.
+
+    Generalization of `stream_concurrently` for any number of sources. Each source
+    is consumed by a single producer task placing its elements in a buffer shared
+    by all sources, the merged stream takes elements from that buffer without any
+    additional task or handoff for each element. Each source can have at most
+    ``source_buffer`` elements waiting in the buffer, after that its producer waits
+    until the consumer takes them, so a fast source can't fill the buffer.
+
+    Parameters
+    ----------
+    *sources : AsyncIterable[Element]
+        Async iterables to consume from.
+    exhaustive : bool, default=False
+        If False (default), streaming ends when any source becomes exhausted.
+        If True, streaming ends when all sources become exhausted.
+    fairness : Literal["first_ready", "round_robin"], default="first_ready"
+        Order of taking elements from the buffer. "first_ready" yields elements in
+        the order they were produced. "round_robin" takes a single element from each
+        source with buffered elements in turn, so quickly producing sources can't
+        delay the others.
+    source_buffer : int, default=1
+        Maximum number of elements buffered for a single source, has to be greater than zero.
+
+    Yields
+    ------
+    Element
+        Elements from all sources as they become available.
+
+    Raises
+    ------
+    Exception
+        Any exception raised by a source iterator, after elements it has produced earlier.
+
+    Examples
+    --------
+    >>> async for record in merge_streams(
+    ...     *(read_shard(shard) for shard in shards),
+    ...     exhaustive=True,
+    ...     fairness="round_robin",
+    ... ):
+    ...     await index(record)
+
+    Notes
+    -----
+    Closing the iterator before it is exhausted cancels all producers.
+
+    """
+    assert source_buffer > 0  # nosec: B101
+    merger: _StreamMerger[Element] = _StreamMerger(
+        len(sources),
+        capacity=source_buffer,
+        round_robin=fairness == "round_robin",
+    )
+    loop: AbstractEventLoop = get_running_loop()
+    # producers are owned by the iterator, not by a task group which would
+    # cancel the consumer task on failure while it could be awaiting anything else
+    producers: Sequence[Task[None]] = tuple(
+        loop.create_task(merger.produce(index, source)) for index, source in enumerate(sources)
+    )
+    remaining: int = len(producers)
+    try:
+        while remaining:
+            if not merger.ready:
+                await merger.available()
+
+            element: Element | _SourceEnd = merger.take()
+            if not isinstance(element, _SourceEnd):
+                yield element
+                continue
+
+            if element.exception is not None:
+                raise element.exception
+
+            if not exhaustive:
+                return  # finish when any source becomes exhausted
+
+            remaining -= 1
+
+    finally:
+        for producer in producers:
+            producer.cancel()
+
+
+@final
+class _ProcessingWorkers[Element]:
+    # long-lived workers pulling elements from a shared source, an adaptive limit
+    # spawns workers when growing and retires them when shrinking
+    __slots__ = (
+        "_context",
+        "_elements",
+        "_exhausted",
+        "_failure",
+        "_handler",
+        "_ignore_exceptions",
+        "_limit",
+        "_pulling",
+        "_source",
+        "_workers",
+    )
+
+    def __init__(
+        self,
+        source: AsyncIterable[Element] | Iterable[Element],
+        /,
+        *,
+        handler: Callable[[Element], Coroutine[None, None, None]],
+        limit: Callable[[], int] | None,
+        ignore_exceptions: bool,
+    ) -> None:
+        self._source: AsyncIterable[Element] | Iterable[Element] = source
+        self._handler: Callable[[Element], Coroutine[None, None, None]] = handler
+        self._limit: Callable[[], int] | None = limit
+        self._ignore_exceptions: bool = ignore_exceptions
+        self._exhausted: bool = False
+        self._failure: BaseException | None = None
+        self._pulling: Lock = Lock()
+        # running workers, each worker removes itself when finishing
+        self._workers: MutableSet[Task[None]] = set()
+        self._elements: AsyncIterator[Element] | Iterator[Element] | None = None
+        self._context: Context | None = None
+
+    async def run(
+        self,
+        workers: int,
+        /,
+    ) -> None:
+        async with ContextTaskGroup():  # local task group for more granular management
+            if isinstance(self._source, AsyncIterable):
+                self._elements = aiter(self._source)
+
+            else:
+                assert isinstance(self._source, Iterable)  # nosec: B101
+                self._elements = iter(self._source)
+
+            # workers spawned later start from the initial context, not from the
+            # context of a worker which could be altered by its handler
+            self._context = copy_context()
+            self._spawn(workers)
+
+        if self._failure is not None:
+            raise self._failure from None  # raise task error and break processing
+
+    def _spawn(
+        self,
+        count: int,
+        /,
+    ) -> None:
+        assert self._context is not None  # nosec: B101
+        for _ in range(count):
+            worker: Task[None]
+            if isinstance(self._elements, AsyncIterator):
+                worker = self._context.run(ctx.spawn, self._work_async, self._elements)
+
+            else:
+                assert isinstance(self._elements, Iterator)  # nosec: B101
+                worker = self._context.run(ctx.spawn, self._work, self._elements)
+
+            self._workers.add(worker)
+
+    async def _work(
+        self,
+        elements: Iterator[Element],
+        /,
+    ) -> None:
+        worker: Task[Any] | None = current_task()
+        assert worker is not None  # nosec: B101
+        processed: int = 0
+        try:
+            while self._failure is None and not self._exhausted:
+                element: Element
+                try:
+                    element = next(elements)
+
+                except StopIteration:
+                    self._exhausted = True
+                    return
+
+                except Exception as exc:
+                    self._fail(exc)
+                    return
+
+                await self._process(element)
+                if worker.cancelling():
+                    return  # cancellation was suppressed by the handler
+
+                if self._limit is not None and self._retiring():
+                    return
+
+                processed += 1
+                if processed % _YIELD_INTERVAL == 0:
+                    # handlers completing without suspending would otherwise block the loop
+                    await sleep(0)
+
+        finally:
+            self._workers.discard(worker)
+
+    async def _work_async(
+        self,
+        elements: AsyncIterator[Element],
+        /,
+    ) -> None:
+        worker: Task[Any] | None = current_task()
+        assert worker is not None  # nosec: B101
+        processed: int = 0
+        try:
+            while self._failure is None and not self._exhausted:
+                element: Element
+                try:
+                    async with self._pulling:  # async iterators can't be awaited concurrently
+                        if self._exhausted:
+                            return
+
+                        element = await anext(elements)
+
+                except StopAsyncIteration:
+                    self._exhausted = True
+                    return
+
+                except Exception as exc:
+                    self._fail(exc)
+                    return
+
+                await self._process(element)
+                if worker.cancelling():
+                    return  # cancellation was suppressed by the handler
+
+                if self._limit is not None and self._retiring():
+                    return
+
+                processed += 1
+                if processed % _YIELD_INTERVAL == 0:
+                    # handlers and sources completing without suspending would block the loop
+                    await sleep(0)
+
+        finally:
+            self._workers.discard(worker)
+
+    async def _process(
+        self,
+        element: Element,
+        /,
+    ) -> None:
+        try:
+            await self._handler(element)
+
+        except Exception as exc:
+            ctx.log_error(
+                f"Concurrent processing error - {type(exc)}: {exc}",
+                exception=exc,
+            )
+            if not self._ignore_exceptions:
+                self._fail(exc)
+
+    def _retiring(self) -> bool:
+        assert self._limit is not None  # nosec: B101
+        limit: int = self._limit()
+        if len(self._workers) > limit:
+            return True  # limit has shrunk, the calling worker stops
+
+        if len(self._workers) < limit and self._failure is None and not self._exhausted:
+            self._spawn(limit - len(self._workers))  # limit has grown
+
+        return False
+
+    def _fail(
+        self,
+        exc: BaseException,
+        /,
+    ) -> None:
+        if self._failure is not None:
+            return  # keep the first failure
+
+        self._failure = exc
+        current: Task[Any] | None = current_task()
+        for worker in tuple(self._workers):
+            if worker is not current:
+                worker.cancel()
+
+
+@final
+class _StreamingExecution[Element, Result]:
+    # completed tasks are collected by done callbacks, the consumer and the reader of
+    # an async source wait on a single future each only when there is nothing to do
+    __slots__ = (
+        "_completed",
+        "_consumer",
+        "_exhausted",
+        "_failure",
+        "_handler",
+        "_limit",
+        "_ordered",
+        "_reader",
+        "_reorder_buffer",
+        "_return_exceptions",
+        "_running",
+        "_window",
+    )
+
+    def __init__(
+        self,
+        handler: Callable[[Element], Coroutine[None, None, Result]],
+        /,
+        *,
+        limit: Callable[[], int],
+        ordered: bool,
+        reorder_buffer: int | None,
+        return_exceptions: bool,
+    ) -> None:
+        self._handler: Callable[[Element], Coroutine[None, None, Result]] = handler
+        self._limit: Callable[[], int] = limit
+        self._ordered: bool = ordered
+        self._reorder_buffer: int | None = reorder_buffer
+        self._return_exceptions: bool = return_exceptions
+        self._running: MutableSet[Task[Result]] = set()
+        # completed tasks in the order of completion, used when not ordered
+        self._completed: deque[Task[Result]] = deque()
+        # tasks in the order of input elements including completed ones, used when ordered
+        self._window: deque[Task[Result]] = deque()
+        self._exhausted: bool = False
+        self._failure: BaseException | None = None
+        self._consumer: Future[None] | None = None
+        self._reader: Future[None] | None = None
+
+    @property
+    def finished(self) -> bool:
+        return (
+            self._exhausted
+            and not self._running
+            and not self._completed
+            and not self._window
+            and self._failure is None
+        )
+
+    def pull(
+        self,
+        elements: Iterator[Element],
+        /,
+    ) -> None:
+        while not self._exhausted and self._has_capacity():
+            try:
+                self._start(next(elements))
+
+            except StopIteration:
+                self._exhausted = True
+
+    async def read(
+        self,
+        elements: AsyncIterator[Element],
+        /,
+    ) -> None:
+        try:
+            while True:
+                while not self._has_capacity():
+                    self._reader = get_running_loop().create_future()
+                    try:
+                        await self._reader
+
+                    finally:
+                        self._reader = None
+
+                self._start(await anext(elements))
+
+        except StopAsyncIteration:
+            pass  # source exhausted
+
+        except Exception as exc:
+            if self._failure is None:
+                self._failure = exc  # raised by the consumer
+
+        finally:
+            self._exhausted = True
+            self._resume_consumer()
+
+    def completed(self) -> Task[Result] | None:
+        if self._failure is not None:
+            raise self._failure
+
+        completed: Task[Result]
+        if self._ordered:
+            if not self._window or not self._window[0].done():
+                return None
+
+            completed = self._window.popleft()
+
+        elif self._completed:
+            completed = self._completed.popleft()
+
+        else:
+            return None
+
+        self._resume_reader()  # yielded result frees capacity
+        return completed
+
+    def result(
+        self,
+        task: Task[Result],
+        /,
+    ) -> Result | Exception:
+        exc: BaseException | None = task.exception()
+        if exc is None:
+            return task.result()
+
+        if self._return_exceptions and isinstance(exc, Exception):
+            return exc
+
+        raise exc
+
+    async def wait(self) -> None:
+        self._consumer = get_running_loop().create_future()
+        try:
+            await self._consumer
+
+        finally:
+            self._consumer = None
+
+    def cancel(self) -> None:
+        for task in self._running:
+            task.cancel()
+
+    def _has_capacity(self) -> bool:
+        current_limit: int = self._limit()
+        if not self._ordered:
+            # completed results not yet yielded count until the consumer takes them
+            return len(self._running) + len(self._completed) < current_limit
+
+        if len(self._running) >= current_limit:
+            return False
+
+        # window head is still running, all other tasks in the window may become held results
+        return len(self._window) <= (
+            current_limit if self._reorder_buffer is None else self._reorder_buffer
+        )
+
+    def _start(
+        self,
+        element: Element,
+        /,
+    ) -> None:
+        task: Task[Result] = get_running_loop().create_task(self._process(element))
+        self._running.add(task)
+        if self._ordered:
+            self._window.append(task)
+
+        task.add_done_callback(self._complete)
+
+    async def _process(
+        self,
+        element: Element,
+        /,
+    ) -> Result:
+        try:
+            return await self._handler(element)
+
+        except Exception as exc:
+            if not self._return_exceptions:
+                ctx.log_error(
+                    f"Concurrent execution error - {type(exc)}: {exc}",
+                    exception=exc,
+                )
+
+            raise  # reraise exception, it is examined when yielding results
+
+    def _complete(
+        self,
+        task: Task[Result],
+        /,
+    ) -> None:
+        self._running.discard(task)
+        # retrieving the exception marks it as handled, results left behind after
+        # the first raised error are never examined by the consumer
+        exc: BaseException | None = None if task.cancelled() else task.exception()
+        if not self._ordered:
+            self._completed.append(task)
+
+        elif not (self._return_exceptions or exc is None or self._failure is not None):
+            # raise the first error without waiting for its turn
+            self._failure = exc
+
+        self._resume_consumer()
+        self._resume_reader()
+
+    def _resume_consumer(self) -> None:
+        if self._consumer is not None and not self._consumer.done():
+            self._consumer.set_result(None)
+
+    def _resume_reader(self) -> None:
+        if self._reader is not None and not self._reader.done():
+            self._reader.set_result(None)
+
+
+@final
+class _SourceEnd:
+    # marks the end of a merged source, with its exception when it has failed
+    __slots__ = ("exception",)
+
+    def __init__(
+        self,
+        exception: BaseException | None,
+    ) -> None:
+        self.exception: BaseException | None = exception
+
+
+@final
+class _StreamMerger[Element]:
+    # elements of each source are queued separately, the shared ready queue holds
+    # indices of sources in the order of taking their elements
+    __slots__ = (
+        "_buffers",
+        "_capacity",
+        "_consumer",
+        "_producers",
+        "_ready",
+        "_round_robin",
+    )
+
+    def __init__(
+        self,
+        sources: int,
+        /,
+        *,
+        capacity: int,
+        round_robin: bool,
+    ) -> None:
+        self._buffers: Sequence[deque[Element | _SourceEnd]] = tuple(
+            deque() for _ in range(sources)
+        )
+        self._capacity: int = capacity
+        self._round_robin: bool = round_robin
+        self._ready: deque[int] = deque()
+        self._consumer: Future[None] | None = None
+        # producers waiting for the consumer to take their elements, by source index
+        self._producers: MutableSequence[Future[None] | None] = [None for _ in range(sources)]
+
+    @property
+    def ready(self) -> bool:
+        return bool(self._ready)
+
+    async def available(self) -> None:
+        self._consumer = get_running_loop().create_future()
+        try:
+            await self._consumer
+
+        finally:
+            self._consumer = None
+
+    def take(self) -> Element | _SourceEnd:
+        index: int = self._ready.popleft()
+        buffer: deque[Element | _SourceEnd] = self._buffers[index]
+        element: Element | _SourceEnd = buffer.popleft()
+        if self._round_robin and buffer:
+            self._ready.append(index)  # next element after other ready sources
+
+        producer: Future[None] | None = self._producers[index]
+        if producer is not None:
+            self._producers[index] = None
+            if not producer.done():
+                producer.set_result(None)
+
+        return element
+
+    async def produce(
+        self,
+        index: int,
+        source: AsyncIterable[Element],
+        /,
+    ) -> None:
+        buffer: deque[Element | _SourceEnd] = self._buffers[index]
+        try:
+            async for element in source:
+                self._push(index, element)
+                if len(buffer) >= self._capacity:
+                    producer: Future[None] = get_running_loop().create_future()
+                    self._producers[index] = producer
+                    await producer
+
+            self._push(index, _SourceEnd(None))
+
+        except BaseException as exc:
+            self._push(index, _SourceEnd(exc))
+            if isinstance(exc, CancelledError):
+                raise  # cancellation not requested by the merged stream is also propagated
+
+    def _push(
+        self,
+        index: int,
+        element: Element | _SourceEnd,
+        /,
+    ) -> None:
+        buffer: deque[Element | _SourceEnd] = self._buffers[index]
+        buffer.append(element)
+        if not self._round_robin or len(buffer) == 1:
+            self._ready.append(index)
+
+        if self._consumer is not None and not self._consumer.done():
+            self._consumer.set_result(None)
+
+
+def _limit_of(
+    concurrent_tasks: int | AdaptiveConcurrency,
+    /,
+) -> Callable[[], int]:
+    if isinstance(concurrent_tasks, AdaptiveConcurrency):
+        return lambda: concurrent_tasks.limit
+
+    assert concurrent_tasks > 0  # nosec: B101
+    return lambda: concurrent_tasks
+
+
+def _awaitable[Result](
+    coroutine: Coroutine[None, None, Result],
+    /,
+) -> Awaitable[Result]:
+    return coroutine
+
+
+async def _awaited[Result](
+    coroutine: Coroutine[None, None, Result],
+    /,
+) -> Result:
+    return await coroutine
+
+
+def _batches[Element](
+    source: AsyncIterable[Element] | Iterable[Element],
+    /,
+    *,
+    size: int,
+    linger: float | None,
+) -> AsyncIterable[Sequence[Element]] | Iterable[Sequence[Element]]:
+    assert size > 0  # nosec: B101
+    assert linger is None or linger > 0  # nosec: B101
+    if isinstance(source, AsyncIterable):
+        if linger is None:
+            return _async_batches(source, size=size)
+
+        return _lingering_batches(source, size=size, linger=linger)
+
+    assert isinstance(source, Iterable)  # nosec: B101
+    return batched(source, size, strict=False)
+
+
+def _sizes_recording[Element](
+    batches: AsyncIterable[Sequence[Element]] | Iterable[Sequence[Element]],
+    /,
+    *,
+    sizes: MutableSequence[int],
+) -> AsyncIterable[Sequence[Element]] | Iterable[Sequence[Element]]:
+    if isinstance(batches, AsyncIterable):
+        return _async_sizes_recording(batches, sizes=sizes)
+
+    return _sync_sizes_recording(batches, sizes=sizes)
+
+
+def _sync_sizes_recording[Element](
+    batches: Iterable[Sequence[Element]],
+    /,
+    *,
+    sizes: MutableSequence[int],
+) -> Generator[Sequence[Element]]:
+    for batch in batches:
+        sizes.append(len(batch))
+        yield batch
+
+
+async def _async_sizes_recording[Element](
+    batches: AsyncIterable[Sequence[Element]],
+    /,
+    *,
+    sizes: MutableSequence[int],
+) -> AsyncGenerator[Sequence[Element]]:
+    async for batch in batches:
+        sizes.append(len(batch))
+        yield batch
+
+
+async def _async_batches[Element](
+    source: AsyncIterable[Element],
+    /,
+    *,
+    size: int,
+) -> AsyncGenerator[Sequence[Element]]:
+    batch: MutableSequence[Element] = []
+    async for element in source:
+        batch.append(element)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+
+    if batch:
+        yield batch
+
+
+async def _lingering_batches[Element](
+    source: AsyncIterable[Element],
+    /,
+    *,
+    size: int,
+    linger: float,
+) -> AsyncGenerator[Sequence[Element]]:
+    batches: _LingeringBatches[Element] = _LingeringBatches(
+        source,
+        size=size,
+        linger=linger,
+    )
+    # single task reads elements ahead instead of a task and a timer for each element
+    reader: Task[None] = get_running_loop().create_task(batches.read())
+    try:
+        while (batch := await batches.batch()) is not None:
+            yield batch
+
+    finally:
+        reader.cancel()
+
+
+@final
+class _LingeringBatches[Element]:
+    # elements read ahead of batches, at most a single batch ahead
+    __slots__ = (
+        "_buffer",
+        "_consumer",
+        "_expired",
+        "_failure",
+        "_finished",
+        "_head_arrival",
+        "_iterator",
+        "_linger",
+        "_producer",
+        "_size",
+    )
+
+    def __init__(
+        self,
+        source: AsyncIterable[Element],
+        /,
+        *,
+        size: int,
+        linger: float,
+    ) -> None:
+        self._iterator: AsyncIterator[Element] = aiter(source)
+        self._size: int = size
+        self._linger: float = linger
+        self._buffer: deque[Element] = deque()
+        # loop time when the first element of the buffer was read
+        self._head_arrival: float = 0.0
+        self._finished: bool = False
+        self._failure: Exception | None = None
+        self._expired: bool = False
+        # futures are created only when one side has to wait for the other
+        self._consumer: Future[None] | None = None
+        self._producer: Future[None] | None = None
+
+    async def read(self) -> None:
+        loop: AbstractEventLoop = get_running_loop()
+        try:
+            while True:
+                if len(self._buffer) >= self._size:
+                    self._producer = loop.create_future()
+                    await self._producer
+                    continue
+
+                element: Element = await anext(self._iterator)
+                if not self._buffer:
+                    self._head_arrival = loop.time()
+
+                self._buffer.append(element)
+                self._resume()
+
+        except StopAsyncIteration:
+            pass  # source exhausted
+
+        except Exception as exc:
+            self._failure = exc  # raised after batches of elements read before
+
+        finally:
+            self._finished = True
+            self._resume()
+
+    async def batch(self) -> Sequence[Element] | None:
+        while not self._buffer:
+            if self._finished:
+                if self._failure is not None:
+                    raise self._failure
+
+                return None
+
+            await self._wait()
+
+        loop: AbstractEventLoop = get_running_loop()
+        deadline: float = self._head_arrival + self._linger
+        if len(self._buffer) < self._size and not self._finished and deadline > loop.time():
+            # linger for more elements since the first element of the batch arrived,
+            # elements waiting for a free worker already lingered long enough
+            self._expired = False
+            timer: TimerHandle = loop.call_at(deadline, self._expire)
+            try:
+                while len(self._buffer) < self._size and not self._finished and not self._expired:
+                    await self._wait()
+
+            finally:
+                timer.cancel()
+
+        batch: Sequence[Element] = [
+            self._buffer.popleft() for _ in range(min(self._size, len(self._buffer)))
+        ]
+        if self._producer is not None and not self._producer.done():
+            self._producer.set_result(None)
+
+        return batch
+
+    async def _wait(self) -> None:
+        self._consumer = get_running_loop().create_future()
+        try:
+            await self._consumer
+
+        finally:
+            self._consumer = None
+
+    def _resume(self) -> None:
+        if self._consumer is not None and not self._consumer.done():
+            self._consumer.set_result(None)
+
+    def _expire(self) -> None:
+        self._expired = True
+        self._resume()
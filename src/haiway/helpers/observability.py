@@ -2,7 +2,7 @@ from collections.abc import Mapping
 from logging import Logger, getLogger
 from time import monotonic
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from haiway.context import (
     ContextIdentifier,
@@ -10,6 +10,7 @@ from haiway.context import (
     ObservabilityAttribute,
     ObservabilityLevel,
     ObservabilityMetricKind,
+    unique_id,
 )
 from haiway.utils.formatting import format_str
 
@@ -107,7 +108,7 @@ def LoggerObservability(  # noqa: C901, PLR0915
     root_logger: Logger | None = logger
     scopes: dict[UUID, ScopeStore] = {}
 
-    trace_id: UUID = uuid4()
+    trace_id: UUID = unique_id()
     trace_id_hex: str = trace_id.hex
 
     def trace_identifying(
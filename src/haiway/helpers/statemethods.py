@@ -3,7 +3,7 @@ from functools import update_wrapper
 from typing import Any, Concatenate
 
 from haiway.attributes import State
-from haiway.context.access import ctx
+from haiway.context.state import ContextState
 
 __all__ = ("statemethod",)
 
@@ -60,7 +60,7 @@ class statemethod[Subject: State, **Arguments, Result]:
             *args: Arguments.args,
             **kwargs: Arguments.kwargs,
         ) -> Result:
-            return self._method(ctx.state(owner), *args, **kwargs)
+            return self._method(ContextState.state(owner), *args, **kwargs)
 
         update_wrapper(class_method, self._method)
         return class_method
@@ -0,0 +1,396 @@
+"""JSON encoding and decoding, using a faster decoder when one is available."""
+
+import json
+import re
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from dataclasses import fields, is_dataclass
+from datetime import date, datetime, time
+from enum import Enum
+from importlib import import_module
+from pathlib import PurePath
+from typing import Any, Final, Literal, final
+from uuid import UUID
+
+__all__ = (
+    "JSON_BACKEND",
+    "JSONArrayDecoder",
+    "json_decode",
+    "json_default",
+    "json_encode",
+)
+
+
+def json_default(  # noqa: PLR0911
+    value: Any,
+    /,
+) -> Any:
+    """
+    Convert a value not supported natively by JSON encoders into an encodable one.
+
+    Nested values are not converted eagerly, encoders call this function again
+    for each unsupported element of the returned structure.
+
+    Parameters
+    ----------
+    value : Any
+        Value which could not be encoded directly.
+
+    Returns
+    -------
+    Any
+        Encodable representation of the value.
+
+    Raises
+    ------
+    TypeError
+        If the value has no known JSON representation.
+    """
+    if isinstance(value, UUID):
+        return str(value)
+
+    elif isinstance(value, datetime | date | time):
+        return value.isoformat()
+
+    elif isinstance(value, PurePath):
+        return value.as_posix()
+
+    elif isinstance(value, Enum):
+        return value.value
+
+    elif isinstance(value, Mapping):
+        return dict(value)  # pyright: ignore[reportUnknownArgumentType, reportUnknownVariableType]
+
+    elif is_dataclass(value) and not isinstance(value, type):
+        return {field.name: getattr(value, field.name) for field in fields(value)}
+
+    elif callable(to_mapping := getattr(value, "to_mapping", None)):
+        return to_mapping()
+
+    elif isinstance(value, Iterable) and not isinstance(value, str | bytes | bytearray):
+        return list(value)  # pyright: ignore[reportUnknownArgumentType, reportUnknownVariableType]
+
+    else:
+        raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def json_encode(
+    value: Any,
+    /,
+    *,
+    indent: int | None = None,
+    default: Callable[[Any], Any] = json_default,
+) -> str:
+    """
+    Encode a value to a JSON string.
+
+    Encoding always uses the standard library ``json`` module, so the output does
+    not depend on optional packages installed alongside. Values not supported
+    natively are converted by ``default`` when encountered, nested structures are
+    not converted up front.
+
+    Parameters
+    ----------
+    value : Any
+        Value to encode.
+    indent : int | None, optional
+        Indentation used for pretty-printing.
+    default : Callable[[Any], Any], default=json_default
+        Conversion applied to values not supported natively.
+
+    Returns
+    -------
+    str
+        JSON representation of the value.
+
+    Raises
+    ------
+    TypeError
+        If the value can't be encoded.
+    ValueError
+        If the value contains circular references.
+    """
+    return json.dumps(
+        value,
+        indent=indent,
+        default=default,
+    )
+
+
+def json_decode(
+    value: str | bytes,
+    /,
+) -> Any:
+    """
+    Decode a JSON payload using the fastest available backend.
+
+    ``msgspec`` is used when installed, the standard library ``json`` module is
+    used otherwise. Payloads accepted only by the standard library (``NaN`` and
+    ``Infinity`` literals, out of range numbers, lone surrogates or encodings other
+    than UTF-8) are decoded by it, so results do not depend on the backend.
+
+    Parameters
+    ----------
+    value : str | bytes
+        JSON payload to decode.
+
+    Returns
+    -------
+    Any
+        Decoded value.
+
+    Raises
+    ------
+    ValueError
+        If the payload is not a valid JSON.
+    """
+    if _fast_decode is not None:
+        try:
+            return _fast_decode(value)
+
+        except _fast_decode_errors:
+            if not _standard_only(value):
+                raise  # payload is invalid for the standard decoder as well
+
+    return json.loads(value)
+
+
+def _standard_only(
+    value: str | bytes,
+    /,
+) -> bool:
+    if isinstance(value, str):
+        return _STANDARD_ONLY.search(value) is not None
+
+    return (
+        json.detect_encoding(value) != "utf-8"
+        or _STANDARD_ONLY.search(value.decode(errors="replace")) is not None
+    )
+
+
+def _msgspec_backend() -> tuple[
+    Callable[[str | bytes], Any],
+    tuple[type[Exception], ...],
+]:
+    msgspec: Any = import_module("msgspec")
+    # lone surrogates in str payloads fail when msgspec encodes them to UTF-8
+    return msgspec.json.Decoder().decode, (msgspec.DecodeError, UnicodeEncodeError)
+
+
+def _select_backend() -> tuple[
+    Literal["msgspec", "json"],
+    Callable[[str | bytes], Any] | None,
+    tuple[type[Exception], ...],
+]:
+    try:
+        return ("msgspec", *_msgspec_backend())
+
+    except ImportError:
+        return ("json", None, ())  # msgspec is not installed
+
+
+_backend: Final = _select_backend()
+JSON_BACKEND: Final[Literal["msgspec", "json"]] = _backend[0]
+_fast_decode: Final[Callable[[str | bytes], Any] | None] = _backend[1]
+_fast_decode_errors: Final[tuple[type[Exception], ...]] = _backend[2]
+# constructs accepted by the standard decoder but rejected by msgspec
+_STANDARD_ONLY: Final[re.Pattern[str]] = re.compile(
+    r"NaN|Infinity|[eE][+-]?\d{3}|\\u[dD][89a-fA-F]|[\ud800-\udfff]"
+)
+
+
+@final
+class JSONArrayDecoder:
+    """
+    Incremental decoder of JSON array elements.
+
+    Chunks of the payload are scanned for element boundaries as they arrive and
+    each complete element is decoded separately, so memory usage is bounded by
+    the size of a single element and chunk instead of the whole payload.
+    """
+
+    __slots__ = (
+        "_buffer",
+        "_depth",
+        "_element_start",
+        "_in_string",
+        "_position",
+        "_stage",
+    )
+
+    def __init__(self) -> None:
+        self._buffer: bytearray = bytearray()
+        self._position: int = 0
+        self._element_start: int | None = None
+        self._depth: int = 0
+        self._in_string: bool = False
+        self._stage: Literal["start", "first", "value", "separator", "end"] = "start"
+
+    def feed(
+        self,
+        chunk: str | bytes,
+        /,
+    ) -> Sequence[Any]:
+        """
+        Process the next chunk of the payload.
+
+        Parameters
+        ----------
+        chunk : str | bytes
+            Next part of the JSON payload, chunks can split elements at any point.
+
+        Returns
+        -------
+        Sequence[Any]
+            Elements completed within this chunk, in order of appearance.
+
+        Raises
+        ------
+        ValueError
+            If the payload is not a valid JSON array.
+        """
+        self._buffer += chunk.encode() if isinstance(chunk, str) else chunk
+        elements: list[Any] = []
+        while (element := self._next_element()) is not _INCOMPLETE:
+            elements.append(element)
+
+        # drop already processed data keeping only the pending element
+        consumed: int = self._position if self._element_start is None else self._element_start
+        if consumed:
+            del self._buffer[:consumed]
+            self._position -= consumed
+            if self._element_start is not None:
+                self._element_start = 0
+
+        return elements
+
+    def close(self) -> None:
+        """
+        Finish decoding, verifying that the payload contained a complete array.
+
+        Raises
+        ------
+        ValueError
+            If the payload ended before the array was closed or contains trailing data.
+        """
+        if self._stage != "end" or self._buffer[self._position :].strip():
+            raise ValueError("Incomplete json array")
+
+    def _next_element(self) -> Any:
+        if self._element_start is None and not self._begin_element():
+            return _INCOMPLETE
+
+        return self._scan_element()
+
+    def _begin_element(self) -> bool:
+        buffer: bytearray = self._buffer
+        while self._element_start is None:
+            position: int = _WHITESPACE.match(buffer, self._position).end()  # pyright: ignore[reportOptionalMemberAccess]
+            self._position = position
+            if position >= len(buffer):
+                return False
+
+            char: int = buffer[position]
+            if self._stage == "start":
+                if char != _ARRAY_START:
+                    raise ValueError("Provided json is not an array!")
+
+                self._stage = "first"
+                self._position = position + 1
+
+            elif self._stage == "end":
+                raise ValueError("Unexpected data after json array")
+
+            elif self._stage in ("separator", "first") and char == _ARRAY_END:
+                self._stage = "end"
+                self._position = position + 1
+
+            elif self._stage == "separator":
+                if char != _SEPARATOR:
+                    raise ValueError(f"Expected ',' at position {position} of json array")
+
+                self._stage = "value"
+                self._position = position + 1
+
+            else:  # element begins
+                self._element_start = position
+                self._depth = 0
+                self._in_string = char == _QUOTE
+                self._position = position + 1 if self._in_string else position
+
+        return True
+
+    def _scan_element(self) -> Any:  # noqa: C901, PLR0911, PLR0912
+        assert self._element_start is not None  # nosec: B101
+        buffer: bytearray = self._buffer
+        start: int = self._element_start
+        position: int = self._position
+        if buffer[start] not in _COMPOUND_START and buffer[start] != _QUOTE:
+            scalar_end: re.Match[bytes] | None = _SCALAR_END.search(buffer, position)
+            if scalar_end is None:
+                self._position = len(buffer)
+                return _INCOMPLETE
+
+            return self._complete(scalar_end.start())
+
+        while True:
+            if self._in_string:
+                string_end: re.Match[bytes] | None = _STRING_END.search(buffer, position)
+                if string_end is None:
+                    self._position = len(buffer)
+                    return _INCOMPLETE
+
+                if buffer[string_end.start()] == _ESCAPE:
+                    if string_end.end() >= len(buffer):
+                        self._position = string_end.start()
+                        return _INCOMPLETE  # escaped character is not available yet
+
+                    position = string_end.end() + 1  # skip escaped character
+
+                else:
+                    self._in_string = False
+                    position = string_end.end()
+                    if self._depth == 0:
+                        return self._complete(position)
+
+            else:
+                structure: re.Match[bytes] | None = _STRUCTURE.search(buffer, position)
+                if structure is None:
+                    self._position = len(buffer)
+                    return _INCOMPLETE
+
+                position = structure.end()
+                char: int = buffer[structure.start()]
+                if char == _QUOTE:
+                    self._in_string = True
+
+                elif char in _COMPOUND_START:
+                    self._depth += 1
+
+                else:
+                    self._depth -= 1
+                    if self._depth == 0:
+                        return self._complete(position)
+
+    def _complete(
+        self,
+        end: int,
+    ) -> Any:
+        assert self._element_start is not None  # nosec: B101
+        element: bytes = bytes(self._buffer[self._element_start : end])
+        self._element_start = None
+        self._position = end
+        self._stage = "separator"
+        return json_decode(element)
+
+
+_INCOMPLETE: Final[object] = object()
+_WHITESPACE: Final[re.Pattern[bytes]] = re.compile(rb"[ \t\n\r]*")
+_STRUCTURE: Final[re.Pattern[bytes]] = re.compile(rb'[\[\]{}"]')
+_STRING_END: Final[re.Pattern[bytes]] = re.compile(rb'["\\]')
+_SCALAR_END: Final[re.Pattern[bytes]] = re.compile(rb"[,\] \t\n\r]")
+_ARRAY_START: Final[int] = ord("[")
+_ARRAY_END: Final[int] = ord("]")
+_SEPARATOR: Final[int] = ord(",")
+_QUOTE: Final[int] = ord('"')
+_ESCAPE: Final[int] = ord("\\")
+_COMPOUND_START: Final[bytes] = b"[{"
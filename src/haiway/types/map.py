@@ -1,9 +1,10 @@
 """Utilities for working with immutable mapping-like objects."""
 
-import json
 from collections.abc import Mapping
 from typing import Any, NoReturn, Self, final
 
+from haiway.types.coding import json_decode, json_encode
+
 __all__ = ("Map",)
 
 
@@ -43,7 +44,7 @@ class Map[Key, Element](dict[Key, Element]):
         ValueError
             If the payload does not decode to a JSON object.
         """
-        match json.loads(value):
+        match json_decode(value):
             case {**values}:
                 return cls(values)
 
@@ -72,7 +73,7 @@ class Map[Key, Element](dict[Key, Element]):
         str
             JSON encoding of the mapping contents.
         """
-        return json.dumps(self)
+        return json_encode(self)
 
     def __setattr__(
         self,
@@ -1,10 +1,10 @@
-import json
 from collections.abc import Collection, Mapping
 from datetime import datetime
 from typing import Any, ClassVar, NoReturn, Self, TypeGuard, cast, final, overload
 from uuid import UUID
 
 from haiway.types.basic import BasicValue
+from haiway.types.coding import json_decode, json_encode
 from haiway.types.map import Map
 
 __all__ = (
@@ -183,7 +183,7 @@ class Meta(dict[str, BasicValue]):
         ValueError
             If the payload is not a JSON object.
         """
-        match json.loads(value):
+        match json_decode(value):
             case {**values}:
                 return cls({key: _validated_meta_value(val) for key, val in values.items()})
 
@@ -212,7 +212,7 @@ class Meta(dict[str, BasicValue]):
         str
             JSON encoding of the metadata mapping.
         """
-        return json.dumps(self)
+        return json_encode(self)
 
     @property
     def kind(self) -> str | None:
@@ -3,7 +3,7 @@ from asyncio import CancelledError, current_task, sleep
 from pytest import mark, raises
 
 from haiway import ctx
-from haiway.helpers.concurrent import concurrently
+from haiway.helpers.concurrent import AdaptiveConcurrency, concurrently
 
 
 class FakeException(Exception):
@@ -320,3 +320,20 @@ async def test_all_coroutines_fail_with_return_exceptions():
     for i, result in enumerate(results):
         assert isinstance(result, FakeException)
         assert str(result) == f"Error {i}"
+
+
+@mark.asyncio
+async def test_adaptive_limit_measures_coroutines():
+    # high tolerance keeps latency noise of a loaded machine from shrinking the limit
+    limit = AdaptiveConcurrency(initial=1, maximum=4, latency_tolerance=100.0)
+
+    async def coro(value: int) -> int:
+        await sleep(0.002)
+        return value
+
+    results = await concurrently(
+        (coro(index) for index in range(40)),
+        concurrent_tasks=limit,
+    )
+    assert list(results) == list(range(40))
+    assert limit.limit > 1
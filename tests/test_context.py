@@ -2,11 +2,23 @@ import asyncio
 from collections.abc import Callable
 from contextlib import asynccontextmanager
 from types import TracebackType
+from typing import Any
+from uuid import uuid4
 
 from pytest import mark, raises
 
-from haiway import ContextMissing, State, ctx
+from haiway import (
+    ContextIdentifier,
+    ContextMissing,
+    ContextStateMissing,
+    Observability,
+    State,
+    ctx,
+    unique_id,
+)
 from haiway.context import tasks as tasks_module
+from haiway.context.persistent import PersistentMap
+from haiway.context.profiling import ContextProfiling, ProfileNode
 from haiway.context.state import ContextState
 from haiway.context.tasks import ContextTaskGroup
 
@@ -15,6 +27,10 @@ class ExampleState(State):
     state: str = "default"
 
 
+class DefaultState(State):
+    value: int = 0
+
+
 class StateThatFailsInit(State):
     required_param: str
 
@@ -386,3 +402,329 @@ async def test_scope_disposables_base_exception_group_contains_all_errors():
     errors = excinfo.value.exceptions
     assert any(isinstance(err, DisposableBaseError) for err in errors)
     assert any(isinstance(err, RuntimeError) for err in errors)
+
+
+@mark.asyncio
+async def test_nested_scope_without_resources_propagates_state_and_errors():
+    async with ctx.scope("root", ExampleState(state="root")):
+        root_id = ContextIdentifier.current()
+
+        with raises(FakeException):
+            async with ctx.scope("nested"):
+                nested_id = ContextIdentifier.current()
+                assert ctx.state(ExampleState).state == "root"
+                assert not nested_id.is_root
+                raise FakeException()
+
+        async with ctx.scope("overriding", ExampleState(state="nested")):
+            assert ctx.state(ExampleState).state == "nested"
+
+        assert ContextIdentifier.current() is root_id
+        assert ctx.state(ExampleState).state == "root"
+        assert nested_id.parent_id == root_id.scope_id
+        assert nested_id.unique_name == f"[nested] [{nested_id.scope_id}]"
+        assert root_id.is_root
+        assert root_id.parent_id == root_id.scope_id
+
+
+class HashCollidingKey:
+    def __init__(self, name: str) -> None:
+        self.name = name
+
+    def __hash__(self) -> int:
+        return 42
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, HashCollidingKey) and other.name == self.name
+
+
+def test_persistent_map_updates_keep_previous_versions():
+    base = PersistentMap((index, str(index)) for index in range(1_000))
+    updated = base.updating((index, "updated") for index in range(0, 1_000, 2))
+    extended = updated.updating(((1_000, "added"),))
+
+    assert len(base) == 1_000
+    assert len(updated) == 1_000
+    assert len(extended) == 1_001
+    assert all(base[index] == str(index) for index in range(1_000))
+    assert all(updated[index] == "updated" for index in range(0, 1_000, 2))
+    assert all(updated[index] == str(index) for index in range(1, 1_000, 2))
+    assert 1_000 not in updated
+    assert extended[1_000] == "added"
+    assert set(extended) == set(range(1_001))
+    assert base.updating(((1, "1"),)) is base
+
+    with raises(KeyError):
+        _ = base[1_000]
+
+    with raises(AttributeError):
+        base._length = 0  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_persistent_map_handles_hash_collisions():
+    first = HashCollidingKey("first")
+    second = HashCollidingKey("second")
+    initial = PersistentMap(((first, 1), (second, 2)))
+    updated = initial.updating(((HashCollidingKey("second"), 3), (HashCollidingKey("third"), 4)))
+
+    assert dict(initial) == {first: 1, second: 2}
+    assert len(updated) == 3
+    assert updated[second] == 3
+    assert updated[HashCollidingKey("third")] == 4
+    assert HashCollidingKey("fourth") not in updated
+
+
+@mark.asyncio
+async def test_default_state_stored_in_nested_context_is_not_visible_in_parent():
+    async with ctx.scope("parent"):
+        async with ctx.scope("child", ExampleState(state="child")):
+            with ctx.updating():
+                default = ctx.state(DefaultState)
+                assert ctx.state(DefaultState) is default
+
+            assert not ContextState.contains(DefaultState)
+            assert ctx.state(ExampleState).state == "child"
+
+        assert ctx.state(ExampleState).state == "default"
+        assert ctx.state(DefaultState) is not default
+
+
+class BaseService(State):
+    name: str = "base"
+
+
+class FirstService(BaseService):
+    name: str = "first"
+
+
+class SecondService(BaseService):
+    name: str = "second"
+
+
+@mark.asyncio
+async def test_state_resolves_subclasses_of_requested_type():
+    async with ctx.scope("services", FirstService()):
+        assert isinstance(ctx.state(BaseService), FirstService)
+        assert ContextState.contains(BaseService)
+
+        with ctx.updating(SecondService()):
+            assert isinstance(ctx.state(BaseService), SecondService)
+            assert isinstance(ctx.state(FirstService), FirstService)
+
+            with ctx.updating(BaseService(name="exact")):
+                assert ctx.state(BaseService).name == "exact"
+
+        assert isinstance(ctx.state(BaseService), FirstService)
+
+
+@mark.asyncio
+async def test_state_memo_is_not_shared_with_nested_contexts():
+    async with ctx.scope("memo", ExampleState(state="outer")):
+        assert ctx.state(ExampleState).state == "outer"
+        assert ctx.state(ExampleState) is ctx.state(ExampleState)
+
+        with ctx.updating(ExampleState(state="inner")):
+            assert ctx.state(ExampleState).state == "inner"
+
+        assert ctx.state(ExampleState).state == "outer"
+
+        default = ctx.state(DefaultState)
+        assert ctx.state(DefaultState) is default
+        with raises(ContextStateMissing):
+            ctx.state(StateThatFailsInit)
+
+
+@mark.asyncio
+async def test_scope_profiling_writes_folded_timings(tmp_path):
+    output = tmp_path / "scope.folded"
+
+    @asynccontextmanager
+    async def slow_resource():
+        await asyncio.sleep(0.01)
+        yield ExampleState(state="resource")
+        await asyncio.sleep(0.01)
+
+    async with ctx.scope(
+        "profiled",
+        disposables=(slow_resource(),),
+        profiling=output,
+    ):
+        assert ctx.state(ExampleState).state == "resource"
+
+    lines = dict(line.rsplit(" ", 1) for line in output.read_text().splitlines())
+    assert "profiled;startup;disposables" in lines
+    assert "profiled;startup;state" in lines
+    assert "profiled;shutdown;tasks" in lines
+    resource = next(path for path in lines if path.startswith("profiled;startup;disposables;"))
+    assert resource.endswith("slow_resource")
+    assert int(lines[resource]) >= 10_000  # microseconds
+    assert any(path.startswith("profiled;shutdown;disposables;") for path in lines)
+
+
+@mark.asyncio
+async def test_scope_template_merges_template_and_entry_state():
+    template = ctx.scope_template("request", ExampleState(state="template"), DefaultState(value=1))
+
+    async with ctx.scope("root"):
+        async with template():
+            assert ctx.state(ExampleState).state == "template"
+            assert ctx.state(DefaultState).value == 1
+
+        async with template(ExampleState(state="request"), None):
+            assert ctx.state(ExampleState).state == "request"
+            assert ctx.state(DefaultState).value == 1
+
+
+@mark.asyncio
+async def test_scope_template_prepares_distinct_scopes():
+    template = ctx.scope_template("request")
+    identifiers: list[ContextIdentifier] = []
+
+    async def handle(index: int) -> str:
+        async with template(ExampleState(state=f"request-{index}")):
+            identifiers.append(ContextIdentifier.current())
+            await asyncio.sleep(0)
+            return ctx.state(ExampleState).state
+
+    async with ctx.scope("root"):
+        results = await asyncio.gather(*(handle(index) for index in range(3)))
+
+    assert results == ["request-0", "request-1", "request-2"]
+    assert all(identifier.name == "request" for identifier in identifiers)
+    assert len({identifier.scope_id for identifier in identifiers}) == 3
+
+
+@mark.asyncio
+async def test_scope_template_isolated_waits_for_tasks():
+    template = ctx.scope_template("request", isolated=True)
+    completed: list[str] = []
+
+    async def background() -> None:
+        await asyncio.sleep(0.01)
+        completed.append("task")
+
+    async with ctx.scope("root"):
+        async with template():
+            ctx.spawn(background)
+
+        assert completed == ["task"]
+
+
+@mark.asyncio
+async def test_scope_template_state_follows_enclosing_scope():
+    template = ctx.scope_template("request", DefaultState(value=1))
+
+    async with ctx.scope("first", ExampleState(state="first")):
+        for _ in range(2):  # reuses template state merged into the enclosing state
+            async with template():
+                assert ctx.state(ExampleState).state == "first"
+                assert ctx.state(DefaultState).value == 1
+
+        async with ctx.scope("second", ExampleState(state="second")):
+            async with template(DefaultState(value=2)):
+                assert ctx.state(ExampleState).state == "second"
+                assert ctx.state(DefaultState).value == 2
+
+            async with template():
+                assert ctx.state(ExampleState).state == "second"
+                assert ctx.state(DefaultState).value == 1
+
+    async with template():
+        assert ctx.state(DefaultState).value == 1
+        assert ctx.state(ExampleState).state == "default"
+
+
+def test_scope_template_is_immutable():
+    template = ctx.scope_template("request")
+
+    with raises(AttributeError):
+        template._name = "other"  # pyright: ignore[reportAttributeAccessIssue]
+
+
+def test_unique_id_produces_distinct_version_4_uuids():
+    identifiers = [unique_id() for _ in range(10_000)]
+
+    assert len(set(identifiers)) == len(identifiers)
+    assert all(identifier.version == 4 for identifier in identifiers)
+    assert identifiers[0] != identifiers[1]
+    # usable directly as W3C trace id
+    assert len(identifiers[0].hex) == 32
+    assert identifiers[0].int != 0
+
+
+@mark.asyncio
+async def test_scope_identifiers_are_unique_and_lazily_named():
+    async with ctx.scope("root"):
+        root = ContextIdentifier.current()
+        async with ctx.scope("nested"):
+            nested = ContextIdentifier.current()
+            assert nested.parent_id == root.scope_id
+            assert nested.scope_id != root.scope_id
+            assert nested.unique_name == f"[nested] [{nested.scope_id}]"
+
+
+@mark.asyncio
+async def test_scope_profiling_skips_scope_body(tmp_path):
+    @asynccontextmanager
+    async def resource():
+        yield ExampleState(state="resource")
+
+    async def nested() -> None:
+        async with ctx.scope("spawned", disposables=(resource(),)):
+            await asyncio.sleep(0)
+
+    def startup_paths(output) -> list[str]:
+        return sorted(
+            line.rsplit(" ", 1)[0]
+            for line in output.read_text().splitlines()
+            if line.startswith("profiled;startup")
+        )
+
+    empty = tmp_path / "empty.folded"
+    async with ctx.scope("profiled", disposables=(resource(),), profiling=empty):
+        pass
+
+    busy = tmp_path / "busy.folded"
+    async with ctx.scope("profiled", disposables=(resource(),), profiling=busy):
+        async with ctx.scope("nested", disposables=(resource(),), isolated=True):
+            await asyncio.sleep(0)
+
+        await ctx.spawn(nested)
+
+    assert startup_paths(busy) == startup_paths(empty)
+
+
+@mark.asyncio
+async def test_scope_profiling_stays_inactive_after_failed_entry():
+    def ignored(*args: Any, **kwargs: Any) -> None:
+        pass
+
+    def failing_entering(scope: ContextIdentifier, /) -> str:
+        raise FakeException()
+
+    @asynccontextmanager
+    async def failing_resource():
+        raise FakeException()
+        yield ExampleState()
+
+    observability = Observability(
+        trace_identifying=lambda scope: uuid4(),
+        log_recording=ignored,
+        metric_recording=ignored,
+        event_recording=ignored,
+        attributes_recording=ignored,
+        scope_entering=failing_entering,
+        scope_exiting=ignored,
+    )
+
+    async def enter(**kwargs: Any) -> ProfileNode | None:
+        with raises(FakeException):
+            async with ctx.scope("profiled", profiling=True, **kwargs):
+                pass
+
+        return ContextProfiling._context.get()  # pyright: ignore[reportPrivateUsage]
+
+    # observability fails before profiling is entered
+    assert await asyncio.create_task(enter(observability=observability)) is None
+    # disposables fail after profiling is entered
+    assert await asyncio.create_task(enter(disposables=(failing_resource(),))) is None
@@ -575,3 +575,59 @@ async def test_direct_preset_none_falls_back_to_registry():
         async with ctx.scope("fallback"):
             config = ctx.state(ConfigState)
             assert config.api_url == "https://registry.com"
+
+
+@mark.asyncio
+async def test_scope_template_resolves_preset_disposables_per_entry():
+    created: list[str] = []
+
+    def connection() -> Disposable:
+        created.append("connection")
+        return create_connection_disposable(f"connection-{len(created)}")
+
+    template = ctx.scope_template(
+        ContextPresets.of(
+            "request",
+            ConfigState(api_url="https://api.test.com"),
+            disposables=(connection,),
+        )
+    )
+
+    async with ctx.scope("root"):
+        async with template(ConfigState(api_url="https://override.test.com")):
+            assert ctx.state(ConfigState).api_url == "https://override.test.com"
+            assert ctx.state(ConnectionState).name == "connection-1"
+
+        async with template():
+            assert ctx.state(ConfigState).api_url == "https://api.test.com"
+            assert ctx.state(ConnectionState).name == "connection-2"
+
+    assert created == ["connection", "connection"]
+
+
+@mark.asyncio
+async def test_scope_template_selects_presets_of_active_registry():
+    template = ctx.scope_template(
+        "request",
+        ConfigState(api_url="https://template.test.com"),
+    )
+    preset = ContextPresets.of(
+        "request",
+        ConfigState(api_url="https://api.test.com", timeout=10),
+        DatabaseState(connection_string="postgres://preset"),
+    )
+
+    async with ctx.scope("root"):
+        async with template():
+            assert ctx.state(ConfigState).api_url == "https://template.test.com"
+            assert not ctx.contains_state(DatabaseState)
+
+        with ctx.presets(preset):
+            async with template():
+                # template state still overrides state provided by presets
+                assert ctx.state(ConfigState).api_url == "https://template.test.com"
+                assert ctx.state(ConfigState).timeout == 30
+                assert ctx.state(DatabaseState).connection_string == "postgres://preset"
+
+        async with template():
+            assert not ctx.contains_state(DatabaseState)
@@ -1,3 +1,4 @@
+from asyncio import sleep
 from collections.abc import AsyncIterator
 from contextlib import asynccontextmanager
 from types import TracebackType
@@ -5,8 +6,8 @@ from typing import Any
 
 from pytest import mark, raises
 
-from haiway import State, ctx
-from haiway.context.disposables import ContextDisposables, Disposables
+from haiway import ContextStateMissing, State, ctx
+from haiway.context.disposables import ContextDisposables, DisposableRequiring, Disposables
 
 
 class ExampleState(State):
@@ -162,3 +163,126 @@ async def test_disposables_collects_multiple_states() -> None:
     assert {type(state) for state in collected} == {ExampleState, AnotherExampleState}
     assert next(state for state in collected if isinstance(state, ExampleState)).value == "first"
     assert next(state for state in collected if isinstance(state, AnotherExampleState)).data == 100
+
+
+@mark.asyncio
+async def test_disposables_exit_entered_when_other_fails() -> None:
+    succeeding = MockDisposable(enter_return=ExampleState())
+    failing = MockDisposable(enter_exception=RuntimeError("enter failed"))
+
+    with raises(RuntimeError, match="enter failed"):
+        async with Disposables.of(succeeding, failing):
+            pass
+
+    assert succeeding.exit_called
+    assert succeeding.exit_args[0] is RuntimeError
+    assert failing.exit_called is False
+
+
+@mark.asyncio
+async def test_disposables_enter_requiring_after_requirements() -> None:
+    events: list[str] = []
+
+    @asynccontextmanager
+    async def configuration() -> AsyncIterator[ExampleState]:
+        events.append("configuration enter")
+        yield ExampleState(value="configured")
+        events.append("configuration exit")
+
+    @asynccontextmanager
+    async def client() -> AsyncIterator[AnotherExampleState]:
+        events.append(f"client enter {ctx.state(ExampleState).value}")
+        yield AnotherExampleState(data=1)
+        events.append("client exit")
+
+    async with Disposables.of(
+        DisposableRequiring(client(), requires=(ExampleState,)),
+        configuration(),
+    ) as states:
+        assert {type(state) for state in states} == {ExampleState, AnotherExampleState}
+
+    assert events == [
+        "configuration enter",
+        "client enter configured",
+        "client exit",
+        "configuration exit",
+    ]
+
+
+@mark.asyncio
+async def test_disposables_requirements_are_resolved_from_context() -> None:
+    mock = MockDisposable(enter_return=AnotherExampleState())
+
+    async with ctx.scope("test", ExampleState()):
+        async with Disposables.of(DisposableRequiring(mock, requires=(ExampleState,))):
+            assert mock.enter_called
+
+
+@mark.asyncio
+async def test_disposables_unsatisfied_requirements_roll_back() -> None:
+    independent = MockDisposable(enter_return=AnotherExampleState())
+    requiring = MockDisposable()
+
+    with raises(ContextStateMissing):
+        async with Disposables.of(
+            independent,
+            DisposableRequiring(requiring, requires=(ExampleState,)),
+        ):
+            pass
+
+    assert independent.exit_called
+    assert requiring.enter_called is False
+
+
+@mark.asyncio
+async def test_disposables_requiring_context_state_do_not_wait_for_others() -> None:
+    events: list[str] = []
+
+    @asynccontextmanager
+    async def slow() -> AsyncIterator[AnotherExampleState]:
+        events.append("slow enter")
+        await sleep(0.05)
+        events.append("slow entered")
+        yield AnotherExampleState()
+
+    @asynccontextmanager
+    async def client() -> AsyncIterator[AnotherExampleState]:
+        events.append(f"client enter {ctx.state(ExampleState).value}")
+        yield AnotherExampleState()
+
+    async with ctx.scope("test", ExampleState(value="outer")):
+        async with Disposables.of(
+            slow(),
+            DisposableRequiring(client(), requires=(ExampleState,)),
+        ):
+            pass
+
+    assert events == [
+        "slow enter",
+        "client enter outer",
+        "slow entered",
+    ]
+
+
+@mark.asyncio
+async def test_disposables_provided_state_takes_precedence_over_context() -> None:
+    @asynccontextmanager
+    async def configuration() -> AsyncIterator[ExampleState]:
+        await sleep(0.01)
+        yield ExampleState(value="configured")
+
+    used: list[str] = []
+
+    @asynccontextmanager
+    async def client() -> AsyncIterator[AnotherExampleState]:
+        used.append(ctx.state(ExampleState).value)
+        yield AnotherExampleState()
+
+    async with ctx.scope("test", ExampleState(value="outer")):
+        async with Disposables.of(
+            DisposableRequiring(client(), requires=(ExampleState,)),
+            DisposableRequiring(configuration(), provides=(ExampleState,)),
+        ):
+            pass
+
+    assert used == ["configured"]
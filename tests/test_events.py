@@ -378,3 +378,157 @@ async def test_events_with_subscribers_joining_late():
         assert len(late_events) == 2
         assert late_events[0].order_id == "3"
         assert late_events[1].order_id == "4"
+
+
+@mark.asyncio
+async def test_bounded_subscription_policies():
+    async with ctx.scope("test"):
+        oldest = ctx.subscribe(OrderCreated, capacity=2, policy="drop_oldest")
+        newest = ctx.subscribe(OrderCreated, capacity=2, policy="drop_newest")
+        coalesced = ctx.subscribe(OrderCreated, capacity=2, policy="coalesce")
+
+        for i in range(5):
+            ctx.send(OrderCreated(order_id=str(i), amount=float(i)))
+
+        assert (oldest.lag, oldest.dropped) == (2, 3)
+        assert (newest.lag, newest.dropped) == (2, 3)
+        assert (coalesced.lag, coalesced.dropped) == (1, 4)
+
+        assert [(await anext(oldest)).order_id for _ in range(2)] == ["3", "4"]
+        assert [(await anext(newest)).order_id for _ in range(2)] == ["0", "1"]
+        assert (await anext(coalesced)).order_id == "4"
+        assert oldest.lag == 0
+
+
+@mark.asyncio
+async def test_unbounded_subscription_reports_lag():
+    async with ctx.scope("test"):
+        subscription = ctx.subscribe(OrderCreated)
+        for i in range(3):
+            ctx.send(OrderCreated(order_id=str(i), amount=float(i)))
+
+        assert subscription.lag == 3
+        assert subscription.dropped == 0
+        await anext(subscription)
+        assert subscription.lag == 2
+
+
+@mark.asyncio
+async def test_blocking_subscription_applies_back_pressure():
+    async with ctx.scope("test"):
+        subscription = ctx.subscribe(OrderCreated, capacity=1, policy="block")
+        await ctx.deliver(OrderCreated(order_id="1", amount=1.0))
+
+        delivery = asyncio.create_task(ctx.deliver(OrderCreated(order_id="2", amount=2.0)))
+        await asyncio.sleep(0.01)
+        assert not delivery.done()
+
+        assert (await anext(subscription)).order_id == "1"
+        await delivery
+        assert (await anext(subscription)).order_id == "2"
+        assert subscription.dropped == 0
+
+
+@mark.asyncio
+async def test_bounded_subscription_finishes_after_buffered_events():
+    async with ctx.scope("test"):
+        subscription = ctx.subscribe(OrderCreated, capacity=4)
+        ctx.send(OrderCreated(order_id="last", amount=0.0))
+
+    assert [event.order_id async for event in subscription] == ["last"]
+
+
+@mark.asyncio
+async def test_events_sent_from_threads_are_delivered_in_order():
+    async with ctx.scope("test"):
+        subscription = ctx.subscribe(OrderCreated)
+
+        def produce() -> None:
+            for i in range(1_000):
+                ctx.send(OrderCreated(order_id=str(i), amount=float(i)))
+
+        await asyncio.to_thread(produce)
+
+        received = [(await anext(subscription)).order_id for _ in range(1_000)]
+        assert received == [str(i) for i in range(1_000)]
+
+
+@mark.asyncio
+async def test_events_sent_from_other_loop_are_delivered():
+    async with ctx.scope("test"):
+        subscription = ctx.subscribe(OrderCreated, capacity=1, policy="block")
+
+        async def produce() -> None:
+            await ctx.deliver(OrderCreated(order_id="1", amount=1.0))
+            await ctx.deliver(OrderCreated(order_id="2", amount=2.0))
+
+        producer = asyncio.create_task(asyncio.to_thread(asyncio.run, produce()))
+
+        assert (await anext(subscription)).order_id == "1"
+        assert (await anext(subscription)).order_id == "2"
+        await producer
+
+
+class AccountEvent(State):
+    account_id: str
+
+
+class AccountOpened(AccountEvent):
+    pass
+
+
+class AccountClosed(AccountEvent):
+    pass
+
+
+@mark.asyncio
+async def test_subscription_to_base_type_receives_subclass_events():
+    async with ctx.scope("test"):
+        accounts = ctx.subscribe(AccountEvent)
+        opened = ctx.subscribe(AccountOpened)
+
+        ctx.send(AccountOpened(account_id="1"))
+        ctx.send(AccountClosed(account_id="2"))
+        ctx.send(OrderCreated(order_id="ignored", amount=0.0))
+
+        assert [type(await anext(accounts)) for _ in range(2)] == [AccountOpened, AccountClosed]
+        assert accounts.lag == 0
+        assert (await anext(opened)).account_id == "1"
+        assert opened.lag == 0
+
+
+@mark.asyncio
+async def test_subscription_with_predicate_filters_events():
+    async with ctx.scope("test"):
+        unbounded = ctx.subscribe(OrderCreated, predicate=lambda event: event.amount > 10)
+        bounded = ctx.subscribe(
+            OrderCreated,
+            capacity=1,
+            predicate=lambda event: event.amount > 10,
+        )
+
+        ctx.send(OrderCreated(order_id="small", amount=1.0))
+        ctx.send(OrderCreated(order_id="large", amount=100.0))
+
+        assert (await anext(unbounded)).order_id == "large"
+        assert (await anext(bounded)).order_id == "large"
+        assert bounded.dropped == 0
+
+
+@mark.asyncio
+async def test_nested_subscription_receives_events_from_isolated_scopes():
+    async with ctx.scope("test"):
+        local = ctx.subscribe(AccountEvent)
+        nested = ctx.subscribe(AccountEvent, nested=True)
+
+        async with ctx.scope("isolated", isolated=True):
+            inner = ctx.subscribe(AccountEvent)
+            ctx.send(AccountOpened(account_id="inner"))
+            assert (await anext(inner)).account_id == "inner"
+
+        ctx.send(AccountClosed(account_id="outer"))
+
+        assert (await anext(nested)).account_id == "inner"
+        assert (await anext(nested)).account_id == "outer"
+        assert (await anext(local)).account_id == "outer"
+        assert local.lag == 0
@@ -1,11 +1,17 @@
-from asyncio import CancelledError, current_task, sleep
-from collections.abc import Sequence
+from asyncio import CancelledError, current_task, get_running_loop, sleep
+from collections.abc import AsyncIterator, Iterator, Sequence
+from gc import collect
 from typing import Any
 
 from pytest import mark, raises
 
 from haiway import ctx
-from haiway.helpers.concurrent import execute_concurrently
+from haiway.helpers.concurrent import (
+    AdaptiveConcurrency,
+    execute_batches_concurrently,
+    execute_concurrently,
+    execute_concurrently_streaming,
+)
 
 
 class FakeException(Exception):
@@ -249,3 +255,344 @@ async def test_exception_details_preserved():
     assert results[1].code == 404
     assert str(results[1]) == "Not found"
     assert results[2] == 3
+
+
+@mark.asyncio
+async def test_adaptive_limit_preserves_order_and_exceptions():
+    limit = AdaptiveConcurrency(initial=2)
+
+    async def handler(element: int) -> int:
+        await sleep(0.01 if element % 2 == 0 else 0.005)
+        if element == 3:
+            raise FakeException()
+
+        return element * 2
+
+    results = await execute_concurrently(
+        handler,
+        range(10),
+        concurrent_tasks=limit,
+        return_exceptions=True,
+    )
+    assert isinstance(results[3], FakeException)
+    assert [result for index, result in enumerate(results) if index != 3] == [
+        index * 2 for index in range(10) if index != 3
+    ]
+
+
+@mark.asyncio
+async def test_batches_results_preserve_order():
+    batch_sizes: list[int] = []
+
+    async def handler(batch: Sequence[int]) -> Sequence[int]:
+        batch_sizes.append(len(batch))
+        await sleep(0.01 if batch[0] == 0 else 0.001)
+        return [element * 2 for element in batch]
+
+    results = await execute_batches_concurrently(
+        handler,
+        range(10),
+        batch_size=4,
+        concurrent_tasks=3,
+    )
+    assert list(results) == [element * 2 for element in range(10)]
+    assert sorted(batch_sizes) == [2, 4, 4]
+
+
+@mark.asyncio
+async def test_batches_exceptions_returned_for_each_element():
+    async def handler(batch: Sequence[int]) -> Sequence[int]:
+        if 5 in batch:
+            raise FakeException()
+
+        return list(batch)
+
+    results = await execute_batches_concurrently(
+        handler,
+        range(8),
+        batch_size=4,
+        return_exceptions=True,
+    )
+    assert list(results[:4]) == [0, 1, 2, 3]
+    assert all(isinstance(result, FakeException) for result in results[4:])
+
+
+@mark.asyncio
+async def test_batches_returned_exceptions_shrink_adaptive_limit():
+    limit = AdaptiveConcurrency(initial=8, minimum=2, maximum=8)
+
+    async def source() -> AsyncIterator[int]:
+        for element in range(40):
+            yield element
+
+    async def handler(batch: Sequence[int]) -> Sequence[int]:
+        await sleep(0.01)
+        if 10 in batch:
+            raise FakeException()
+
+        return list(batch)
+
+    results = await execute_batches_concurrently(
+        handler,
+        source(),
+        batch_size=4,
+        concurrent_tasks=limit,
+        return_exceptions=True,
+    )
+    assert [result for result in results if not isinstance(result, FakeException)] == [
+        element for element in range(40) if element not in (8, 9, 10, 11)
+    ]
+    assert all(isinstance(result, FakeException) for result in results[8:12])
+    assert limit.limit < 8
+
+
+@mark.asyncio
+async def test_batches_results_count_is_verified():
+    async def handler(batch: Sequence[int]) -> Sequence[int]:
+        return list(batch[1:])
+
+    with raises(ValueError):
+        await execute_batches_concurrently(handler, range(4), batch_size=2)
+
+
+@mark.asyncio
+async def test_streaming_yields_results_as_completed():
+    async def handler(element: int) -> int:
+        await sleep(0.05 if element == 0 else 0.001)
+        return element
+
+    results = [
+        result
+        async for result in execute_concurrently_streaming(handler, range(5), concurrent_tasks=5)
+    ]
+    assert sorted(results) == list(range(5))
+    assert results[-1] == 0  # slowest element completes last
+
+
+@mark.asyncio
+async def test_streaming_ordered_preserves_order():
+    async def handler(element: int) -> int:
+        await sleep(0.01 if element % 2 == 0 else 0.001)
+        return element * 2
+
+    results = [
+        result
+        async for result in execute_concurrently_streaming(
+            handler,
+            range(20),
+            concurrent_tasks=4,
+            ordered=True,
+            reorder_buffer=2,
+        )
+    ]
+    assert results == [element * 2 for element in range(20)]
+
+
+@mark.asyncio
+async def test_streaming_pulls_source_only_with_capacity():
+    pulled: list[int] = []
+
+    def source() -> Iterator[int]:
+        for element in range(1_000):
+            pulled.append(element)
+            yield element
+
+    async def handler(element: int) -> int:
+        return element
+
+    results = execute_concurrently_streaming(handler, source(), concurrent_tasks=3)
+    await anext(results)
+    await sleep(0.01)
+    assert len(pulled) <= 3
+    await results.aclose()
+
+
+@mark.asyncio
+async def test_streaming_raises_first_exception():
+    async def handler(element: int) -> int:
+        if element == 3:
+            raise FakeException()
+
+        await sleep(0.01)
+        return element
+
+    with raises(FakeException):
+        async for _ in execute_concurrently_streaming(handler, range(10), ordered=True):
+            pass
+
+
+@mark.asyncio
+async def test_streaming_retrieves_exceptions_after_first_failure():
+    unhandled: list[dict[str, Any]] = []
+    loop = get_running_loop()
+    loop.set_exception_handler(lambda _, context: unhandled.append(context))
+
+    async def handler(element: int) -> int:
+        raise FakeException()
+
+    try:
+        for ordered in (False, True):
+            with raises(FakeException):
+                async for _ in execute_concurrently_streaming(
+                    handler,
+                    range(2),
+                    concurrent_tasks=2,
+                    ordered=ordered,
+                ):
+                    pass
+
+            await sleep(0)
+            collect()  # tasks report exceptions never retrieved when destroyed
+
+    finally:
+        loop.set_exception_handler(None)
+
+    assert unhandled == []
+
+
+@mark.asyncio
+async def test_streaming_returns_exceptions():
+    async def handler(element: int) -> int:
+        if element == 1:
+            raise FakeException()
+
+        return element
+
+    results = [
+        result
+        async for result in execute_concurrently_streaming(
+            handler,
+            range(3),
+            ordered=True,
+            return_exceptions=True,
+        )
+    ]
+    assert results[0] == 0
+    assert isinstance(results[1], FakeException)
+    assert results[2] == 2
+
+
+@mark.asyncio
+async def test_streaming_close_cancels_running_tasks():
+    cancelled: list[int] = []
+
+    async def handler(element: int) -> int:
+        if element == 0:
+            return element
+
+        try:
+            await sleep(10)
+
+        except CancelledError:
+            cancelled.append(element)
+            raise
+
+        return element
+
+    results = execute_concurrently_streaming(handler, range(3), concurrent_tasks=3)
+    assert await anext(results) == 0
+    await results.aclose()
+    await sleep(0)
+    assert sorted(cancelled) == [1, 2]
+
+
+@mark.asyncio
+async def test_streaming_yields_results_while_async_source_waits():
+    events: list[str] = []
+
+    async def source() -> AsyncIterator[int]:
+        yield 0
+        await sleep(0.05)
+        events.append("pulled 1")
+        yield 1
+
+    async def handler(element: int) -> int:
+        return element
+
+    async for result in execute_concurrently_streaming(handler, source(), concurrent_tasks=2):
+        events.append(f"result {result}")
+
+    assert events == ["result 0", "pulled 1", "result 1"]
+
+
+@mark.asyncio
+async def test_streaming_async_source_exhausted_while_tasks_running():
+    async def source() -> AsyncIterator[int]:
+        for element in range(6):
+            yield element
+
+    async def handler(element: int) -> int:
+        await sleep(0.01 * (6 - element))
+        return element
+
+    unordered: list[int] = [
+        result
+        async for result in execute_concurrently_streaming(handler, source(), concurrent_tasks=6)
+    ]
+    ordered: list[int] = [
+        result
+        async for result in execute_concurrently_streaming(
+            handler,
+            source(),
+            concurrent_tasks=6,
+            ordered=True,
+        )
+    ]
+    assert unordered == [5, 4, 3, 2, 1, 0]
+    assert ordered == [0, 1, 2, 3, 4, 5]
+
+
+@mark.asyncio
+async def test_streaming_raises_async_source_failure():
+    cancelled: list[int] = []
+
+    async def source() -> AsyncIterator[int]:
+        yield 0
+        yield 1
+        raise FakeException()
+
+    async def handler(element: int) -> int:
+        try:
+            await sleep(10)
+
+        except CancelledError:
+            cancelled.append(element)
+            raise
+
+        return element
+
+    with raises(FakeException):
+        async for _ in execute_concurrently_streaming(handler, source(), concurrent_tasks=4):
+            pass
+
+    await sleep(0)
+    assert sorted(cancelled) == [0, 1]
+
+
+@mark.asyncio
+async def test_streaming_ordered_holds_at_most_reorder_buffer_results():
+    completed: list[int] = []
+    yielded: list[int] = []
+    held: list[int] = []
+
+    async def source() -> AsyncIterator[int]:
+        for element in range(20):
+            yield element
+
+    async def handler(element: int) -> int:
+        await sleep(0.05 if element == 0 else 0.001)
+        completed.append(element)
+        held.append(len(completed) - len(yielded) - 1)  # without the head of the window
+        return element
+
+    async for result in execute_concurrently_streaming(
+        handler,
+        source(),
+        concurrent_tasks=8,
+        ordered=True,
+        reorder_buffer=2,
+    ):
+        yielded.append(result)
+
+    assert yielded == list(range(20))
+    assert max(held) <= 2
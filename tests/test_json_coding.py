@@ -0,0 +1,235 @@
+import json
+from collections.abc import AsyncIterator, Sequence, Set
+from datetime import UTC, date, datetime
+from enum import StrEnum
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from uuid import UUID, uuid4
+
+import pytest
+
+from haiway import Map, Meta, State, ValidationError
+from haiway.attributes import AttributesJSONEncoder
+from haiway.types import coding
+from haiway.types.coding import JSONArrayDecoder, json_decode, json_default, json_encode
+
+
+class Kind(StrEnum):
+    FIRST = "first"
+    SECOND = "second"
+
+
+class Nested(State):
+    identifier: UUID
+    created: datetime
+
+
+class Payload(State):
+    name: str
+    kind: Kind
+    path: Path
+    day: date
+    tags: Set[str]
+    nested: Sequence[Nested]
+
+
+def test_json_default_converts_supported_types() -> None:
+    identifier = uuid4()
+
+    assert json_default(identifier) == str(identifier)
+    assert json_default(date(2024, 1, 2)) == "2024-01-02"
+    assert json_default(Path("/tmp/file")) == "/tmp/file"
+    assert json_default(Kind.FIRST) == "first"
+    assert json_default(frozenset({1})) == [1]
+
+    with pytest.raises(TypeError):
+        json_default(b"bytes")
+
+
+def test_json_encode_round_trips_values() -> None:
+    identifier = uuid4()
+    encoded = json_encode({"id": identifier, "items": (1, 2), "large": 2**70})
+
+    assert json_decode(encoded) == {"id": str(identifier), "items": [1, 2], "large": 2**70}
+    assert json.loads(json_encode({"a": 1}, indent=3)) == {"a": 1}
+    assert json_decode(b"[1, 2]") == [1, 2]
+
+    with pytest.raises(ValueError):
+        json_decode("{invalid")
+
+
+def test_json_encode_matches_standard_library() -> None:
+    value = {
+        "text": "zażółć 😀 \x7f",
+        "numbers": [1e-07, 1e22, 0.1, 2**70],
+        "special": [float("nan"), float("inf"), float("-inf")],
+        "created": datetime(2024, 1, 2, tzinfo=UTC),
+        "empty": {},
+    }
+
+    assert json_encode(value) == json.dumps(value, default=json_default)
+    assert json_encode(value, indent=4) == json.dumps(value, indent=4, default=json_default)
+
+
+_STANDARD_PAYLOADS: Sequence[str | bytes] = (
+    '{"a": [1, 2.5, "x", null, true], "b": {}}',
+    "[NaN, Infinity, -Infinity]",
+    "[123456789012345678901234567890, -9223372036854775809]",
+    "[1e400]",
+    '["\\ud800"]',
+    '["\ud800"]',
+    b'\xef\xbb\xbf{"a": 1}',
+    '{"a": "ą"}'.encode("utf-16"),
+)
+
+
+@pytest.mark.parametrize("payload", _STANDARD_PAYLOADS)
+def test_json_decode_matches_standard_library_with_msgspec(
+    payload: str | bytes,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    pytest.importorskip("msgspec")
+    decode, errors = coding._msgspec_backend()  # pyright: ignore[reportPrivateUsage]
+    monkeypatch.setattr(coding, "_fast_decode", decode)
+    monkeypatch.setattr(coding, "_fast_decode_errors", errors)
+
+    assert repr(json_decode(payload)) == repr(json.loads(payload))
+
+
+@pytest.mark.parametrize("payload", _STANDARD_PAYLOADS)
+def test_json_decode_matches_standard_library_without_backend(
+    payload: str | bytes,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(coding, "_fast_decode", None)
+
+    assert repr(json_decode(payload)) == repr(json.loads(payload))
+
+
+def test_json_decode_with_msgspec_parses_invalid_payload_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    msgspec = pytest.importorskip("msgspec")
+    decode, errors = coding._msgspec_backend()  # pyright: ignore[reportPrivateUsage]
+    monkeypatch.setattr(coding, "_fast_decode", decode)
+    monkeypatch.setattr(coding, "_fast_decode_errors", errors)
+    standard_calls: list[str | bytes] = []
+
+    def standard_loads(value: str | bytes) -> Any:
+        standard_calls.append(value)
+        return json.loads(value)
+
+    monkeypatch.setattr(coding, "json", SimpleNamespace(loads=standard_loads))
+
+    with pytest.raises(msgspec.DecodeError):
+        json_decode('{"a": [1, 2}')
+
+    with pytest.raises(ValueError):
+        json_decode("[NaN")
+
+    assert standard_calls == ["[NaN"]
+
+
+def test_state_to_json_matches_standard_encoding() -> None:
+    payload = Payload(
+        name="payload",
+        kind=Kind.SECOND,
+        path=Path("/tmp/file"),
+        day=date(2024, 1, 2),
+        tags={"tag"},
+        nested=[Nested(identifier=uuid4(), created=datetime(2024, 1, 2, tzinfo=UTC))],
+    )
+
+    expected = json.loads(
+        json.dumps(
+            payload.to_mapping(recursive=True),
+            cls=AttributesJSONEncoder,
+        )
+    )
+    decoded = json.loads(payload.to_json())
+    nested = decoded["nested"][0]
+
+    assert {key: value for key, value in decoded.items() if key != "nested"} == {
+        key: value for key, value in expected.items() if key != "nested"
+    }
+    assert nested["identifier"] == expected["nested"][0]["identifier"]
+    assert datetime.fromisoformat(nested["created"]) == payload.nested[0].created
+    assert Payload.from_json(payload.to_json()) == payload
+    assert Payload.from_json_array(f"[{payload.to_json()}]") == (payload,)
+
+
+def test_map_and_meta_json_round_trip() -> None:
+    assert Map.from_json(Map({"a": 1}).to_json()) == {"a": 1}
+    assert Meta.from_json(Meta({"kind": "test"}).to_json()) == Meta({"kind": "test"})
+
+
+class Element(State):
+    name: str
+    values: Sequence[int]
+
+
+def _chunks(payload: bytes, size: int) -> list[bytes]:
+    return [payload[idx : idx + size] for idx in range(0, len(payload), size)]
+
+
+def test_json_array_decoder_handles_arbitrary_chunks() -> None:
+    elements = [{"text": 'quoted "]}" \\ ą😀', "nested": [1, {"a": None}]}, 1.5, "x", True, [], {}]
+    payload = json.dumps(elements, ensure_ascii=False).encode()
+
+    for size in (1, 2, 3, 7, len(payload)):
+        decoder = JSONArrayDecoder()
+        decoded = [element for chunk in _chunks(payload, size) for element in decoder.feed(chunk)]
+        decoder.close()
+
+        assert decoded == elements
+
+
+@pytest.mark.parametrize(
+    "payload",
+    ['{"a": 1}', "[1, 2", "[1 2]", "[1] 2"],
+)
+def test_json_array_decoder_rejects_invalid_payloads(payload: str) -> None:
+    decoder = JSONArrayDecoder()
+    with pytest.raises(ValueError):
+        decoder.feed(payload)
+        decoder.close()
+
+
+def test_from_json_array_chunks_yields_validated_elements() -> None:
+    payload = b'[{"name": "a", "values": [1]}, {"name": "b", "values": []}]'
+
+    decoded = tuple(Element.from_json_array_chunks(_chunks(payload, 5)))
+
+    assert decoded == (
+        Element(name="a", values=(1,)),
+        Element(name="b", values=()),
+    )
+
+
+def test_from_json_array_chunks_reports_element_index() -> None:
+    payload = b'[{"name": "a", "values": [1]}, {"name": "b", "values": [1, "x"]}]'
+    decoded: list[Element] = []
+
+    with pytest.raises(ValueError, match="element 1") as exc:
+        decoded.extend(Element.from_json_array_chunks(_chunks(payload, 4)))
+
+    assert decoded == [Element(name="a", values=(1,))]
+    assert isinstance(exc.value.__cause__, ValidationError)
+    assert exc.value.__cause__.path == ("[1]", ".values", "[1]")
+
+
+@pytest.mark.asyncio
+async def test_from_json_array_stream_yields_validated_elements() -> None:
+    payload = b'[{"name": "a", "values": [1, 2]}, {"name": "b", "values": []}]'
+
+    async def stream() -> AsyncIterator[bytes]:
+        for chunk in _chunks(payload, 3):
+            yield chunk
+
+    decoded = [element async for element in Element.from_json_array_stream(stream())]
+
+    assert decoded == [
+        Element(name="a", values=(1, 2)),
+        Element(name="b", values=()),
+    ]
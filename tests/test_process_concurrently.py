@@ -1,11 +1,16 @@
-from asyncio import CancelledError, current_task, sleep
+from asyncio import CancelledError, Task, all_tasks, current_task, gather, get_running_loop, sleep
 from collections import deque
-from collections.abc import AsyncIterator, Iterable
+from collections.abc import AsyncIterator, Callable, Coroutine, Iterable, Sequence
+from typing import Any
 
 from pytest import mark, raises
 
 from haiway import AsyncQueue, ctx
-from haiway.helpers.concurrent import process_concurrently
+from haiway.helpers.concurrent import (
+    AdaptiveConcurrency,
+    process_batches_concurrently,
+    process_concurrently,
+)
 
 
 class FakeException(Exception):
@@ -221,3 +226,293 @@ async def test_processes_elements_from_queue():
     queue.finish()
     await task
     assert sorted(processed) == list(range(1, 6))
+
+
+@mark.asyncio
+async def test_adaptive_limit_grows_for_fast_handler():
+    # high tolerance keeps latency noise of a loaded machine from shrinking the limit
+    limit = AdaptiveConcurrency(initial=2, maximum=8, latency_tolerance=100.0)
+    processed: list[int] = []
+
+    async def handler(element: int) -> None:
+        await sleep(0.002)
+        processed.append(element)
+
+    await process_concurrently(range(200), handler, concurrent_tasks=limit)
+    assert sorted(processed) == list(range(200))
+    assert limit.limit > 2
+
+
+@mark.asyncio
+async def test_adaptive_limit_spawns_workers_up_to_current_limit():
+    limit = AdaptiveConcurrency(initial=2, maximum=64, latency_tolerance=100.0)
+    workers: set[Task[Any] | None] = set()
+    exceeded: list[int] = []
+    running: int = len(all_tasks())
+
+    async def handler(element: int) -> None:
+        workers.add(current_task())
+        if len(all_tasks()) - running > limit.limit:
+            exceeded.append(element)
+
+        await sleep(0.002)
+
+    await process_concurrently(range(200), handler, concurrent_tasks=limit)
+    assert exceeded == []
+    assert 2 < len(workers) < 64
+
+
+def test_adaptive_limit_grows_only_when_saturated():
+    limit = AdaptiveConcurrency(initial=2, maximum=8)
+
+    for _ in range(100):
+        limit._record(0.01, saturated=False)  # pyright: ignore[reportPrivateUsage]
+
+    assert limit.limit == 2
+
+    for _ in range(100):
+        limit._record(0.01, saturated=True)  # pyright: ignore[reportPrivateUsage]
+
+    assert limit.limit == 8
+
+
+@mark.asyncio
+async def test_adaptive_limit_shrinks_on_errors():
+    limit = AdaptiveConcurrency(initial=16, minimum=2, maximum=16)
+    processed: list[int] = []
+
+    async def handler(element: int) -> None:
+        await sleep(0.01)
+        if element == 20:
+            raise FakeException()
+
+        processed.append(element)
+
+    await process_concurrently(
+        range(60),
+        handler,
+        concurrent_tasks=limit,
+        ignore_exceptions=True,
+    )
+    assert len(processed) == 59
+    assert limit.limit < 16
+
+
+@mark.asyncio
+async def test_adaptive_limit_respects_current_limit():
+    limit = AdaptiveConcurrency(initial=8, minimum=2, maximum=8, latency_tolerance=100.0)
+    currently_running: set[int] = set()
+    exceeded: list[int] = []
+    lowest_limit: int = limit.limit
+
+    async def tracking_handler(element: int) -> None:
+        nonlocal lowest_limit
+        if element == 0:
+            await sleep(0.001)
+            raise FakeException()  # shrinks the limit while other tasks are running
+
+        currently_running.add(element)
+        lowest_limit = min(lowest_limit, limit.limit)
+        if len(currently_running) > limit.limit:
+            exceeded.append(element)
+
+        await sleep(0.01)
+        currently_running.remove(element)
+
+    await process_concurrently(
+        Source(range(40)),
+        tracking_handler,
+        concurrent_tasks=limit,
+        ignore_exceptions=True,
+    )
+    assert lowest_limit < 8
+    assert exceeded == []
+
+
+@mark.asyncio
+async def test_adaptive_limit_is_shared_between_helpers():
+    limit = AdaptiveConcurrency(initial=3, maximum=3)
+    currently_running: set[tuple[str, int]] = set()
+    max_concurrent: int = 0
+
+    def tracking_handler(name: str) -> Callable[[int], Coroutine[None, None, None]]:
+        async def handler(element: int) -> None:
+            nonlocal max_concurrent
+            currently_running.add((name, element))
+            max_concurrent = max(max_concurrent, len(currently_running))
+            await sleep(0.01)
+            currently_running.remove((name, element))
+
+        return handler
+
+    await gather(
+        process_concurrently(range(10), tracking_handler("a"), concurrent_tasks=limit),
+        process_concurrently(range(10), tracking_handler("b"), concurrent_tasks=limit),
+    )
+    assert max_concurrent <= 3
+
+
+@mark.asyncio
+async def test_processes_batches_by_size():
+    batches: list[Sequence[int]] = []
+
+    async def handler(batch: Sequence[int]) -> None:
+        batches.append(tuple(batch))
+
+    await process_batches_concurrently(range(7), handler, batch_size=3, concurrent_tasks=1)
+    assert batches == [(0, 1, 2), (3, 4, 5), (6,)]
+
+
+@mark.asyncio
+async def test_dispatches_batches_after_linger():
+    batches: list[Sequence[int]] = []
+
+    async def source() -> AsyncIterator[int]:
+        for element in range(2):
+            yield element
+
+        await sleep(0.1)  # longer than linger
+        yield 2
+
+    async def handler(batch: Sequence[int]) -> None:
+        batches.append(tuple(batch))
+
+    await process_batches_concurrently(
+        source(),
+        handler,
+        batch_size=10,
+        batch_linger=0.02,
+    )
+    assert batches == [(0, 1), (2,)]
+
+
+@mark.asyncio
+async def test_lingers_from_first_element_arrival_when_handler_is_slow():
+    batches: list[Sequence[int]] = []
+    finished: list[float] = []
+    started: list[float] = []
+
+    async def source() -> AsyncIterator[int]:
+        yield 0
+        await sleep(0.06)  # longer than linger
+        yield 1
+        await sleep(0.3)  # keeps the source open after reading ahead
+
+    async def handler(batch: Sequence[int]) -> None:
+        started.append(get_running_loop().time())
+        batches.append(tuple(batch))
+        await sleep(0.1)  # longer than linger
+        finished.append(get_running_loop().time())
+
+    await process_batches_concurrently(
+        source(),
+        handler,
+        batch_size=10,
+        batch_linger=0.05,
+        concurrent_tasks=1,
+    )
+    assert batches == [(0,), (1,)]
+    # element read ahead while the handler was busy already lingered
+    assert started[1] - finished[0] < 0.03
+
+
+@mark.asyncio
+async def test_batches_async_source_by_size_without_linger():
+    batches: list[Sequence[int]] = []
+
+    async def source() -> AsyncIterator[int]:
+        for element in range(5):
+            await sleep(0.01 if element == 1 else 0)
+            yield element
+
+    async def handler(batch: Sequence[int]) -> None:
+        batches.append(tuple(batch))
+
+    await process_batches_concurrently(
+        source(),
+        handler,
+        batch_size=3,
+        batch_linger=None,
+        concurrent_tasks=1,
+    )
+    assert batches == [(0, 1, 2), (3, 4)]
+
+
+@mark.asyncio
+async def test_lingering_batches_process_elements_read_before_source_failure():
+    batches: list[Sequence[int]] = []
+
+    async def source() -> AsyncIterator[int]:
+        yield 0
+        yield 1
+        raise FakeException()
+
+    async def handler(batch: Sequence[int]) -> None:
+        batches.append(tuple(batch))
+
+    with raises(FakeException):
+        await process_batches_concurrently(
+            source(),
+            handler,
+            batch_size=10,
+            batch_linger=0.02,
+            concurrent_tasks=1,
+        )
+
+    assert batches == [(0, 1)]
+
+
+@mark.asyncio
+async def test_batch_exceptions_propagate():
+    async def handler(batch: Sequence[int]) -> None:
+        if 4 in batch:
+            raise FakeException()
+
+    with raises(FakeException):
+        await process_batches_concurrently(Source(range(10)), handler, batch_size=2)
+
+
+@mark.asyncio
+async def test_workers_do_not_block_loop_with_non_suspending_handler():
+    processed: int = 0
+    ticks: int = 0
+
+    async def handler(element: int) -> None:
+        nonlocal processed
+        processed += 1
+
+    async def ticker() -> None:
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await sleep(0)
+
+    ticking = ctx.spawn(ticker)
+    await process_concurrently(range(10_000), handler, concurrent_tasks=4)
+    ticking.cancel()
+    assert processed == 10_000
+    assert ticks > 1
+
+
+@mark.asyncio
+async def test_first_exception_stops_remaining_workers():
+    started: list[int] = []
+    cancelled: list[int] = []
+
+    async def handler(element: int) -> None:
+        started.append(element)
+        if element == 2:
+            raise FakeException()
+
+        try:
+            await sleep(1)
+
+        except CancelledError:
+            cancelled.append(element)
+            raise
+
+    with raises(FakeException):
+        await process_concurrently(range(100), handler, concurrent_tasks=3)
+
+    assert sorted(started) == [0, 1, 2]
+    assert sorted(cancelled) == [0, 1]
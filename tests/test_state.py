@@ -752,3 +752,296 @@ def test_serializable_state_path_schema_and_json() -> None:
     schema_json = json.loads(schema)
     assert "path" in schema_json["properties"]
     assert schema_json["properties"]["path"]["format"] == "path"
+
+
+def test_custom_initializer_calling_super_sets_subclass_fields() -> None:
+    class Base(State):
+        value: int
+
+    class Extended(Base):
+        extra: str
+
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(**kwargs)
+
+    instance = Extended(value=1, extra="extra")
+
+    assert instance.value == 1
+    assert instance.extra == "extra"
+    assert instance.updating(extra="updated").extra == "updated"
+
+    with raises(ValidationError) as exc:
+        Extended(value="invalid", extra="extra")
+
+    assert exc.value.path == (".value",)
+
+
+def test_default_factory_is_used_only_for_absent_values() -> None:
+    calls: list[int] = []
+
+    def factory() -> int:
+        calls.append(1)
+        return 0
+
+    class Example(State):
+        value: int = Default(default_factory=factory)
+
+    assert Example(value=1).value == 1
+    assert calls == []
+    assert Example().value == 0
+    assert calls == [1]
+
+
+def test_passthrough_values_are_not_copied() -> None:
+    class Nested(State):
+        value: int
+
+    class Example(State):
+        nested: Nested
+        optional: Nested | None = None
+        items: Sequence[int] = ()
+
+    nested = Nested(value=1)
+    items = (1, 2)
+    instance = Example(nested=nested, optional=nested, items=items)
+
+    assert instance.nested is nested
+    assert instance.optional is nested
+    assert instance.items == items
+    assert Example(nested={"value": 2}).nested == Nested(value=2)
+
+
+def test_numeric_union_keeps_conversion_order() -> None:
+    class Example(State):
+        value: float | int
+
+    assert isinstance(Example(value=1).value, float)
+    assert isinstance(Example(value=1.5).value, float)
+
+
+def test_trusted_skips_validation_and_applies_defaults() -> None:
+    class Nested(State):
+        value: int
+
+    class Example(State):
+        name: str
+        count: int = 0
+        tags: Sequence[str] = ()
+        labels: Set[str] = frozenset()
+        nested: Nested | None = None
+        children: Sequence[Nested] = ()
+        aliased: Annotated[str, Alias("other")] = ""
+
+    instance = Example.trusted(
+        name=42,
+        tags=["a", "b"],
+        labels=["x"],
+        other="alias",
+    )
+
+    assert instance.name == 42  # not validated
+    assert instance.count == 0
+    assert instance.tags == ("a", "b")
+    assert instance.labels == frozenset({"x"})
+    assert instance.nested is None
+    assert instance.aliased == "alias"
+
+    source = Example(
+        name="example",
+        nested=Nested(value=1),
+        children=(Nested(value=2), Nested(value=3)),
+    )
+    rebuilt = Example.trusted(**source.to_mapping())
+
+    assert rebuilt == source
+    assert isinstance(rebuilt.nested, Nested)
+    assert isinstance(rebuilt.children, tuple)
+    assert all(isinstance(child, Nested) for child in rebuilt.children)
+
+
+def test_hash_is_cached_and_consistent_with_equality() -> None:
+    class Nested(State):
+        value: int
+
+    class Example(State):
+        name: str
+        nested: Nested
+
+    instance = Example(name="example", nested=Nested(value=1))
+    equal = Example(name="example", nested=Nested(value=1))
+    different = Example(name="example", nested=Nested(value=2))
+
+    assert hash(instance) == hash(instance)
+    assert instance.__hash_cache__ == hash(instance)  # pyright: ignore[reportAttributeAccessIssue]
+    assert hash(instance) == hash(equal)
+    assert instance == equal
+    hash(different)
+    assert instance != different
+    assert instance == deepcopy(instance)
+    assert {instance: 1}[equal] == 1
+
+
+def test_unhashable_values_are_not_cached() -> None:
+    class Example(State):
+        value: Any
+
+    instance = Example(value=[1])
+    equal = Example(value=[1])
+
+    assert hash(instance) == hash(equal)
+    assert not hasattr(instance, "__hash_cache__")
+    assert instance == equal
+
+
+def test_recursive_mapping_converts_by_declared_types() -> None:
+    class Nested(State):
+        identifier: UUID
+        values: Sequence[int]
+
+    class Example(State):
+        identifier: UUID
+        created: datetime
+        nested: Nested
+        optional: Nested | None
+        items: Sequence[Nested]
+        tags: Set[str]
+        lookup: Mapping[str, Nested]
+        pair: tuple[int, Nested]
+        anything: Any
+        aliased: Annotated[str, Alias("other")] = "alias"
+
+    identifier = uuid4()
+    created = datetime.now()
+    nested = Nested(identifier=identifier, values=(1, 2))
+    instance = Example(
+        identifier=identifier,
+        created=created,
+        nested=nested,
+        optional=None,
+        items=(nested,),
+        tags={"tag"},
+        lookup={"key": nested},
+        pair=(1, nested),
+        anything=[nested],
+    )
+    nested_mapping = {"identifier": identifier, "values": [1, 2]}
+
+    mapping = instance.to_mapping()
+
+    assert mapping == {
+        "identifier": identifier,
+        "created": created,
+        "nested": nested_mapping,
+        "optional": None,
+        "items": [nested_mapping],
+        "tags": ["tag"],
+        "lookup": {"key": nested_mapping},
+        "pair": [1, nested_mapping],
+        "anything": [nested_mapping],
+        "other": "alias",
+    }
+    assert mapping["identifier"] is identifier
+    assert mapping["created"] is created
+    assert Example.from_mapping(mapping) == instance
+
+
+def test_validate_many_returns_instances_in_order() -> None:
+    class Row(State):
+        identifier: int
+        name: Annotated[str, Alias("label")] = ""
+
+    existing = Row(identifier=0)
+    validated = Row.validate_many(
+        [
+            existing,
+            {"identifier": 1, "label": "one"},
+            {"identifier": 2, "label": "two"},
+            {"identifier": 3},
+        ]
+    )
+
+    assert validated == (
+        existing,
+        Row(identifier=1, name="one"),
+        Row(identifier=2, name="two"),
+        Row(identifier=3),
+    )
+    assert validated[0] is existing
+
+
+def test_validate_many_reports_all_failures_with_indices() -> None:
+    class Row(State):
+        identifier: int
+        name: Annotated[str, Alias("label")] = ""
+
+    with raises(ExceptionGroup) as exc:
+        Row.validate_many(
+            [
+                {"identifier": 1},
+                {"identifier": "invalid"},
+                {"identifier": 2, "unexpected": True},
+                {"identifier": 3, "name": "a", "label": "b"},
+                "invalid",
+            ]
+        )
+
+    errors = exc.value.exceptions
+    assert all(isinstance(error, ValidationError) for error in errors)
+    assert [error.path for error in errors] == [  # pyright: ignore[reportAttributeAccessIssue]
+        ("[1]", ".identifier"),
+        ("[2]",),
+        ("[3]",),
+        ("[4]",),
+    ]
+
+
+def test_equal_annotations_share_resolved_attributes() -> None:
+    class First(State):
+        values: Sequence[int | str]
+
+    class Second(State):
+        values: Sequence[int | str]
+
+    class Reversed(State):
+        values: Sequence[str | int]
+
+    assert First.__FIELDS__[0].annotation is Second.__FIELDS__[0].annotation
+    assert Reversed.__FIELDS__[0].annotation is not First.__FIELDS__[0].annotation
+
+
+class DeferredParent(State, deferred=True):
+    name: str
+    child: DeferredChild | None = None
+
+
+class DeferredChild(State, deferred=True):
+    value: int
+    parent: DeferredParent | None = None
+
+
+class DeferredDerived(DeferredChild):
+    label: str = "derived"
+
+
+def test_deferred_state_resolves_on_first_use() -> None:
+    # referencing classes defined later is possible as resolution happens on first use
+    instance = DeferredParent(name="parent", child={"value": 1})
+
+    assert instance.child == DeferredChild(value=1)
+    assert DeferredParent.__SERIALIZABLE__
+    assert [field.name for field in DeferredChild.__FIELDS__] == ["value", "parent"]
+    assert DeferredDerived.__DEFERRED__
+    assert DeferredDerived(value=2).label == "derived"
+    assert DeferredDerived(value=2).updating(value=3).value == 3
+
+    with raises(ValidationError) as exc:
+        DeferredChild(value=1, parent={"name": 42})
+    assert exc.value.path == (".parent", ".name")
+
+
+def test_deferred_state_reports_resolution_errors_on_first_use() -> None:
+    class Unresolved(State, deferred=True):
+        value: UndefinedType  # noqa: F821 # pyright: ignore[reportUndefinedVariable]
+
+    with raises(RuntimeError):
+        Unresolved(value=1)
@@ -17,7 +17,8 @@ from uuid import UUID, uuid4
 
 import pytest
 
-from haiway import MISSING, Missing, State, ValidationError
+from haiway import MISSING, Missing, State, ValidationContext, ValidationError
+from haiway.attributes.annotations import UnionAttribute
 
 
 class Color(Enum):
@@ -394,6 +395,29 @@ def test_nested_collection_validation() -> None:
     assert exc.value.path == (".payload", "[left]", "[inner]")
 
 
+def test_nested_failure_message_contains_full_path() -> None:
+    with pytest.raises(ValidationError) as exc:
+        NestedCollections(
+            matrix=[[1, 2], [3, "bad"]],
+            payload={"left": {"inner": 1}},
+        )
+    assert str(exc.value).startswith("Validation of .matrix[1][1] failed:")
+    assert isinstance(exc.value.cause, Exception)
+    assert exc.value.__cause__ is exc.value.cause
+
+
+def test_validation_context_scope_prefixes_path() -> None:
+    with pytest.raises(ValidationError) as exc:
+        with ValidationContext.scope(".outer"):
+            with ValidationContext.scope("[0]"):
+                raise ValueError("invalid")
+    assert exc.value.path == (".outer", "[0]")
+    assert isinstance(exc.value.cause, ValueError)
+
+    with ValidationContext.scope(".outer"):
+        pass  # successful validation leaves no trace
+
+
 def test_tuple_validation() -> None:
     instance = TupleState(fixed=["ok", 3, True], variable=[1, 2, 3])
     assert instance.fixed == ("ok", 3, True)
@@ -701,3 +725,56 @@ def test_validation_error_paths() -> None:
             },
         )
     assert exc.value.path == (".level1", ".nested", ".value")
+
+
+class CircleShape(State):
+    kind: Literal["circle"]
+    radius: float
+
+
+class SquareShape(State):
+    kind: Literal["square"]
+    side: float
+
+
+class ShapeHolder(State):
+    shape: CircleShape | SquareShape
+    optional: CircleShape | SquareShape | None = None
+
+
+def test_union_selects_alternative_by_literal_discriminator() -> None:
+    holder = ShapeHolder(
+        shape={"kind": "square", "side": 2},
+        optional={"kind": "circle", "radius": 1},
+    )
+    assert holder.shape == SquareShape(kind="square", side=2.0)
+    assert holder.optional == CircleShape(kind="circle", radius=1.0)
+
+    square = SquareShape(kind="square", side=1.0)
+    assert ShapeHolder(shape=square).shape is square
+    assert ShapeHolder(shape=square, optional=None).optional is None
+
+
+def test_union_dispatch_reports_all_alternatives_on_failure() -> None:
+    with pytest.raises(ValidationError) as exc:
+        ShapeHolder(shape={"kind": "square", "side": "wide"})
+    assert exc.value.path == (".shape",)
+    assert isinstance(exc.value.cause, ExceptionGroup)
+    assert len(exc.value.cause.exceptions) == 2
+
+    with pytest.raises(ValidationError) as exc:
+        ShapeHolder(shape={"kind": "triangle"})
+    assert exc.value.path == (".shape",)
+
+    with pytest.raises(ValidationError) as exc:
+        ShapeHolder(shape=42)
+    assert exc.value.path == (".shape",)
+
+
+def test_union_dispatch_is_not_declared_attribute() -> None:
+    ShapeHolder(shape={"kind": "square", "side": 2})
+    annotation = next(field.annotation for field in ShapeHolder.__FIELDS__ if field.name == "shape")
+    assert isinstance(annotation, UnionAttribute)
+    assert "__union_dispatch__" not in UnionAttribute.__ATTRIBUTES__
+    assert "__union_dispatch__" not in UnionAttribute.__match_args__
+    assert "dispatch" not in str(annotation)
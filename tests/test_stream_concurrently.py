@@ -4,7 +4,7 @@ from collections.abc import AsyncIterator
 from pytest import mark, raises
 
 from haiway import ctx
-from haiway.helpers.concurrent import stream_concurrently
+from haiway.helpers.concurrent import merge_streams, stream_concurrently
 
 
 class FakeException(Exception):
@@ -432,3 +432,124 @@ async def test_multiple_stream_concurrently_in_task_group():
 
     assert 1 in items_1 and 2 in items_1
     assert 1 in items_2 and 2 in items_2
+
+
+async def repeated(
+    element: str,
+    count: int,
+) -> AsyncIterator[str]:
+    for _ in range(count):
+        yield element
+
+
+@mark.asyncio
+async def test_merge_streams_merges_all_sources_when_exhaustive():
+    items: list[int] = [
+        item
+        async for item in merge_streams(
+            *(async_range(shard * 10, shard * 10 + shard) for shard in range(5)),
+            exhaustive=True,
+        )
+    ]
+
+    assert sorted(items) == [10, 20, 21, 30, 31, 32, 40, 41, 42, 43]
+
+
+@mark.asyncio
+async def test_merge_streams_stops_with_first_exhausted_source():
+    items: list[int] = [
+        item
+        async for item in merge_streams(
+            async_range(0, 2),
+            async_range(10, 100, delay=0.01),
+            async_range(100, 200, delay=0.01),
+        )
+    ]
+
+    assert items[:2] == [0, 1]
+    assert len(items) < 10
+
+
+@mark.asyncio
+async def test_merge_streams_first_ready_keeps_production_order():
+    items: list[str] = [
+        item
+        async for item in merge_streams(
+            repeated("a", 4),
+            repeated("b", 4),
+            repeated("c", 4),
+            exhaustive=True,
+            source_buffer=4,
+        )
+    ]
+
+    assert "".join(items) == "aaaabbbbcccc"
+
+
+@mark.asyncio
+async def test_merge_streams_round_robin_alternates_sources():
+    items: list[str] = [
+        item
+        async for item in merge_streams(
+            repeated("a", 4),
+            repeated("b", 4),
+            repeated("c", 4),
+            exhaustive=True,
+            fairness="round_robin",
+            source_buffer=4,
+        )
+    ]
+
+    assert "".join(items) == "abcabcabcabc"
+
+
+@mark.asyncio
+async def test_merge_streams_limits_buffered_elements_of_each_source():
+    pulled: list[int] = []
+
+    async def source() -> AsyncIterator[int]:
+        for element in range(1_000):
+            pulled.append(element)
+            yield element
+
+    merged = merge_streams(source(), async_range(0, 1_000, delay=1), source_buffer=2)
+    assert await anext(merged) == 0
+    await sleep(0.01)
+    assert len(pulled) == 3  # taken element and two buffered
+    await merged.aclose()
+
+
+@mark.asyncio
+async def test_merge_streams_propagates_source_exception():
+    async def failing() -> AsyncIterator[int]:
+        yield 1
+        raise FakeException("Source failed")
+
+    items: list[int] = []
+    with raises(FakeException, match="Source failed"):
+        async for item in merge_streams(failing(), async_range(10, 20, delay=0.01)):
+            items.append(item)
+
+    assert 1 in items
+
+
+@mark.asyncio
+async def test_merge_streams_close_cancels_all_producers():
+    cancelled: list[int] = []
+
+    async def tracked(
+        shard: int,
+    ) -> AsyncIterator[int]:
+        try:
+            await sleep(10)
+            yield shard
+
+        except CancelledError:
+            cancelled.append(shard)
+            raise
+
+    merged = merge_streams(async_range(0, 10), *(tracked(shard) for shard in range(3)))
+    assert await anext(merged) == 0
+    await merged.aclose()
+    await sleep(0)
+    assert sorted(cancelled) == [0, 1, 2]